@@ -57,6 +57,9 @@ setup(
         # No external dependencies - pure Python implementation
     ],
     extras_require={
+        "numpy": [
+            "numpy>=1.24.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
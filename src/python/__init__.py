@@ -20,6 +20,9 @@ Website: https://www.epiphanyengine.ai
 GitHub: https://github.com/TheUniversalAxiom/pointy-stick
 """
 
+import importlib
+from typing import Any
+
 from .benchmarking import (
     AxiomBenchmarkMode,
     AxiomBenchmarkModeStats,
@@ -34,7 +37,41 @@ from .benchmarking import (
     BenchmarkRunConfig,
 )
 from .math_solutions import ErdosProblem, MathSolutions, ProofStep
-from .universal_axiom import UniversalAxiom
+from .universal_axiom import UniversalAxiom, compute_coherence
+
+# NumPy-backed modules are imported on first attribute access, so that
+# ``import python`` stays as light as the core axiom
+_LAZY_MODULES = {
+    "batch": (
+        "BatchResult",
+        "GradientResult",
+        "compute_coherence_batch",
+        "compute_gradient_batch",
+        "compute_intelligence_batch",
+    ),
+    "cache": ("CacheStats", "EvaluationCache"),
+    "ensemble": ("AxiomEnsemble", "ResolutionResult"),
+    "events": ("EventKind", "EventRunResult", "EventSimulator"),
+    "export": ("batch_columns", "history_columns", "load_arrow", "load_npz", "to_arrow", "to_npz"),
+    "grid": ("SeparableGrid",),
+    "history_store": ("MappedHistory",),
+    "inverse": ("InverseResult", "solve_for_batch"),
+    "montecarlo": (
+        "Discrete",
+        "LogNormal",
+        "MonteCarloResult",
+        "MonteCarloStudy",
+        "Normal",
+        "SampleSummary",
+        "Triangular",
+        "Uniform",
+    ),
+    "plan": ("OperationPlan", "PlanResult", "compile_plan"),
+    "search": ("MonotoneSearch", "SearchResult"),
+    "sensitivity": ("SobolAnalysis", "SobolResult"),
+    "sweep": ("ParameterSweep", "SweepReduction", "SweepResult"),
+}
+_LAZY_EXPORTS = {name: module for module, names in _LAZY_MODULES.items() for name in names}
 
 __version__ = "0.1.0"
 __author__ = "Matt Belanger"
@@ -49,11 +86,65 @@ __all__ = [
     "AxiomBenchmarkRunner",
     "AxiomBenchmarkScenario",
     "AxiomBenchmarkSummary",
+    "AxiomEnsemble",
     "AxiomScenarioSource",
     "AxiomSignals",
+    "BatchResult",
     "BenchmarkRunConfig",
+    "CacheStats",
+    "Discrete",
     "ErdosProblem",
+    "EventKind",
+    "EventRunResult",
+    "EventSimulator",
+    "EvaluationCache",
+    "GradientResult",
+    "InverseResult",
+    "LogNormal",
+    "MappedHistory",
     "MathSolutions",
+    "MonteCarloResult",
+    "MonteCarloStudy",
+    "MonotoneSearch",
+    "Normal",
+    "OperationPlan",
+    "ParameterSweep",
+    "PlanResult",
     "ProofStep",
+    "ResolutionResult",
+    "SampleSummary",
+    "SearchResult",
+    "SeparableGrid",
+    "SobolAnalysis",
+    "SobolResult",
+    "SweepReduction",
+    "SweepResult",
+    "Triangular",
+    "Uniform",
     "UniversalAxiom",
+    "batch_columns",
+    "compile_plan",
+    "compute_coherence",
+    "compute_coherence_batch",
+    "compute_gradient_batch",
+    "compute_intelligence_batch",
+    "history_columns",
+    "load_arrow",
+    "load_npz",
+    "solve_for_batch",
+    "to_arrow",
+    "to_npz",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,277 @@
+"""
+Batch evaluation for The Universal Axiom.
+
+Evaluates Intelligence_n = E_n · (1 + F_n) · X · Y · Z · (A · B · C) over
+equal-length columns in a single pass. NumPy is used when it is installed;
+otherwise results are built with the standard library ``array`` module.
+Both backends reproduce the scalar ``UniversalAxiom.compute_intelligence()``
+results bit for bit, including the clamping of n to [1, MAX_N].
+
+``compute_gradient_batch`` also returns the closed-form partial derivatives
+with respect to the six continuous variables (n is discrete).
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from numbers import Real
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+from .universal_axiom import MAX_N, MAX_SAFE_VALUE, compute_coherence, dynamic_table
+
+np: Any  # the numpy module, or None when it is not installed
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+GRADIENT_VARIABLES = ("impulses", "elements", "pressure", "subjectivity", "purpose", "time")
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Intelligence values and per-row saturation flags for a batch."""
+
+    intelligence: Any
+    saturated: Any
+
+    def __len__(self) -> int:
+        return len(self.intelligence)
+
+    def saturated_rows(self) -> List[int]:
+        """Indices of rows whose dynamic layer hit MAX_SAFE_VALUE."""
+        return [index for index, flag in enumerate(self.saturated) if flag]
+
+
+@dataclass(frozen=True)
+class GradientResult(BatchResult):
+    """Batch intelligence values with per-variable partial derivatives."""
+
+    partials: Dict[str, Any]
+
+    def jacobian(self) -> Any:
+        """Rows of d(intelligence)/d(variable), in GRADIENT_VARIABLES order."""
+        columns = [self.partials[name] for name in GRADIENT_VARIABLES]
+        if np is not None:
+            return np.column_stack(columns)
+        return list(zip(*columns))
+
+
+def clamp_step(n: float) -> int:
+    """Clamp an iteration step to [1, MAX_N] exactly like DynamicLayer."""
+    return max(1, min(MAX_N, int(n)))
+
+
+@lru_cache(maxsize=8, typed=True)
+def _dynamic_array(base_exponential: float) -> Any:
+    """NumPy view of the shared dynamic product table for a base."""
+    return np.asarray(dynamic_table(base_exponential).product, dtype=np.float64)
+
+
+def _column_length(columns: Sequence[Any]) -> int:
+    """Validate that all non-scalar columns share one length."""
+    length = None
+    for column in columns:
+        if isinstance(column, Real):
+            continue
+        size = len(column)
+        if length is None:
+            length = size
+        elif size != length:
+            raise ValueError(f"Batch columns must have equal length (got {length} and {size})")
+    return 1 if length is None else length
+
+
+def _expand(column: Union[Real, Sequence[Any]], length: int) -> Sequence[Any]:
+    """Repeat a scalar to the batch length; pass sequences through."""
+    if isinstance(column, Real):
+        return [column] * length
+    return column
+
+
+def _numpy_columns(columns: Sequence[Any]) -> Tuple[Any, ...]:
+    """Convert columns to broadcast float64 arrays."""
+    _column_length(columns)
+    arrays = [np.atleast_1d(np.asarray(column, dtype=np.float64)) for column in columns]
+    return tuple(np.broadcast_arrays(*arrays))
+
+
+def _numpy_steps(n: Any) -> Any:
+    """Clamp an n column to [1, MAX_N] with int() truncation semantics."""
+    steps = np.asarray(n)
+    if steps.dtype.kind in "fc":
+        invalid = ~np.isfinite(steps)
+        if invalid.any():
+            # Raise the scalar int() error: ValueError for NaN, OverflowError for inf
+            clamp_step(steps[invalid].flat[0])
+    return np.clip(steps, 1, MAX_N).astype(np.intp)
+
+
+def compute_intelligence_batch(
+    impulses: Any,
+    elements: Any,
+    pressure: Any,
+    subjectivity: Any,
+    purpose: Any,
+    time: Any,
+    n: Any,
+    base_exponential: float = 3.0,
+) -> BatchResult:
+    """
+    Compute intelligence for every row of equal-length input columns.
+
+    Scalars are broadcast across the batch. Each row matches
+    ``UniversalAxiom(...).compute_intelligence()`` exactly.
+
+    Args:
+        impulses: A column
+        elements: B column
+        pressure: C column
+        subjectivity: X column (objectivity is 1 - X)
+        purpose: Y column
+        time: Z column
+        n: Iteration steps (clamped to [1, MAX_N])
+        base_exponential: Base for exponential growth (default: 3.0)
+
+    Returns:
+        BatchResult: NumPy arrays when available, otherwise ``array('d')``
+        values with an ``array('b')`` saturation mask
+    """
+    columns = (impulses, elements, pressure, subjectivity, purpose, time, n)
+
+    if np is not None:
+        A, B, C, X, Y, Z, steps = _numpy_columns(columns)
+        dynamic = _dynamic_array(base_exponential)[_numpy_steps(steps)]
+        foundation = A * B * C
+        cognitive = (1 - X) * Y * Z
+        intelligence = dynamic * cognitive * foundation
+        return BatchResult(intelligence=intelligence, saturated=dynamic >= MAX_SAFE_VALUE)
+
+    length = _column_length(columns)
+    product = dynamic_table(base_exponential).product
+    intelligence = array("d", bytes(8 * length))
+    saturated = array("b", bytes(length))
+
+    rows = zip(*(_expand(column, length) for column in columns))
+    for index, (a, b, c, x, y, z, k) in enumerate(rows):
+        dynamic = product[clamp_step(k)]
+        intelligence[index] = dynamic * ((1 - x) * y * z) * (a * b * c)
+        saturated[index] = dynamic >= MAX_SAFE_VALUE
+
+    return BatchResult(intelligence=intelligence, saturated=saturated)
+
+
+def compute_coherence_batch(pressure: Any, subjectivity: Any, purpose: Any) -> Any:
+    """
+    Compute the AxiomSimulator coherence metric for every row.
+
+    Scalars are broadcast across the batch. Each row matches
+    ``compute_coherence`` (and ``get_coherence_metric()``) exactly.
+
+    Args:
+        pressure: C column
+        subjectivity: X column
+        purpose: Y column
+
+    Returns:
+        Coherence values (NumPy array or ``array('d')``)
+    """
+    columns = (pressure, subjectivity, purpose)
+    if np is not None:
+        C, X, Y = _numpy_columns(columns)
+        return ((1 - X) + np.minimum(Y / 2.0, 1.0) + 1.0 / (1.0 + np.abs(C - 1.0))) / 3.0
+
+    length = _column_length(columns)
+    return array(
+        "d",
+        (
+            compute_coherence(c, x, y)
+            for c, x, y in zip(*(_expand(column, length) for column in columns))
+        ),
+    )
+
+
+def compute_gradient_batch(
+    impulses: Any,
+    elements: Any,
+    pressure: Any,
+    subjectivity: Any,
+    purpose: Any,
+    time: Any,
+    n: Any,
+    base_exponential: float = 3.0,
+) -> GradientResult:
+    """
+    Compute intelligence and its gradient for every row in one pass.
+
+    The partials are the closed forms of D · ((1 - X) · Y · Z) · (A · B · C),
+    built from products of the other factors (never by dividing the value),
+    so rows with zero inputs still get exact derivatives. The subjectivity
+    partial carries the minus sign of the ``1 - X`` term. Saturated rows use
+    the capped dynamic value that the intelligence itself uses, so their
+    gradients describe the clamped function; check ``saturated`` before
+    treating them as growth sensitivities.
+
+    Args:
+        impulses: A column
+        elements: B column
+        pressure: C column
+        subjectivity: X column (objectivity is 1 - X)
+        purpose: Y column
+        time: Z column
+        n: Iteration steps (clamped to [1, MAX_N])
+        base_exponential: Base for exponential growth (default: 3.0)
+
+    Returns:
+        GradientResult: intelligence identical to compute_intelligence_batch,
+        the saturation mask and one partial-derivative column per variable
+    """
+    columns = (impulses, elements, pressure, subjectivity, purpose, time, n)
+
+    if np is not None:
+        A, B, C, X, Y, Z, steps = _numpy_columns(columns)
+        dynamic = _dynamic_array(base_exponential)[_numpy_steps(steps)]
+        foundation = A * B * C
+        objectivity = 1 - X
+        cognitive = objectivity * Y * Z
+        dynamic_cognitive = dynamic * cognitive
+        dynamic_foundation = dynamic * foundation
+        partials = {
+            "impulses": dynamic_cognitive * (B * C),
+            "elements": dynamic_cognitive * (A * C),
+            "pressure": dynamic_cognitive * (A * B),
+            "subjectivity": -(dynamic_foundation * (Y * Z)),
+            "purpose": dynamic_foundation * (objectivity * Z),
+            "time": dynamic_foundation * (objectivity * Y),
+        }
+        return GradientResult(
+            intelligence=dynamic_cognitive * foundation,
+            saturated=dynamic >= MAX_SAFE_VALUE,
+            partials=partials,
+        )
+
+    length = _column_length(columns)
+    product = dynamic_table(base_exponential).product
+    intelligence = array("d", bytes(8 * length))
+    saturated = array("b", bytes(length))
+    partials = {name: array("d", bytes(8 * length)) for name in GRADIENT_VARIABLES}
+    d_a, d_b, d_c, d_x, d_y, d_z = (partials[name] for name in GRADIENT_VARIABLES)
+
+    rows = zip(*(_expand(column, length) for column in columns))
+    for index, (a, b, c, x, y, z, k) in enumerate(rows):
+        dynamic = product[clamp_step(k)]
+        objectivity = 1 - x
+        dynamic_cognitive = dynamic * (objectivity * y * z)
+        dynamic_foundation = dynamic * (a * b * c)
+        intelligence[index] = dynamic_cognitive * (a * b * c)
+        saturated[index] = dynamic >= MAX_SAFE_VALUE
+        d_a[index] = dynamic_cognitive * (b * c)
+        d_b[index] = dynamic_cognitive * (a * c)
+        d_c[index] = dynamic_cognitive * (a * b)
+        d_x[index] = -(dynamic_foundation * (y * z))
+        d_y[index] = dynamic_foundation * (objectivity * z)
+        d_z[index] = dynamic_foundation * (objectivity * y)
+
+    return GradientResult(intelligence=intelligence, saturated=saturated, partials=partials)
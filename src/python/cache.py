@@ -0,0 +1,170 @@
+"""
+Memoizing evaluation cache for The Universal Axiom.
+
+Repeated (A, B, C, X, Y, Z, n) tuples are answered from a bounded LRU instead
+of rebuilding a ``UniversalAxiom``. Inputs can optionally be quantized to a
+grid step, so nearby tuples share an entry. Values are then computed at the
+quantized point, which keeps cached results independent of request order.
+The cache is safe to share between threads and counts hits, misses and
+evictions for sizing. Every miss inserts one entry, so the counters always
+satisfy ``evictions == misses - size`` (until ``clear()``).
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional, Tuple
+
+from .batch import clamp_step
+from .universal_axiom import UniversalAxiom, compute_coherence
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of an EvaluationCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class EvaluationCache:
+    """Thread-safe LRU cache for intelligence and coherence evaluations."""
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        quantum: Optional[float] = None,
+        base_exponential: float = 3.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached evaluations
+            quantum: Optional grid step for A, B, C, X, Y and Z (None = exact keys)
+            base_exponential: Base for exponential growth of evaluated axioms
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if quantum is not None and not quantum > 0:
+            raise ValueError("quantum must be positive")
+        self.maxsize = maxsize
+        self.quantum = quantum
+        self.base_exponential = base_exponential
+        self._entries: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _point(self, values: Tuple[float, ...], n: int) -> Tuple[Tuple[float, ...], int]:
+        """Quantized inputs and clamped n, as used for both key and evaluation."""
+        if self.quantum is not None:
+            values = tuple(
+                round(value / self.quantum) * self.quantum if math.isfinite(value) else value
+                for value in values
+            )
+        return values, clamp_step(n)
+
+    def _lookup(self, key: Hashable, evaluate: Callable[[], float]) -> float:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+
+        # Evaluated outside the lock; concurrent misses on one key both compute,
+        # and the ones that find it inserted by then count as hits
+        value = evaluate()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return value
+
+    def _axiom(self, values: Tuple[float, ...], n: int) -> UniversalAxiom:
+        impulses, elements, pressure, subjectivity, purpose, time = values
+        axiom = UniversalAxiom(impulses, elements, pressure, subjectivity, purpose, time, n)
+        if self.base_exponential != axiom.dynamic.base_exponential:
+            axiom.dynamic.base_exponential = self.base_exponential
+        return axiom
+
+    def compute_intelligence(
+        self,
+        impulses: float = 1.0,
+        elements: float = 1.0,
+        pressure: float = 1.0,
+        subjectivity: float = 0.0,
+        purpose: float = 1.0,
+        time: float = 1.0,
+        n: int = 1,
+    ) -> float:
+        """Cached ``UniversalAxiom(...).compute_intelligence()``."""
+        values, n = self._point((impulses, elements, pressure, subjectivity, purpose, time), n)
+        return self._lookup(
+            ("intelligence", values, n),
+            lambda: self._axiom(values, n).compute_intelligence(),
+        )
+
+    def get_coherence_metric(
+        self,
+        impulses: float = 1.0,
+        elements: float = 1.0,
+        pressure: float = 1.0,
+        subjectivity: float = 0.0,
+        purpose: float = 1.0,
+        time: float = 1.0,
+        n: int = 1,
+    ) -> float:
+        """
+        Cached ``AxiomSimulator(UniversalAxiom(...)).get_coherence_metric()``.
+
+        Coherence only depends on pressure, subjectivity and purpose, so the
+        entry is keyed on those three.
+        """
+        (pressure, subjectivity, purpose), _ = self._point((pressure, subjectivity, purpose), n)
+        return self._lookup(
+            ("coherence", pressure, subjectivity, purpose),
+            lambda: compute_coherence(pressure, subjectivity, purpose),
+        )
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the hit, miss and eviction counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,216 @@
+"""
+Binary checkpoints for UniversalAxiom and AxiomSimulator.
+
+Layout (little-endian, version 1):
+
+- header: magic ``b"UAXC"``, format version (uint16), kind (uint8: 1 = axiom,
+  2 = simulator)
+- axiom: A, B, C, X, Y, Z as float64, the unclamped step count as int64,
+  then the kind of base_exponential (uint8: 0 = float, 1 = int) and its
+  value as float64 or int64
+- simulator only: history capacity (int64, -1 = unbounded ColumnarHistory,
+  -2 = list of dictionaries) and state count (int64), then each HISTORY_COLUMNS column in chronological order as raw
+  8-byte values
+
+Floats are stored as raw IEEE-754 doubles and an int base stays an int, so a
+save/load round trip is bit exact, and history columns are restored with a
+single ``frombytes`` per column.
+
+Only the state is recorded, not the Python types around it: checkpoints
+restore a plain UniversalAxiom, or a plain AxiomSimulator whose history is
+a list of dictionaries again when it was one, and an in-memory
+ColumnarHistory otherwise. Subclasses are not preserved, and the states of
+a MappedHistory are copied into the checkpoint rather than reopened from
+their file.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Optional, Type, TypeVar, Union, overload
+
+from .universal_axiom import HISTORY_COLUMNS, AxiomSimulator, ColumnarHistory, UniversalAxiom
+
+MAGIC = b"UAXC"
+VERSION = 1
+
+KIND_AXIOM = 1
+KIND_SIMULATOR = 2
+
+HEADER = struct.Struct("<4sHB")
+AXIOM_RECORD = struct.Struct("<6dqB")
+
+# base_exponential after its kind byte in AXIOM_RECORD
+BASE_FLOAT = 0
+BASE_INT = 1
+BASE_VALUES = (struct.Struct("<d"), struct.Struct("<q"))
+BASE_SIZE = 8
+HISTORY_HEADER = struct.Struct("<qq")
+UNBOUNDED = -1
+LIST_HISTORY = -2
+
+Target = Union[str, "os.PathLike[str]", BinaryIO]
+Data = Union[bytes, bytearray, memoryview]
+Checkpointed = Union[UniversalAxiom, AxiomSimulator]
+Restored = TypeVar("Restored", UniversalAxiom, AxiomSimulator)
+
+
+def _pack_axiom(axiom: UniversalAxiom) -> bytes:
+    foundation = axiom._foundation
+    dynamic = axiom._dynamic
+    cognitive = axiom._cognitive
+    base_exponential = dynamic.base_exponential
+    if type(base_exponential) is int:
+        kind = BASE_INT
+    elif isinstance(base_exponential, float):
+        kind = BASE_FLOAT
+    else:
+        raise TypeError(f"Cannot checkpoint a {type(base_exponential).__name__} base_exponential")
+    try:
+        base = BASE_VALUES[kind].pack(base_exponential)
+    except struct.error as error:
+        raise ValueError(f"base_exponential {base_exponential} does not fit in int64") from error
+    record = AXIOM_RECORD.pack(
+        foundation.impulses,
+        foundation.elements,
+        foundation.pressure,
+        cognitive.subjectivity,
+        cognitive.purpose,
+        cognitive.time,
+        dynamic.steps,
+        kind,
+    )
+    return record + base
+
+
+def _unpack_axiom(buffer: memoryview, offset: int) -> UniversalAxiom:
+    A, B, C, X, Y, Z, steps, kind = AXIOM_RECORD.unpack_from(buffer, offset)
+    if kind not in (BASE_FLOAT, BASE_INT):
+        raise ValueError(f"Unknown base_exponential kind {kind}")
+    (base_exponential,) = BASE_VALUES[kind].unpack_from(buffer, offset + AXIOM_RECORD.size)
+    axiom = UniversalAxiom(A, B, C, X, Y, Z, n=steps)
+    axiom._dynamic.base_exponential = base_exponential
+    return axiom
+
+
+def _little_endian(column: array) -> bytes:
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def dumps(obj: Checkpointed) -> bytes:
+    """Serialize an axiom or simulator to checkpoint bytes."""
+    if isinstance(obj, AxiomSimulator):
+        history = obj.history
+        if isinstance(history, list):
+            capacity = LIST_HISTORY
+            history = ColumnarHistory.from_dicts(history)
+        else:
+            capacity = UNBOUNDED if history.capacity is None else history.capacity
+        parts = [
+            HEADER.pack(MAGIC, VERSION, KIND_SIMULATOR),
+            _pack_axiom(obj.axiom),
+            HISTORY_HEADER.pack(capacity, len(history)),
+        ]
+        parts.extend(_little_endian(column) for column in history.to_arrays().values())
+        return b"".join(parts)
+    if isinstance(obj, UniversalAxiom):
+        return HEADER.pack(MAGIC, VERSION, KIND_AXIOM) + _pack_axiom(obj)
+    raise TypeError(f"Cannot checkpoint {type(obj).__name__}")
+
+
+@overload
+def loads(data: Data, expected: Type[Restored]) -> Restored: ...
+
+
+@overload
+def loads(data: Data, expected: None = None) -> Checkpointed: ...
+
+
+def loads(data: Data, expected: Optional[type] = None) -> Checkpointed:
+    """
+    Restore an axiom or simulator from checkpoint bytes.
+
+    Simulators come back as a plain AxiomSimulator whatever their class,
+    with a list history if they had one and an in-memory ColumnarHistory
+    otherwise.
+
+    Args:
+        data: Checkpoint contents
+        expected: Optional class the checkpoint must contain
+
+    Returns:
+        The restored UniversalAxiom or AxiomSimulator
+    """
+    buffer = memoryview(data)
+    try:
+        magic, version, kind = HEADER.unpack_from(buffer, 0)
+    except struct.error as error:
+        raise ValueError("Truncated checkpoint") from error
+    if magic != MAGIC:
+        raise ValueError("Not a Universal Axiom checkpoint")
+    if version != VERSION:
+        raise ValueError(f"Unsupported checkpoint version {version}")
+    if kind not in (KIND_AXIOM, KIND_SIMULATOR):
+        raise ValueError(f"Unknown checkpoint kind {kind}")
+
+    offset = HEADER.size
+    try:
+        axiom = _unpack_axiom(buffer, offset)
+        offset += AXIOM_RECORD.size + BASE_SIZE
+        result: Checkpointed = axiom
+        if kind == KIND_SIMULATOR:
+            capacity, size = HISTORY_HEADER.unpack_from(buffer, offset)
+            offset += HISTORY_HEADER.size
+            arrays = {}
+            for name, typecode in HISTORY_COLUMNS:
+                column = array(typecode)
+                end = offset + size * column.itemsize
+                if end > len(buffer):
+                    raise ValueError("Truncated checkpoint")
+                column.frombytes(buffer[offset:end])
+                if sys.byteorder == "big":
+                    column.byteswap()
+                arrays[name] = column
+                offset = end
+            simulator = AxiomSimulator(axiom)
+            history = ColumnarHistory.from_arrays(arrays, None if capacity < 0 else capacity)
+            simulator.history = history.to_dicts() if capacity == LIST_HISTORY else history
+            result = simulator
+    except struct.error as error:
+        raise ValueError("Truncated checkpoint") from error
+
+    if expected is not None and not isinstance(result, expected):
+        raise ValueError(f"Checkpoint holds a {type(result).__name__}, not {expected.__name__}")
+    return result
+
+
+def save(obj: Checkpointed, target: Target) -> None:
+    """Write a checkpoint to a path or a binary file object."""
+    data = dumps(obj)
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as handle:
+            handle.write(data)
+    else:
+        target.write(data)
+
+
+@overload
+def load(source: Target, expected: Type[Restored]) -> Restored: ...
+
+
+@overload
+def load(source: Target, expected: None = None) -> Checkpointed: ...
+
+
+def load(source: Target, expected: Optional[type] = None) -> Checkpointed:
+    """Read a checkpoint from a path or a binary file object."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as handle:
+            return loads(handle.read(), expected)
+    return loads(source.read(), expected)
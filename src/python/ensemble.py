@@ -0,0 +1,402 @@
+"""
+Ensemble simulation for The Universal Axiom.
+
+Holds N agents as struct-of-arrays (one column per axiom variable) and applies
+evolve, apply_pressure, adjust_subjectivity and strengthen_purpose to all of
+them, or to a masked subset, in one vectorized step. The clamping rules match
+UniversalAxiom exactly:
+
+- pressure never goes below 0.01
+- subjectivity stays within [0.0, 1.0]
+- purpose never goes below 0.01
+
+``simulate_contradiction_resolution`` runs the contradiction schedule of
+AxiomSimulator for every agent at once, with per-agent spike sizes and step
+counts, and records intelligence and coherence after every step.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from numbers import Real
+from typing import Any, Iterable, List, Optional
+
+from .batch import (
+    _column_length,
+    _expand,
+    compute_coherence_batch,
+    compute_intelligence_batch,
+    np,
+)
+from .universal_axiom import UniversalAxiom
+
+# Update rules shared by both backends. NumPy's fmax/fmin ignore NaN the same
+# way Python's max(0.01, nan) does, so clamping matches UniversalAxiom.
+
+
+def _advance(value: Any, delta: Any) -> Any:
+    return value + delta
+
+
+def _clamp_pressure(pressure: Any, delta: Any) -> Any:
+    if np is not None:
+        return np.fmax(pressure + delta, 0.01)
+    return max(0.01, pressure + delta)
+
+
+def _clamp_subjectivity(subjectivity: Any, delta: Any) -> Any:
+    if np is not None:
+        return np.fmax(np.fmin(subjectivity + delta, 1.0), 0.0)
+    return max(0.0, min(1.0, subjectivity + delta))
+
+
+def _scale_purpose(purpose: Any, multiplier: Any) -> Any:
+    if np is not None:
+        return np.fmax(purpose * multiplier, 0.01)
+    return max(0.01, purpose * multiplier)
+
+
+@dataclass(frozen=True)
+class ResolutionResult:
+    """
+    Per-step outputs of a batched contradiction resolution.
+
+    Row 0 is the initial state, row 1 the state after the pressure spike and
+    row k + 1 the state after resolution step k. Agents with fewer steps keep
+    their final state in the remaining rows.
+    """
+
+    intelligence: Any
+    coherence: Any
+    resolution_steps: Any
+
+    @property
+    def final_intelligence(self) -> Any:
+        return self.intelligence[-1]
+
+    @property
+    def final_coherence(self) -> Any:
+        return self.coherence[-1]
+
+
+class AxiomEnsemble:
+    """Population of axioms evolved in lockstep"""
+
+    # Per-agent columns: NumPy arrays, or array('d') / array('q') without NumPy
+    impulses: Any
+    elements: Any
+    pressure: Any
+    subjectivity: Any
+    purpose: Any
+    time: Any
+    steps: Any
+
+    def __init__(
+        self,
+        impulses: Any = 1.0,
+        elements: Any = 1.0,
+        pressure: Any = 1.0,
+        subjectivity: Any = 0.0,
+        purpose: Any = 1.0,
+        time: Any = 1.0,
+        n: Any = 1,
+        size: Optional[int] = None,
+        base_exponential: float = 3.0,
+    ):
+        """
+        Initialize the ensemble from per-agent columns.
+
+        Scalars are broadcast to every agent. When all inputs are scalars,
+        ``size`` sets the number of agents.
+
+        Args:
+            impulses: A column
+            elements: B column
+            pressure: C column
+            subjectivity: X column
+            purpose: Y column
+            time: Z column
+            n: Iteration steps (values below 1 are raised to 1)
+            size: Number of agents when every column is a scalar
+            base_exponential: Base for exponential growth
+        """
+        columns = (impulses, elements, pressure, subjectivity, purpose, time, n)
+        length = _column_length(columns)
+        if size is not None:
+            if any(not isinstance(column, Real) for column in columns) and size != length:
+                raise ValueError(f"size={size} does not match column length {length}")
+            length = size
+
+        self.base_exponential = base_exponential
+        self.size = length
+
+        self.impulses = self._float_column(impulses)
+        self.elements = self._float_column(elements)
+        self.pressure = self._float_column(pressure)
+        self.subjectivity = self._float_column(subjectivity)
+        self.purpose = self._float_column(purpose)
+        self.time = self._float_column(time)
+        # Unclamped step counts; n is clamped to [1, MAX_N] at evaluation
+        self.steps = self._step_column(n)
+
+    @classmethod
+    def from_axioms(cls, axioms: Iterable[UniversalAxiom]) -> "AxiomEnsemble":
+        """
+        Build an ensemble from existing axioms (their state is copied)
+
+        Every axiom must share one base_exponential, since the ensemble has a
+        single dynamic table.
+        """
+        axioms = list(axioms)
+        if not axioms:
+            raise ValueError("An ensemble needs at least one axiom")
+        bases = {axiom.dynamic.base_exponential for axiom in axioms}
+        if len(bases) > 1:
+            raise ValueError(f"Axioms have different base_exponential values: {sorted(bases)}")
+        return cls(
+            impulses=[axiom.foundation.impulses for axiom in axioms],
+            elements=[axiom.foundation.elements for axiom in axioms],
+            pressure=[axiom.foundation.pressure for axiom in axioms],
+            subjectivity=[axiom.cognitive.subjectivity for axiom in axioms],
+            purpose=[axiom.cognitive.purpose for axiom in axioms],
+            time=[axiom.cognitive.time for axiom in axioms],
+            n=[axiom.dynamic.steps for axiom in axioms],
+            base_exponential=axioms[0].dynamic.base_exponential,
+        )
+
+    def _float_column(self, column: Any) -> Any:
+        if np is not None:
+            return np.array(np.broadcast_to(np.asarray(column, dtype=np.float64), (self.size,)))
+        return array("d", _expand(column, self.size))
+
+    def _step_column(self, column: Any) -> Any:
+        if np is not None:
+            steps = np.broadcast_to(np.asarray(column), (self.size,))
+            return np.maximum(1, steps.astype(np.int64))
+        return array("q", (max(1, int(value)) for value in _expand(column, self.size)))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def axiom(self, index: int) -> UniversalAxiom:
+        """Materialize a single agent as a UniversalAxiom"""
+        axiom = UniversalAxiom(
+            impulses=float(self.impulses[index]),
+            elements=float(self.elements[index]),
+            pressure=float(self.pressure[index]),
+            subjectivity=float(self.subjectivity[index]),
+            purpose=float(self.purpose[index]),
+            time=float(self.time[index]),
+            n=int(self.steps[index]),
+        )
+        if self.base_exponential != axiom.dynamic.base_exponential:
+            axiom.dynamic.base_exponential = self.base_exponential
+        return axiom
+
+    def to_axioms(self) -> List[UniversalAxiom]:
+        """Materialize every agent as a UniversalAxiom"""
+        return [self.axiom(index) for index in range(self.size)]
+
+    def compute_intelligence(self) -> Any:
+        """
+        Compute intelligence for every agent
+
+        Returns:
+            Array of intelligence values (NumPy or ``array('d')``)
+        """
+        return compute_intelligence_batch(
+            self.impulses,
+            self.elements,
+            self.pressure,
+            self.subjectivity,
+            self.purpose,
+            self.time,
+            self.steps,
+            base_exponential=self.base_exponential,
+        ).intelligence
+
+    def evolve(self, delta_time: Any = 1.0, mask: Any = None) -> None:
+        """
+        Evolve agents forward one step
+
+        Args:
+            delta_time: Time step increment (scalar or per agent)
+            mask: Optional boolean selection of agents to evolve
+        """
+        self.steps = self._apply(self.steps, 1, mask, _advance)
+        self.time = self._apply(self.time, delta_time, mask, _advance)
+
+    def evolve_by(self, steps: int, delta_time: Any = 1.0, mask: Any = None) -> None:
+        """
+        Evolve agents forward by several steps at once
+
+        Equivalent to calling evolve(delta_time, mask) steps times. The step
+        counts are advanced in one update, and time is accumulated step by
+        step so that it rounds the same way.
+
+        Args:
+            steps: Number of evolution steps (>= 0)
+            delta_time: Time step increment (scalar or per agent)
+            mask: Optional boolean selection of agents to evolve
+        """
+        if steps < 0:
+            raise ValueError("steps must be non-negative")
+        if not steps:
+            return
+        self.steps = self._apply(self.steps, steps, mask, _advance)
+        for _ in range(steps):
+            self.time = self._apply(self.time, delta_time, mask, _advance)
+
+    def apply_pressure(self, pressure_delta: Any, mask: Any = None) -> None:
+        """
+        Apply a pressure change, keeping pressure >= 0.01
+
+        Args:
+            pressure_delta: Change in pressure (scalar or per agent)
+            mask: Optional boolean selection of agents
+        """
+        self.pressure = self._apply(self.pressure, pressure_delta, mask, _clamp_pressure)
+
+    def adjust_subjectivity(self, subjectivity_delta: Any, mask: Any = None) -> None:
+        """
+        Adjust subjectivity, keeping it within [0.0, 1.0]
+
+        Args:
+            subjectivity_delta: Change in subjectivity (scalar or per agent)
+            mask: Optional boolean selection of agents
+        """
+        self.subjectivity = self._apply(
+            self.subjectivity, subjectivity_delta, mask, _clamp_subjectivity
+        )
+
+    def strengthen_purpose(self, purpose_multiplier: Any, mask: Any = None) -> None:
+        """
+        Multiply purpose, keeping it >= 0.01
+
+        Args:
+            purpose_multiplier: Multiplier for purpose (scalar or per agent)
+            mask: Optional boolean selection of agents
+        """
+        self.purpose = self._apply(self.purpose, purpose_multiplier, mask, _scale_purpose)
+
+    def tile(self, count: int) -> "AxiomEnsemble":
+        """
+        Repeat the whole population ``count`` times (agent i of copy k is
+        agent ``k * size + i``), e.g. to cross agents with parameter sets
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1")
+        columns = [
+            self.impulses,
+            self.elements,
+            self.pressure,
+            self.subjectivity,
+            self.purpose,
+            self.time,
+            self.steps,
+        ]
+        if np is not None:
+            columns = [np.tile(column, count) for column in columns]
+        else:
+            columns = [column * count for column in columns]
+        impulses, elements, pressure, subjectivity, purpose, time, steps = columns
+        return AxiomEnsemble(
+            impulses,
+            elements,
+            pressure,
+            subjectivity,
+            purpose,
+            time,
+            steps,
+            base_exponential=self.base_exponential,
+        )
+
+    def coherence(self) -> Any:
+        """Coherence metric of AxiomSimulator for every agent"""
+        return compute_coherence_batch(self.pressure, self.subjectivity, self.purpose)
+
+    def simulate_contradiction_resolution(
+        self, initial_pressure: Any = 2.0, resolution_steps: Any = 5
+    ) -> ResolutionResult:
+        """
+        Run AxiomSimulator.simulate_contradiction_resolution for every agent
+
+        Each agent gets the same schedule as the scalar simulator: a pressure
+        spike, then per step a subjectivity reduction of 0.1, a pressure
+        release of initial_pressure / resolution_steps and an evolve. The
+        clamping is the same as for single axioms. Agents are updated in
+        place.
+
+        Args:
+            initial_pressure: Pressure spike (scalar or per agent)
+            resolution_steps: Resolution steps (scalar or per agent)
+
+        Returns:
+            ResolutionResult: (max steps + 2) x agents intelligence and
+            coherence matrices
+        """
+        if np is not None:
+            spike = np.broadcast_to(np.asarray(initial_pressure, dtype=np.float64), (self.size,))
+            steps = np.broadcast_to(np.asarray(resolution_steps), (self.size,)).astype(np.int64)
+            # Agents without steps never release pressure; avoid dividing by zero
+            release = -spike / np.maximum(steps, 1)
+            longest = int(steps.max(initial=0))
+            uniform = bool((steps == longest).all())
+            intelligence = np.empty((longest + 2, self.size))
+            coherence = np.empty((longest + 2, self.size))
+        else:
+            spike = array("d", _expand(initial_pressure, self.size))
+            steps = array("q", (int(value) for value in _expand(resolution_steps, self.size)))
+            if len(spike) != self.size or len(steps) != self.size:
+                raise ValueError(f"Expected {self.size} values per parameter")
+            release = array("d", (-p / k if k > 0 else 0.0 for p, k in zip(spike, steps)))
+            longest = max(steps, default=0)
+            uniform = all(value == longest for value in steps)
+            intelligence = [None] * (longest + 2)
+            coherence = [None] * (longest + 2)
+
+        def record(row: int) -> None:
+            intelligence[row] = self.compute_intelligence()
+            coherence[row] = self.coherence()
+
+        record(0)
+        self.apply_pressure(spike)
+        record(1)
+        for step in range(longest):
+            if uniform:
+                mask = None
+            elif np is not None:
+                mask = steps > step
+            else:
+                mask = [value > step for value in steps]
+            self.adjust_subjectivity(-0.1, mask)
+            self.apply_pressure(release, mask)
+            self.evolve(1.0, mask)
+            record(step + 2)
+
+        return ResolutionResult(intelligence, coherence, steps)
+
+    def _apply(self, column: Any, operand: Any, mask: Any, rule) -> Any:
+        """Apply an element-wise update rule to a column, honoring the mask"""
+        if np is not None:
+            operand = np.asarray(operand)
+            if mask is None:
+                return rule(column, operand)
+            mask = np.asarray(mask, dtype=bool)
+            if operand.ndim:
+                operand = operand[mask]
+            column[mask] = rule(column[mask], operand)
+            return column
+
+        operands = _expand(operand, self.size)
+        if len(operands) != self.size:
+            raise ValueError(f"Expected {self.size} values, got {len(operands)}")
+        if mask is None:
+            for index in range(self.size):
+                column[index] = rule(column[index], operands[index])
+        else:
+            for index, selected in enumerate(mask):
+                if selected:
+                    column[index] = rule(column[index], operands[index])
+        return column
@@ -0,0 +1,169 @@
+"""
+Event-driven simulation of many UniversalAxiom agents.
+
+Pressure shocks, subjectivity corrections and purpose boosts are scheduled at
+arbitrary times on a binary-heap priority queue. Every agent evolves one
+step per ``delta_time`` of simulated time, but only lazily: when an event
+fires, its agent is fast-forwarded with ``evolve_by`` over all the steps it
+missed, and then the mutator is applied. Idle agents are never touched, so
+the cost of an event is O(log pending events) whatever the number of
+agents.
+
+Results are identical to polling every agent at every tick. An event at
+time t sees ``floor(t / delta_time)`` evolution steps, and events with
+equal times fire in the order they were scheduled.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+from array import array
+from dataclasses import dataclass
+from enum import Enum
+from time import perf_counter
+from typing import Any, Iterable, List, Optional, Tuple, Union
+
+from .universal_axiom import AxiomState, UniversalAxiom
+
+
+class EventKind(Enum):
+    """Mutators that events can apply, named after the UniversalAxiom methods."""
+
+    PRESSURE = "apply_pressure"
+    SUBJECTIVITY = "adjust_subjectivity"
+    PURPOSE = "strengthen_purpose"
+
+
+# Unbound mutators in EventKind order, so queued events carry a small int
+KINDS = {kind: index for index, kind in enumerate(EventKind)}
+MUTATORS = tuple(getattr(UniversalAxiom, kind.value) for kind in KINDS)
+
+
+@dataclass(frozen=True)
+class EventRunResult:
+    """Outcome of EventSimulator.run, with an optional per-event trace."""
+
+    events: int
+    time: float
+    wall_time: float
+    times: Optional[array] = None
+    agents: Optional[array] = None
+    intelligence: Optional[array] = None
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.wall_time if self.wall_time > 0 else math.inf
+
+
+class EventSimulator:
+    """Priority-queue scheduler that fast-forwards idle agents."""
+
+    def __init__(self, agents: Iterable[UniversalAxiom], delta_time: float = 1.0):
+        """
+        Initialize the simulator at time 0.
+
+        Args:
+            agents: Axioms to simulate (mutated in place)
+            delta_time: Simulated time per evolution step
+        """
+        if not delta_time > 0:
+            raise ValueError("delta_time must be positive")
+        self.agents = list(agents)
+        self.delta_time = delta_time
+        self.now = 0.0
+        self._synced = [0] * len(self.agents)
+        self._queue: List[Tuple[float, int, int, int, float]] = []
+        self._order = itertools.count()
+
+    def __len__(self) -> int:
+        """Number of pending events"""
+        return len(self._queue)
+
+    def _entry(self, time: float, agent: int, kind: Union[EventKind, str], value: float):
+        if not time >= self.now:
+            raise ValueError(f"Cannot schedule at {time}, before the current time {self.now}")
+        if not 0 <= agent < len(self.agents):
+            raise IndexError("agent index out of range")
+        return (time, next(self._order), agent, KINDS[EventKind(kind)], value)
+
+    def schedule(self, time: float, agent: int, kind: Union[EventKind, str], value: float) -> None:
+        """
+        Schedule one event.
+
+        Args:
+            time: Simulated time at which the event fires (>= now)
+            agent: Index of the target agent
+            kind: EventKind (or its mutator name)
+            value: Mutator argument (delta or multiplier)
+        """
+        heapq.heappush(self._queue, self._entry(time, agent, kind, value))
+
+    def schedule_many(self, events: Iterable[Tuple[float, int, Any, float]]) -> None:
+        """Schedule (time, agent, kind, value) events in bulk with one heapify"""
+        self._queue.extend(self._entry(*event) for event in events)
+        heapq.heapify(self._queue)
+
+    def run(self, until: Optional[float] = None, record: bool = False) -> EventRunResult:
+        """
+        Fire pending events in time order.
+
+        Args:
+            until: Stop after the events at this time (None = drain the queue)
+            record: Keep the time, agent and resulting intelligence per event
+
+        Returns:
+            EventRunResult: Event count, final time and the optional trace
+        """
+        queue = self._queue
+        agents = self.agents
+        synced = self._synced
+        delta_time = self.delta_time
+        limit = math.inf if until is None else until
+        times = array("d")
+        indices = array("q")
+        values = array("d")
+
+        pop = heapq.heappop
+        processed = 0
+        started = perf_counter()
+        while queue and queue[0][0] <= limit:
+            time, _, index, kind, value = pop(queue)
+            agent = agents[index]
+            step = int(time // delta_time)
+            behind = step - synced[index]
+            if behind > 0:
+                agent.advance(behind, delta_time)
+                synced[index] = step
+            intelligence = MUTATORS[kind](agent, value)
+            processed += 1
+            if record:
+                times.append(time)
+                indices.append(index)
+                values.append(intelligence)
+            self.now = time
+        wall_time = perf_counter() - started
+
+        if until is not None:
+            self.now = max(self.now, until)
+        if not record:
+            return EventRunResult(processed, self.now, wall_time)
+        return EventRunResult(processed, self.now, wall_time, times, indices, values)
+
+    def state(self, agent: int) -> AxiomState:
+        """Snapshot of one agent, fast-forwarded to the current time"""
+        self._sync(agent)
+        return self.agents[agent].snapshot()
+
+    def sync(self) -> None:
+        """Fast-forward every agent to the current time"""
+        for agent in range(len(self.agents)):
+            self._sync(agent)
+
+    def _sync(self, index: int) -> None:
+        step = int(self.now // self.delta_time)
+        behind = step - self._synced[index]
+        if behind > 0:
+            self.agents[index].evolve_by(behind, self.delta_time)
+            self._synced[index] = step
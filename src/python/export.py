@@ -0,0 +1,199 @@
+"""
+Columnar export of simulation history and batch results.
+
+History columns are named after the flat get_state() keys (the AxiomState
+fields). Batch columns are ``intelligence``, ``saturated`` and, for gradient
+results, ``d_<variable>`` per partial derivative. Columns are written
+straight from their typed buffers, without building state dictionaries.
+
+- ``.npz``: an uncompressed archive of ``.npy`` members, readable with
+  ``numpy.load``. ``load_npz`` memory-maps the archive once and returns
+  zero-copy array views.
+- Arrow IPC (requires pyarrow): an uncompressed file that ``load_arrow``
+  reads zero-copy from a memory map.
+"""
+
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import struct
+import sys
+import zipfile
+from array import array
+from typing import Any, Dict, Union
+
+from .batch import BatchResult, GradientResult, np
+from .universal_axiom import AxiomSimulator, AxiomState, ColumnarHistory, dynamic_table
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+NPY_DESCR = {"d": "<f8", "q": "<i8", "b": "|b1"}
+
+Path = Union[str, "os.PathLike[str]"]
+
+
+def history_columns(history: Any) -> Dict[str, Any]:
+    """
+    Columns of a history (or of a simulator's history) keyed by state name.
+
+    Args:
+        history: ColumnarHistory, MappedHistory, list of get_state()
+            dictionaries or AxiomSimulator
+
+    Returns:
+        Dict[str, Any]: NumPy arrays, or typed arrays without NumPy, in
+        AxiomState field order
+    """
+    if isinstance(history, AxiomSimulator):
+        history = history.history
+    if isinstance(history, list):
+        history = ColumnarHistory.from_dicts(history)
+    stored = history.to_arrays()
+    fibonacci = dynamic_table().fibonacci
+
+    if np is not None:
+        columns = {name: np.frombuffer(column, column.typecode) for name, column in stored.items()}
+        # F_n exceeds int64 for n > 92, so it is exported as float64
+        columns["F_n"] = np.asarray(fibonacci, dtype=np.float64)[columns["n"]]
+        columns["X_objectivity"] = 1 - columns["X_subjectivity"]
+    else:
+        columns = dict(stored)
+        columns["F_n"] = array("d", (float(fibonacci[n]) for n in stored["n"]))
+        columns["X_objectivity"] = array("d", (1 - x for x in stored["X_subjectivity"]))
+    return {name: columns[name] for name in AxiomState._fields}
+
+
+def batch_columns(result: BatchResult) -> Dict[str, Any]:
+    """Columns of a batch (or gradient) evaluation result"""
+    columns = {"intelligence": result.intelligence, "saturated": result.saturated}
+    if isinstance(result, GradientResult):
+        for name, partial in result.partials.items():
+            columns[f"d_{name}"] = partial
+    return columns
+
+
+def _columns(source: Any) -> Dict[str, Any]:
+    if isinstance(source, BatchResult):
+        return batch_columns(source)
+    return history_columns(source)
+
+
+def _npy_parts(column: Any):
+    """(.npy header, little-endian data buffer) for a 1-D column"""
+    if np is not None:
+        column = np.ascontiguousarray(column)
+        column = column.astype(column.dtype.newbyteorder("<"), copy=False)
+        return _npy_header(column.dtype.str, len(column)), memoryview(column.view(np.uint8))
+    descr = NPY_DESCR[column.typecode]
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return _npy_header(descr, len(column)), memoryview(column).cast("B")
+
+
+def _npy_header(descr: str, length: int) -> bytes:
+    """Version 1.0 ``.npy`` header of a 1-D array"""
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({length},), }}"
+    # Pad so that magic, length and header fill a multiple of 64 bytes
+    padding = -(len(NPY_MAGIC) + 2 + len(header) + 1) % 64
+    encoded = (header + " " * padding + "\n").encode("latin1")
+    return NPY_MAGIC + struct.pack("<H", len(encoded)) + encoded
+
+
+def to_npz(source: Any, path: Path) -> None:
+    """
+    Write history or batch columns to an uncompressed ``.npz`` file.
+
+    Args:
+        source: History, AxiomSimulator or BatchResult
+        path: Output file
+    """
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for name, column in _columns(source).items():
+            header, data = _npy_parts(column)
+            with archive.open(f"{name}.npy", "w", force_zip64=True) as member:
+                member.write(header)
+                member.write(data)
+
+
+def load_npz(path: Path) -> Dict[str, Any]:
+    """
+    Memory-map an uncompressed ``.npz`` file as zero-copy NumPy arrays.
+
+    The arrays are read-only views of a single mapping of the file.
+    """
+    if np is None:
+        raise ImportError("load_npz requires NumPy")
+    with open(path, "rb") as handle:
+        with zipfile.ZipFile(handle) as archive:
+            members = archive.infolist()
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    columns = {}
+    for member in members:
+        if member.compress_type != zipfile.ZIP_STORED:
+            raise ValueError(f"{member.filename} is compressed and cannot be mapped")
+        name_length, extra_length = struct.unpack_from("<HH", mapped, member.header_offset + 26)
+        reader = _Reader(mapped, member.header_offset + 30 + name_length + extra_length)
+        version = np.lib.format.read_magic(reader)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(reader)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(reader)
+        data = np.frombuffer(mapped, dtype, math.prod(shape), reader.offset)
+        columns[member.filename[: -len(".npy")]] = data.reshape(
+            shape, order="F" if fortran_order else "C"
+        )
+    return columns
+
+
+class _Reader:
+    """Minimal file object over a mapping for NumPy's header parser"""
+
+    def __init__(self, buffer: Any, offset: int):
+        self._buffer = buffer
+        self.offset = offset
+
+    def read(self, size: int) -> bytes:
+        chunk: bytes = self._buffer[self.offset : self.offset + size]
+        self.offset += len(chunk)
+        return chunk
+
+
+def _arrow_array(column: Any) -> Any:
+    if np is not None:
+        return pa.array(np.asarray(column))
+    if column.typecode == "b":
+        return pa.array([bool(flag) for flag in column], type=pa.bool_())
+    return pa.array(column.tolist(), type=pa.float64() if column.typecode == "d" else pa.int64())
+
+
+def to_arrow(source: Any, path: Path) -> None:
+    """
+    Write history or batch columns to an Arrow IPC file (requires pyarrow).
+
+    Args:
+        source: History, AxiomSimulator or BatchResult
+        path: Output file
+    """
+    if pa is None:
+        raise ImportError("Arrow export requires pyarrow")
+    columns = _columns(source)
+    table = pa.table({name: _arrow_array(column) for name, column in columns.items()})
+    with pa.OSFile(os.fspath(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def load_arrow(path: Path) -> Any:
+    """Read an Arrow IPC file zero-copy from a memory map (requires pyarrow)"""
+    if pa is None:
+        raise ImportError("Arrow export requires pyarrow")
+    return pa.ipc.open_file(pa.memory_map(os.fspath(path), "r")).read_all()
@@ -0,0 +1,249 @@
+"""
+Separable evaluation of Cartesian axiom grids.
+
+Intelligence = dynamic(n) · cognitive(X, Y, Z) · foundation(A, B, C) is a
+product of three independent factors, so a full (A, B, C, X, Y, Z, n) grid is
+described by three small per-layer tables. ``SeparableGrid`` computes those
+tables once and combines them lazily:
+
+- indexing materializes only the requested slice, as an outer product
+- max/min/argmax/argmin are found from the factor extremes without touching
+  the full grid
+- sum/mean are products of the per-layer sums
+
+Every value matches ``UniversalAxiom.compute_intelligence()`` bit for bit,
+because each grid point is formed as ``dynamic * cognitive * foundation`` with
+the same per-layer multiplication order as the scalar code.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from numbers import Integral
+from typing import Any, Optional, Tuple
+
+from .batch import _dynamic_array, _numpy_steps, clamp_step, np
+from .sweep import AXES, ParameterSweep
+from .universal_axiom import dynamic_table
+
+
+def _flat(values: Any) -> Any:
+    """One-dimensional view of a factor table."""
+    return values.reshape(-1) if np is not None else values
+
+
+def _finite(values: Any) -> bool:
+    if np is not None:
+        return bool(np.isfinite(values).all())
+    return all(math.isfinite(value) for value in values)
+
+
+def _bounds(values: Any) -> Tuple[float, float]:
+    if np is not None:
+        return float(values.min()), float(values.max())
+    return min(values), max(values)
+
+
+def _first(flags: Any) -> int:
+    """Index of the first true flag."""
+    if np is not None:
+        return int(np.flatnonzero(flags)[0])
+    return next(index for index, flag in enumerate(flags) if flag)
+
+
+class SeparableGrid(ParameterSweep):
+    """Parameter grid evaluated through its three layer factors."""
+
+    def __init__(
+        self,
+        impulses: Any = 1.0,
+        elements: Any = 1.0,
+        pressure: Any = 1.0,
+        subjectivity: Any = 0.0,
+        purpose: Any = 1.0,
+        time: Any = 1.0,
+        n: Any = 1,
+        base_exponential: float = 3.0,
+    ):
+        """
+        Initialize the grid and compute the per-layer factor tables.
+
+        Each argument is a scalar (fixed value) or a sequence of values.
+        Without NumPy the factor tables are flat ``array('d')`` values in
+        C order.
+        """
+        super().__init__(
+            impulses, elements, pressure, subjectivity, purpose, time, n, base_exponential
+        )
+        A, B, C, X, Y, Z, steps = self.axes
+
+        if np is not None:
+            A, B, C, X, Y, Z = (np.asarray(axis, dtype=np.float64) for axis in (A, B, C, X, Y, Z))
+            self.foundation = np.multiply.outer(np.multiply.outer(A, B), C)
+            self.cognitive = np.multiply.outer(np.multiply.outer(1 - X, Y), Z)
+            self.dynamic = _dynamic_array(base_exponential)[_numpy_steps(steps)]
+        else:
+            product = dynamic_table(base_exponential).product
+            self.foundation = array("d", (a * b * c for a in A for b in B for c in C))
+            self.cognitive = array("d", ((1 - x) * y * z for x in X for y in Y for z in Z))
+            self.dynamic = array("d", (product[clamp_step(k)] for k in steps))
+
+    @classmethod
+    def from_sweep(cls, sweep: ParameterSweep) -> "SeparableGrid":
+        """Factorize an existing parameter sweep."""
+        impulses, elements, pressure, subjectivity, purpose, time, n = sweep.axes
+        return cls(
+            impulses, elements, pressure, subjectivity, purpose, time, n, sweep.base_exponential
+        )
+
+    def _key(self, key: Any) -> Tuple[Any, ...]:
+        """Normalize an index to one int or slice per axis."""
+        parts: Tuple[Any, ...] = key if isinstance(key, tuple) else (key,)
+        if len(parts) > len(AXES):
+            raise IndexError(f"too many indices for a {len(AXES)}-axis grid")
+        for part in parts:
+            if not isinstance(part, (Integral, slice)):
+                raise TypeError("grid indices must be integers or slices")
+        return parts + (slice(None),) * (len(AXES) - len(parts))
+
+    def select(self, key: Any) -> "SeparableGrid":
+        """
+        Lazily restrict the grid to a sub-grid.
+
+        Integer indices keep their axis with a single value, so the result
+        is still a seven-axis grid.
+        """
+        impulses, elements, pressure, subjectivity, purpose, time, n = (
+            (axis[part],) if isinstance(part, Integral) else axis[part]
+            for axis, part in zip(self.axes, self._key(key))
+        )
+        return type(self)(
+            impulses, elements, pressure, subjectivity, purpose, time, n, self.base_exponential
+        )
+
+    def __getitem__(self, key: Any) -> Any:
+        """
+        Materialize a slice of the grid.
+
+        With NumPy this follows ndarray indexing (integer indices drop their
+        axis). Without NumPy a flat ``array('d')`` in C order is returned, or a
+        float when every axis is indexed by an integer.
+        """
+        key = self._key(key)
+        if np is not None:
+            foundation = self.foundation[key[:3]]
+            cognitive = self.cognitive[key[3:6]]
+            dynamic = self.dynamic[key[6]]
+            return np.multiply.outer(foundation, np.multiply.outer(cognitive, dynamic))
+
+        values = self.select(key).to_array()
+        if all(isinstance(part, Integral) for part in key):
+            return values[0]
+        return values
+
+    def to_array(self) -> Any:
+        """Materialize the full grid (shape ``self.shape`` with NumPy)."""
+        if np is not None:
+            return self[()]
+        return array(
+            "d",
+            (d * c * f for f in self.foundation for c in self.cognitive for d in self.dynamic),
+        )
+
+    def max(self) -> float:
+        """Largest intelligence value on the grid (NaN if any point is NaN)."""
+        return self._extreme(1)[0]
+
+    def min(self) -> float:
+        """Smallest intelligence value on the grid (NaN if any point is NaN)."""
+        return self._extreme(-1)[0]
+
+    def argmax(self) -> int:
+        """Flat index of the first largest value, in C order like ``ndarray.argmax``."""
+        return self._extreme(1)[1]
+
+    def argmin(self) -> int:
+        """Flat index of the first smallest value, in C order like ``ndarray.argmin``."""
+        return self._extreme(-1)[1]
+
+    def sum(self) -> float:
+        """Sum over the grid as the product of the per-layer sums."""
+        if np is not None:
+            return float(self.dynamic.sum() * self.cognitive.sum() * self.foundation.sum())
+        return math.fsum(self.dynamic) * math.fsum(self.cognitive) * math.fsum(self.foundation)
+
+    def mean(self) -> float:
+        """Mean over the grid, from the per-layer sums."""
+        return self.sum() / self.size
+
+    def _extreme(self, sign: int) -> Tuple[float, int]:
+        """
+        (value, flat index) of the first maximum of ``sign * intelligence``.
+
+        Rounded multiplication is monotone in each operand, so the extremes of
+        (d * c) * f lie at combinations of the per-factor extremes. That finds
+        the value and walks down one factor at a time to the first index that
+        reaches it. Non-finite factors fall back to an exact scan that holds
+        one cognitive x dynamic block at a time.
+        """
+        dynamic = _flat(self.dynamic)
+        cognitive = _flat(self.cognitive)
+        foundation = _flat(self.foundation)
+        if sign < 0:
+            foundation = -foundation if np is not None else array("d", (-f for f in foundation))
+
+        found = self._vertex_extreme(dynamic, cognitive, foundation)
+        value, index = found if found is not None else self._scan(dynamic, cognitive, foundation)
+        return sign * value, index
+
+    @staticmethod
+    def _vertex_extreme(dynamic: Any, cognitive: Any, foundation: Any) -> Optional[Tuple]:
+        if not (_finite(dynamic) and _finite(cognitive) and _finite(foundation)):
+            return None
+
+        d_low, d_high = _bounds(dynamic)
+        c_low, c_high = _bounds(cognitive)
+        f_low, f_high = _bounds(foundation)
+        corners = [d * c for d in (d_low, d_high) for c in (c_low, c_high)]
+        p_low, p_high = min(corners), max(corners)
+        candidates = [p * f for p in (p_low, p_high) for f in (f_low, f_high)]
+        if not all(math.isfinite(value) for value in candidates + corners):
+            return None
+        best = max(candidates)
+
+        if np is not None:
+            i = _first(np.maximum(p_low * foundation, p_high * foundation) == best)
+            f = foundation[i]
+            j = _first(np.maximum(d_low * cognitive * f, d_high * cognitive * f) == best)
+            k = _first(dynamic * cognitive[j] * f == best)
+        else:
+            i = _first(max(p_low * f, p_high * f) == best for f in foundation)
+            f = foundation[i]
+            j = _first(max(d_low * c * f, d_high * c * f) == best for c in cognitive)
+            k = _first(d * cognitive[j] * f == best for d in dynamic)
+        return best, (i * len(cognitive) + j) * len(dynamic) + k
+
+    @staticmethod
+    def _scan(dynamic: Any, cognitive: Any, foundation: Any) -> Tuple[float, int]:
+        block_size = len(cognitive) * len(dynamic)
+        if np is not None:
+            block = np.multiply.outer(cognitive, dynamic).reshape(-1)
+        else:
+            block = [d * c for c in cognitive for d in dynamic]
+
+        best_value: Any = None
+        best_index = 0
+        for i, f in enumerate(foundation):
+            if np is not None:
+                values = block * f
+                offset = int(np.argmax(values))
+                candidates: Any = [(offset, float(values[offset]))]
+            else:
+                candidates = enumerate(dc * f for dc in block)
+            for offset, value in candidates:
+                if value != value:
+                    return value, i * block_size + offset
+                if best_value is None or value > best_value:
+                    best_value, best_index = value, i * block_size + offset
+        return best_value, best_index
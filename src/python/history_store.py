@@ -0,0 +1,262 @@
+"""
+Memory-mapped, out-of-core history store for long simulations.
+
+``MappedHistory`` has the interface of ``ColumnarHistory`` but keeps its
+states in a file instead of RAM. Each state is a fixed-width little-endian
+record in HISTORY_COLUMNS order. The file grows by whole chunks of records,
+and each chunk is mapped separately, so an append is a single ``pack_into``
+and never remaps or copies earlier data. The state count lives in the file
+header and is updated after each record is written. A reader opened on the
+same file (mode ``"r"``) therefore always sees a complete prefix, and it can
+slice any step range while the writer is still running.
+
+File layout (version 1):
+
+- header, one allocation granule: magic ``b"UAXH"``, version (uint16),
+  record size (uint16), records per chunk (int64), state count (int64)
+- chunk k at ``header + k * chunk_bytes``, where chunk_bytes is a multiple of
+  the allocation granularity
+"""
+
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List, Union
+
+from .batch import np
+from .universal_axiom import HISTORY_COLUMNS, AxiomState, _restore_state, _stored_values
+
+MAGIC = b"UAXH"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHq")
+COUNT = struct.Struct("<q")
+COUNT_OFFSET = HEADER.size
+HEADER_SIZE = mmap.ALLOCATIONGRANULARITY
+
+RECORD = struct.Struct("<" + "".join(typecode for _, typecode in HISTORY_COLUMNS))
+FIELDS = {name: index for index, (name, _) in enumerate(HISTORY_COLUMNS)}
+
+# Chunks must start on allocation-granularity boundaries to be mapped
+CHUNK_ALIGNMENT = HEADER_SIZE // math.gcd(HEADER_SIZE, RECORD.size)
+DEFAULT_CHUNK_RECORDS = 1 << 17
+
+if np is not None:
+    RECORD_DTYPE = np.dtype([(name, "<" + typecode) for name, typecode in HISTORY_COLUMNS])
+
+
+class MappedHistory(Sequence):
+    """
+    History store backed by a memory-mapped file.
+
+    Use it as the ``history`` of an AxiomSimulator. The file is unbounded and
+    grows ``chunk_records`` states at a time. ``column()`` and ``segments()``
+    return zero-copy views of the mapped records.
+    """
+
+    capacity = None
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        mode: str = "a",
+        chunk_records: int = DEFAULT_CHUNK_RECORDS,
+    ):
+        """
+        Open or create a history file.
+
+        Args:
+            path: History file
+            mode: "w" creates or truncates, "a" appends to an existing file
+                (creating it if missing), "r" opens a read-only view
+            chunk_records: States per chunk of file growth, for new files
+                (rounded up to the mapping alignment)
+        """
+        if mode not in ("r", "w", "a"):
+            raise ValueError('mode must be "r", "w" or "a"')
+        if chunk_records < 1:
+            raise ValueError("chunk_records must be at least 1")
+        self.path = os.fspath(path)
+        self.readonly = mode == "r"
+        self._chunks: List[mmap.mmap] = []
+
+        if mode == "r" or (mode == "a" and os.path.exists(self.path)):
+            self._file = open(self.path, "rb" if self.readonly else "r+b")
+            access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+            try:
+                self._header = mmap.mmap(self._file.fileno(), HEADER_SIZE, access=access)
+            except ValueError as error:
+                self._file.close()
+                raise ValueError("Not a Universal Axiom history file") from error
+            magic, version, record_size, self.chunk_records = HEADER.unpack_from(self._header)
+            if magic != MAGIC or record_size != RECORD.size:
+                self.close()
+                raise ValueError("Not a Universal Axiom history file")
+            if version != VERSION:
+                self.close()
+                raise ValueError(f"Unsupported history version {version}")
+        else:
+            self.chunk_records = -(-chunk_records // CHUNK_ALIGNMENT) * CHUNK_ALIGNMENT
+            self._file = open(self.path, "w+b")
+            self._file.truncate(HEADER_SIZE)
+            self._header = mmap.mmap(self._file.fileno(), HEADER_SIZE)
+            HEADER.pack_into(self._header, 0, MAGIC, VERSION, RECORD.size, self.chunk_records)
+            COUNT.pack_into(self._header, COUNT_OFFSET, 0)
+
+        self._chunk_bytes = self.chunk_records * RECORD.size
+        self._size = len(self)
+
+    def _chunk(self, index: int) -> mmap.mmap:
+        """Map chunk ``index``, growing the file first when writing"""
+        while len(self._chunks) <= index:
+            offset = HEADER_SIZE + len(self._chunks) * self._chunk_bytes
+            if self.readonly:
+                access = mmap.ACCESS_READ
+            else:
+                access = mmap.ACCESS_WRITE
+                if os.fstat(self._file.fileno()).st_size < offset + self._chunk_bytes:
+                    self._file.truncate(offset + self._chunk_bytes)
+            self._chunks.append(
+                mmap.mmap(self._file.fileno(), self._chunk_bytes, access=access, offset=offset)
+            )
+        return self._chunks[index]
+
+    def append(self, state: AxiomState) -> None:
+        """Write a snapshot and publish it to readers"""
+        if self.readonly:
+            raise ValueError("history is opened read-only")
+        chunk, slot = divmod(self._size, self.chunk_records)
+        RECORD.pack_into(self._chunk(chunk), slot * RECORD.size, *_stored_values(state))
+        self._size += 1
+        COUNT.pack_into(self._header, COUNT_OFFSET, self._size)
+
+    def clear(self) -> None:
+        """Remove all recorded states (the file keeps its size for reuse)"""
+        if self.readonly:
+            raise ValueError("history is opened read-only")
+        self._size = 0
+        COUNT.pack_into(self._header, COUNT_OFFSET, 0)
+
+    def __len__(self) -> int:
+        count: int = COUNT.unpack_from(self._header, COUNT_OFFSET)[0]
+        return count
+
+    def state(self, index: int) -> AxiomState:
+        """Return the snapshot at a chronological index (oldest = 0)"""
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("history index out of range")
+        chunk, slot = divmod(index, self.chunk_records)
+        return _restore_state(RECORD.unpack_from(self._chunk(chunk), slot * RECORD.size))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.state(i).to_dict() for i in range(*index.indices(len(self)))]
+        return self.state(index).to_dict()
+
+    def __iter__(self) -> Iterator[Dict]:
+        for index in range(len(self)):
+            yield self.state(index).to_dict()
+
+    def states(self) -> Iterator[AxiomState]:
+        """Iterate over snapshots oldest-first"""
+        for index in range(len(self)):
+            yield self.state(index)
+
+    def segments(self, start: int = 0, stop: Any = None) -> Iterator[Any]:
+        """
+        Yield zero-copy views of the records in [start, stop), one per chunk.
+
+        Views are NumPy structured arrays (fields named after
+        HISTORY_COLUMNS) when NumPy is installed, raw record bytes as a
+        memoryview otherwise. Release them before close().
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        while start < stop:
+            chunk, slot = divmod(start, self.chunk_records)
+            count = min(stop - start, self.chunk_records - slot)
+            mapped = self._chunk(chunk)
+            if np is not None:
+                yield np.frombuffer(mapped, RECORD_DTYPE, count, slot * RECORD.size)
+            else:
+                yield memoryview(mapped)[slot * RECORD.size : (slot + count) * RECORD.size]
+            start += count
+
+    def column(self, name: str, start: int = 0, stop: Any = None) -> Any:
+        """
+        Values of one state key over [start, stop).
+
+        Ranges within one chunk are returned as a zero-copy strided view (a
+        NumPy array, or a memoryview without NumPy); ranges spanning chunks
+        are joined into a copy.
+        """
+        if name not in FIELDS:
+            raise KeyError(name)
+        typecode = HISTORY_COLUMNS[FIELDS[name]][1]
+        views = [self._field(segment, name, typecode) for segment in self.segments(start, stop)]
+        if len(views) == 1:
+            return views[0]
+        if np is not None:
+            return np.concatenate(views) if views else np.empty(0, RECORD_DTYPE[name])
+        joined = array(typecode)
+        for view in views:
+            joined.extend(view)
+        return joined
+
+    @staticmethod
+    def _field(segment: Any, name: str, typecode: str) -> Any:
+        if np is not None:
+            return segment[name]
+        if sys.byteorder == "big":
+            values = array(typecode, segment.cast(typecode)[FIELDS[name] :: len(FIELDS)])
+            values.byteswap()
+            return values
+        return segment.cast(typecode)[FIELDS[name] :: len(FIELDS)]
+
+    def to_arrays(self) -> Dict[str, array]:
+        """
+        Export the stored columns in chronological order.
+
+        Returns:
+            Dict[str, array]: Column name to a typed array copy
+        """
+        return {
+            name: array(typecode, self.column(name).tolist()) for name, typecode in HISTORY_COLUMNS
+        }
+
+    def to_dicts(self) -> List[Dict]:
+        """Export the legacy list of get_state() dictionaries"""
+        return list(self)
+
+    def flush(self) -> None:
+        """Write mapped changes back to the file"""
+        if not self.readonly:
+            for mapped in self._chunks:
+                mapped.flush()
+            self._header.flush()
+
+    def close(self) -> None:
+        """Flush and unmap the file; views from segments() must be released"""
+        if self._file.closed:
+            return
+        if not self._header.closed:
+            self.flush()
+        for mapped in self._chunks:
+            mapped.close()
+        self._chunks = []
+        self._header.close()
+        self._file.close()
+
+    def __enter__(self) -> "MappedHistory":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,235 @@
+"""
+Batch inverse solving for The Universal Axiom.
+
+Answers "what value of one variable reaches this intelligence?" for a whole
+batch of targets at once. Continuous variables are solved in closed form,
+since intelligence is linear in A, B, C, Y, Z and in (1 - X). The integer step
+n is found by binary search over the precomputed dynamic table. Rows without
+a valid solution are reported in an ``infeasible`` mask.
+
+Solutions must respect the clamping rules of ``UniversalAxiom``:
+
+- pressure and purpose must be at least 0.01
+- subjectivity must lie within [0.0, 1.0]
+- n must lie within [1, MAX_N]
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Any, Dict, List, Tuple
+
+from .batch import (
+    GRADIENT_VARIABLES,
+    _column_length,
+    _dynamic_array,
+    _expand,
+    _numpy_columns,
+    _numpy_steps,
+    clamp_step,
+    np,
+)
+from .universal_axiom import MAX_N, dynamic_table
+
+SOLVABLE_VARIABLES = GRADIENT_VARIABLES + ("n",)
+
+# (lower, upper) limits matching the UniversalAxiom mutator clamps
+VARIABLE_BOUNDS: Dict[str, Tuple[float, float]] = {
+    "impulses": (-math.inf, math.inf),
+    "elements": (-math.inf, math.inf),
+    "pressure": (0.01, math.inf),
+    "subjectivity": (0.0, 1.0),
+    "purpose": (0.01, math.inf),
+    "time": (-math.inf, math.inf),
+}
+
+
+@dataclass(frozen=True)
+class InverseResult:
+    """Solved values per row with an infeasibility mask."""
+
+    variable: str
+    values: Any
+    infeasible: Any
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def infeasible_rows(self) -> List[int]:
+        """Indices of rows with no valid solution."""
+        return [index for index, flag in enumerate(self.infeasible) if flag]
+
+
+def _coefficient(variable: str, dynamic, a, b, c, x, y, z) -> Any:
+    """Factor multiplying the solved term (the variable, or 1 - X)."""
+    if variable == "impulses":
+        return dynamic * ((1 - x) * y * z) * (b * c)
+    if variable == "elements":
+        return dynamic * ((1 - x) * y * z) * (a * c)
+    if variable == "pressure":
+        return dynamic * ((1 - x) * y * z) * (a * b)
+    if variable == "subjectivity":
+        return dynamic * (y * z) * (a * b * c)
+    if variable == "purpose":
+        return dynamic * ((1 - x) * z) * (a * b * c)
+    return dynamic * ((1 - x) * y) * (a * b * c)
+
+
+def _cumulative_dynamic(base_exponential: float) -> Any:
+    """Running maximum of the dynamic table from n=1, so step search is monotone."""
+    if np is not None:
+        table = _dynamic_array(base_exponential).copy()
+        table[1:] = np.maximum.accumulate(table[1:])
+        return table
+    product = dynamic_table(base_exponential).product
+    return [product[0]] + list(accumulate(product[1:], max))
+
+
+def _first_step(reached) -> int:
+    """Smallest n in [1, MAX_N] for a monotone predicate, or MAX_N + 1."""
+    low, high = 1, MAX_N + 1
+    while low < high:
+        middle = (low + high) // 2
+        if reached(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def solve_for_batch(
+    variable: str,
+    target: Any,
+    impulses: Any = 1.0,
+    elements: Any = 1.0,
+    pressure: Any = 1.0,
+    subjectivity: Any = 0.0,
+    purpose: Any = 1.0,
+    time: Any = 1.0,
+    n: Any = 1,
+    base_exponential: float = 3.0,
+) -> InverseResult:
+    """
+    Solve for one variable so that each row reaches its target intelligence.
+
+    The column of the solved variable is ignored. Continuous solutions
+    reproduce the target up to rounding. For n the result is the smallest
+    step whose intelligence reaches the target: at least the target when the
+    other factors are non-negative, at most the target when they are negative.
+
+    Rows are infeasible when the other factors multiply to zero (no unique
+    solution), when the solution falls outside VARIABLE_BOUNDS, or when no
+    step up to MAX_N reaches the target.
+
+    Args:
+        variable: One of SOLVABLE_VARIABLES
+        target: Target intelligence (scalar or per row)
+        impulses, elements, pressure, subjectivity, purpose, time, n: Inputs
+            as in compute_intelligence_batch
+        base_exponential: Base for exponential growth (default: 3.0)
+
+    Returns:
+        InverseResult: solved values (NaN, or step 0, where infeasible) and
+        the infeasible mask
+    """
+    if variable not in SOLVABLE_VARIABLES:
+        raise ValueError(f"Cannot solve for {variable!r}; expected one of {SOLVABLE_VARIABLES}")
+
+    if variable == "n":
+        return _solve_steps(
+            target, impulses, elements, pressure, subjectivity, purpose, time, base_exponential
+        )
+
+    columns = (impulses, elements, pressure, subjectivity, purpose, time, n, target)
+    low, high = VARIABLE_BOUNDS[variable]
+
+    if np is not None:
+        A, B, C, X, Y, Z, steps, goal = _numpy_columns(columns)
+        dynamic = _dynamic_array(base_exponential)[_numpy_steps(steps)]
+        coefficient = _coefficient(variable, dynamic, A, B, C, X, Y, Z)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            term = goal / coefficient
+        values = 1 - term if variable == "subjectivity" else term
+        infeasible = (
+            (coefficient == 0)
+            | ~np.isfinite(coefficient)
+            | ~np.isfinite(values)
+            | (values < low)
+            | (values > high)
+        )
+        values = np.where(infeasible, np.nan, values)
+        return InverseResult(variable=variable, values=values, infeasible=infeasible)
+
+    length = _column_length(columns)
+    product = dynamic_table(base_exponential).product
+    values = array("d", bytes(8 * length))
+    infeasible = array("b", bytes(length))
+
+    rows = zip(*(_expand(column, length) for column in columns))
+    for index, (a, b, c, x, y, z, k, goal) in enumerate(rows):
+        coefficient = _coefficient(variable, product[clamp_step(k)], a, b, c, x, y, z)
+        value = math.nan
+        if coefficient != 0 and math.isfinite(coefficient):
+            try:
+                term = goal / coefficient
+            except OverflowError:
+                term = math.inf
+            value = 1 - term if variable == "subjectivity" else term
+        if not (math.isfinite(value) and low <= value <= high):
+            infeasible[index] = 1
+            value = math.nan
+        values[index] = value
+
+    return InverseResult(variable=variable, values=values, infeasible=infeasible)
+
+
+def _solve_steps(
+    target, impulses, elements, pressure, subjectivity, purpose, time, base_exponential
+) -> InverseResult:
+    """Smallest n reaching each target, by binary search on the dynamic table."""
+    columns = (impulses, elements, pressure, subjectivity, purpose, time, target)
+    table = _cumulative_dynamic(base_exponential)
+
+    if np is not None:
+        A, B, C, X, Y, Z, goal = _numpy_columns(columns)
+        foundation = A * B * C
+        cognitive = (1 - X) * Y * Z
+        falling = ((cognitive < 0) & (foundation > 0)) | ((cognitive > 0) & (foundation < 0))
+
+        low = np.ones(goal.shape, dtype=np.intp)
+        high = np.full(goal.shape, MAX_N + 1, dtype=np.intp)
+        while True:
+            active = low < high
+            if not active.any():
+                break
+            middle = (low + high) // 2
+            value = table[np.minimum(middle, MAX_N)] * cognitive * foundation
+            hit = np.where(falling, value <= goal, value >= goal)
+            high = np.where(active & hit, middle, high)
+            low = np.where(active & ~hit, middle + 1, low)
+
+        infeasible = low > MAX_N
+        values = np.where(infeasible, 0, low)
+        return InverseResult(variable="n", values=values, infeasible=infeasible)
+
+    length = _column_length(columns)
+    values = array("q", bytes(8 * length))
+    infeasible = array("b", bytes(length))
+
+    rows = zip(*(_expand(column, length) for column in columns))
+    for index, (a, b, c, x, y, z, goal) in enumerate(rows):
+        foundation = a * b * c
+        cognitive = (1 - x) * y * z
+        if cognitive < 0 < foundation or foundation < 0 < cognitive:
+            step = _first_step(lambda k: table[k] * cognitive * foundation <= goal)
+        else:
+            step = _first_step(lambda k: table[k] * cognitive * foundation >= goal)
+        if step > MAX_N:
+            infeasible[index] = 1
+        else:
+            values[index] = step
+
+    return InverseResult(variable="n", values=values, infeasible=infeasible)
@@ -0,0 +1,352 @@
+"""
+Monte Carlo uncertainty propagation for The Universal Axiom.
+
+Treats A, B, C, X, Y and Z as random variables with independent
+distributions and propagates them to output distributions of intelligence
+and of the simulator coherence metric. Samples are drawn and evaluated in
+vectorized chunks. Each chunk has its own reproducible RNG stream, derived
+from the seed and the chunk index, so results do not depend on the number of
+workers. Chunks are reduced to mergeable summaries (count, mean, variance,
+extremes and a quantile sketch) in the worker, and no sample is kept.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import random
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from itertools import accumulate
+from numbers import Real
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .batch import compute_coherence_batch, compute_intelligence_batch, np
+from .sweep import _run_chunks
+
+VARIABLES = ("impulses", "elements", "pressure", "subjectivity", "purpose", "time")
+
+
+@dataclass(frozen=True)
+class Normal:
+    """Normal distribution."""
+
+    mean: float
+    std: float
+
+    def sample(self, rng: Any, size: int) -> Any:
+        if np is not None:
+            return rng.normal(self.mean, self.std, size)
+        return array("d", (rng.gauss(self.mean, self.std) for _ in range(size)))
+
+
+@dataclass(frozen=True)
+class Uniform:
+    """Uniform distribution on [low, high)."""
+
+    low: float
+    high: float
+
+    def sample(self, rng: Any, size: int) -> Any:
+        if np is not None:
+            return rng.uniform(self.low, self.high, size)
+        return array("d", (rng.uniform(self.low, self.high) for _ in range(size)))
+
+
+@dataclass(frozen=True)
+class LogNormal:
+    """Log-normal distribution (mean and sigma of the underlying normal)."""
+
+    mean: float
+    sigma: float
+
+    def sample(self, rng: Any, size: int) -> Any:
+        if np is not None:
+            return rng.lognormal(self.mean, self.sigma, size)
+        return array("d", (rng.lognormvariate(self.mean, self.sigma) for _ in range(size)))
+
+
+@dataclass(frozen=True)
+class Triangular:
+    """Triangular distribution on [low, high] peaking at mode."""
+
+    low: float
+    mode: float
+    high: float
+
+    def sample(self, rng: Any, size: int) -> Any:
+        if np is not None:
+            return rng.triangular(self.low, self.mode, self.high, size)
+        return array("d", (rng.triangular(self.low, self.high, self.mode) for _ in range(size)))
+
+
+@dataclass(frozen=True)
+class Discrete:
+    """Finite distribution over values (uniform unless weights are given)."""
+
+    values: Tuple[float, ...]
+    weights: Optional[Tuple[float, ...]] = None
+
+    def sample(self, rng: Any, size: int) -> Any:
+        if np is not None:
+            weights = None
+            if self.weights is not None:
+                weights = np.asarray(self.weights, dtype=np.float64)
+                weights = weights / weights.sum()
+            return rng.choice(np.asarray(self.values), size, p=weights)
+        return array("d", rng.choices(self.values, self.weights, k=size))
+
+
+@dataclass(frozen=True)
+class SampleSummary:
+    """
+    Mergeable summary of a sample stream.
+
+    Mean and variance are merged exactly (Chan et al.). Quantiles come from a
+    sketch of at most ``resolution`` weighted points, which keeps rank error
+    around 1 / resolution.
+    """
+
+    count: int
+    mean: float
+    m2: float
+    minimum: float
+    maximum: float
+    points: Tuple[float, ...]
+    weights: Tuple[float, ...]
+
+    @classmethod
+    def from_values(cls, values: Any, resolution: int) -> "SampleSummary":
+        """Summarize one chunk of samples."""
+        count = len(values)
+        if np is not None:
+            ordered = np.sort(values)
+            mean = float(ordered.mean())
+            m2 = float(((ordered - mean) ** 2).sum())
+        else:
+            ordered = sorted(values)
+            mean = math.fsum(ordered) / count
+            m2 = math.fsum((value - mean) ** 2 for value in ordered)
+
+        if count <= resolution:
+            points = tuple(float(value) for value in ordered)
+            weights = (1.0,) * count
+        else:
+            step = count / resolution
+            points = tuple(float(ordered[int((i + 0.5) * step)]) for i in range(resolution))
+            weights = (step,) * resolution
+        return cls(count, mean, m2, float(ordered[0]), float(ordered[-1]), points, weights)
+
+    def merge(self, other: "SampleSummary", resolution: int) -> "SampleSummary":
+        """Combine two summaries."""
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        mean = self.mean + delta * other.count / count
+        m2 = self.m2 + other.m2 + delta * delta * self.count * other.count / count
+
+        merged = sorted(zip(self.points + other.points, self.weights + other.weights))
+        if len(merged) > resolution:
+            merged = _compress(merged, resolution)
+        return SampleSummary(
+            count=count,
+            mean=mean,
+            m2=m2,
+            minimum=min(self.minimum, other.minimum),
+            maximum=max(self.maximum, other.maximum),
+            points=tuple(point for point, _ in merged),
+            weights=tuple(weight for _, weight in merged),
+        )
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1 denominator)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> float:
+        """Estimated q-quantile (0 <= q <= 1)."""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be within [0, 1]")
+        total = sum(self.weights)
+        centers = [
+            cumulative - weight / 2
+            for cumulative, weight in zip(accumulate(self.weights), self.weights)
+        ]
+        rank = q * total
+        if rank <= centers[0]:
+            return self.minimum if q == 0.0 else self.points[0]
+        if rank >= centers[-1]:
+            return self.maximum if q == 1.0 else self.points[-1]
+        right = bisect_left(centers, rank)
+        left = right - 1
+        fraction = (rank - centers[left]) / (centers[right] - centers[left])
+        return self.points[left] + fraction * (self.points[right] - self.points[left])
+
+
+def _compress(merged: List[Tuple[float, float]], resolution: int) -> List[Tuple[float, float]]:
+    """Group sorted weighted points into `resolution` groups of equal weight."""
+    total = sum(weight for _, weight in merged)
+    share = total / resolution
+    groups: List[Tuple[float, float]] = []
+    value_sum = weight_sum = 0.0
+    for point, weight in merged:
+        value_sum += point * weight
+        weight_sum += weight
+        if weight_sum >= share * (1 - 1e-12) and len(groups) < resolution - 1:
+            groups.append((value_sum / weight_sum, weight_sum))
+            value_sum = weight_sum = 0.0
+    if weight_sum:
+        groups.append((value_sum / weight_sum, weight_sum))
+    return groups
+
+
+def _chunk_rng(seed: int, chunk: int) -> Any:
+    """Independent, reproducible RNG stream for one chunk."""
+    if np is not None:
+        return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(chunk,)))
+    return random.Random(f"{seed}:{chunk}")
+
+
+def _simulate_chunk(
+    distributions: Tuple[Any, ...],
+    n: int,
+    base_exponential: float,
+    seed: int,
+    chunk: int,
+    size: int,
+    resolution: int,
+) -> Tuple[SampleSummary, SampleSummary]:
+    """Sample, evaluate and summarize one chunk."""
+    rng = _chunk_rng(seed, chunk)
+    impulses, elements, pressure, subjectivity, purpose, time = (
+        _constant(value, size) if isinstance(value, Real) else value.sample(rng, size)
+        for value in distributions
+    )
+    intelligence = compute_intelligence_batch(
+        impulses, elements, pressure, subjectivity, purpose, time, n, base_exponential
+    ).intelligence
+    coherence = compute_coherence_batch(pressure, subjectivity, purpose)
+    return (
+        SampleSummary.from_values(intelligence, resolution),
+        SampleSummary.from_values(coherence, resolution),
+    )
+
+
+def _constant(value: Real, size: int) -> Any:
+    if np is not None:
+        return np.full(size, float(value))
+    return array("d", [float(value)]) * size
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    """Output distributions of a Monte Carlo run."""
+
+    samples: int
+    chunks: int
+    workers: int
+    wall_time: float
+    intelligence: SampleSummary
+    coherence: SampleSummary
+
+    def quantiles(self, qs=(0.05, 0.5, 0.95)) -> Dict[str, List[float]]:
+        """Quantiles of both outputs."""
+        return {
+            "intelligence": [self.intelligence.quantile(q) for q in qs],
+            "coherence": [self.coherence.quantile(q) for q in qs],
+        }
+
+
+class MonteCarloStudy:
+    """Uncertainty propagation from input distributions to axiom outputs."""
+
+    def __init__(
+        self,
+        impulses: Any = 1.0,
+        elements: Any = 1.0,
+        pressure: Any = 1.0,
+        subjectivity: Any = 0.0,
+        purpose: Any = 1.0,
+        time: Any = 1.0,
+        n: int = 1,
+        base_exponential: float = 3.0,
+    ):
+        """
+        Initialize the study.
+
+        Each of A, B, C, X, Y, Z is a fixed number or a distribution with a
+        ``sample(rng, size)`` method (Normal, Uniform, LogNormal, Triangular).
+        """
+        self.distributions = (impulses, elements, pressure, subjectivity, purpose, time)
+        for name, value in zip(VARIABLES, self.distributions):
+            if not isinstance(value, Real) and not hasattr(value, "sample"):
+                raise ValueError(f"{name} must be a number or a distribution")
+        self.n = n
+        self.base_exponential = base_exponential
+
+    def run(
+        self,
+        samples: int,
+        seed: int = 0,
+        workers: Optional[int] = 1,
+        chunk_size: int = 65536,
+        resolution: int = 512,
+    ) -> MonteCarloResult:
+        """
+        Draw samples and summarize intelligence and coherence.
+
+        Args:
+            samples: Total number of samples
+            seed: Seed of the per-chunk RNG streams
+            workers: Worker processes (None = CPU count, 1 = in-process)
+            chunk_size: Samples per chunk
+            resolution: Quantile sketch size (rank error ~ 1 / resolution)
+
+        Returns:
+            MonteCarloResult: Summary statistics of both outputs
+        """
+        if samples < 1 or chunk_size < 1 or resolution < 2:
+            raise ValueError("samples, chunk_size and resolution must be positive")
+        workers = workers or os.cpu_count() or 1
+
+        starts = range(0, samples, chunk_size)
+        tasks = (
+            (
+                self.distributions,
+                self.n,
+                self.base_exponential,
+                seed,
+                chunk,
+                min(chunk_size, samples - start),
+                resolution,
+            )
+            for chunk, start in enumerate(starts)
+        )
+
+        # Chunks are merged in index order so results do not depend on workers
+        merged: List[SampleSummary] = []
+        started = perf_counter()
+        for _, summaries in _run_chunks(_simulate_chunk, tasks, workers):
+            if merged:
+                merged = [
+                    current.merge(summary, resolution)
+                    for current, summary in zip(merged, summaries)
+                ]
+            else:
+                merged = list(summaries)
+        wall_time = perf_counter() - started
+
+        intelligence, coherence = merged
+        return MonteCarloResult(
+            samples=samples,
+            chunks=len(starts),
+            workers=workers,
+            wall_time=wall_time,
+            intelligence=intelligence,
+            coherence=coherence,
+        )
@@ -0,0 +1,299 @@
+"""
+Compiled operation plans for simulation schedules.
+
+A schedule is a list (or JSON array) of operations and repeat blocks:
+
+- ``{"op": "evolve", "value": 0.5, "repeat": 10}``
+- ``{"op": "apply_pressure", "value": -0.4, "observe": true}``
+- ``{"repeat": 5, "ops": [...]}``
+
+Ops are the UniversalAxiom mutators ``evolve``, ``apply_pressure``,
+``adjust_subjectivity`` and ``strengthen_purpose``. ``value`` is the
+mutator argument (``evolve`` defaults to a time step of 1.0) and ``repeat``
+defaults to 1. Only ops marked ``observe`` record the intelligence they
+return. No other op evaluates intelligence.
+
+``compile_plan`` turns a schedule into fused steps. Each mutator touches a
+single field: n and time, pressure, subjectivity or purpose. Between
+observations every field's sequence of ops is run-length encoded, so
+interleaved ops commute into one run per field. A run is then applied in
+closed form:
+
+- evolve: ``evolve_by``
+- pressure and subjectivity: monotone repeated additions via
+  ``repeated_add`` with the clamp applied once
+- purpose: a tight multiply loop
+
+Results are bit-identical to calling the mutators one by one. A plan runs on
+a single UniversalAxiom or, vectorized, on an AxiomEnsemble.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+from .batch import np
+from .ensemble import AxiomEnsemble
+from .universal_axiom import UniversalAxiom, repeated_add
+
+# Op name -> field it updates; ops on different fields commute
+FIELDS = {
+    "evolve": "time",
+    "apply_pressure": "pressure",
+    "adjust_subjectivity": "subjectivity",
+    "strengthen_purpose": "purpose",
+}
+
+Run = Tuple[str, float, int]
+
+
+@dataclass(frozen=True)
+class Fused:
+    """Runs of (op, value, count) applied without evaluating intelligence."""
+
+    runs: Tuple[Run, ...]
+
+
+@dataclass(frozen=True)
+class Observe:
+    """Record the current intelligence."""
+
+
+@dataclass(frozen=True)
+class Repeat:
+    """Execute a compiled body several times."""
+
+    count: int
+    body: Tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class PlanResult:
+    """Observed intelligence values of a plan run."""
+
+    observations: Any
+    operations: int
+    evaluations: int
+
+
+def _same(first: float, second: float) -> bool:
+    """Values are interchangeable in float arithmetic (NaN never is)"""
+    return first == second and math.copysign(1.0, first) == math.copysign(1.0, second)
+
+
+class _Builder:
+    """Accumulates per-field runs between observations"""
+
+    def __init__(self):
+        self.steps: List[Any] = []
+        self.pending: Dict[str, List[List[Any]]] = {}
+
+    def add(self, op: str, value: float, count: int) -> None:
+        if count == 0:
+            return
+        runs = self.pending.setdefault(FIELDS[op], [])
+        if runs and runs[-1][0] == op and _same(runs[-1][1], value):
+            runs[-1][2] += count
+        else:
+            runs.append([op, value, count])
+
+    def flush(self) -> None:
+        if self.pending:
+            runs = tuple(tuple(run) for field in self.pending.values() for run in field)
+            self.steps.append(Fused(runs))
+            self.pending = {}
+
+    def append(self, step: Any) -> None:
+        self.flush()
+        self.steps.append(step)
+
+    def build(self) -> Tuple[Any, ...]:
+        self.flush()
+        return tuple(self.steps)
+
+
+def _parse(schedule: Any) -> List[Dict[str, Any]]:
+    if isinstance(schedule, (str, bytes)):
+        schedule = json.loads(schedule)
+    if isinstance(schedule, dict):
+        schedule = [schedule]
+    if not isinstance(schedule, Sequence):
+        raise ValueError("A schedule must be a list of operations")
+    return list(schedule)
+
+
+def _compile(nodes: List[Dict[str, Any]]) -> Tuple[Tuple[Any, ...], int, int]:
+    """Compile nodes; returns (steps, source operations, observations)"""
+    builder = _Builder()
+    operations = evaluations = 0
+    for node in nodes:
+        repeat = node.get("repeat", 1)
+        if not isinstance(repeat, int) or isinstance(repeat, bool) or repeat < 0:
+            raise ValueError(f"repeat must be a non-negative int, got {repeat!r}")
+
+        if "ops" in node:
+            body, body_operations, body_evaluations = _compile(_parse(node["ops"]))
+            operations += repeat * body_operations
+            evaluations += repeat * body_evaluations
+            if not body or not repeat:
+                continue
+            fused = body[0] if len(body) == 1 and isinstance(body[0], Fused) else None
+            fields = [FIELDS[op] for op, _, _ in fused.runs] if fused else []
+            if fused and len(fields) == len(set(fields)):
+                # One run per field: repeating the body only scales the counts
+                for op, value, count in fused.runs:
+                    builder.add(op, value, count * repeat)
+            else:
+                builder.append(Repeat(repeat, body))
+            continue
+
+        name = node.get("op")
+        if name not in FIELDS:
+            raise ValueError(f"Unknown operation {name!r}")
+        if "value" in node:
+            value = float(node["value"])
+        elif name == "evolve":
+            value = 1.0
+        else:
+            raise ValueError(f"{name} needs a value")
+        operations += repeat
+        if node.get("observe", False):
+            evaluations += repeat
+            if repeat:
+                builder.append(Repeat(repeat, (Fused(((name, value, 1),)), Observe())))
+        else:
+            builder.add(name, value, repeat)
+    return builder.build(), operations, evaluations
+
+
+# Fused runs on a single axiom, bit-identical to repeated mutator calls
+
+
+def _evolve_axiom(axiom: UniversalAxiom, delta_time: float, count: int) -> None:
+    axiom.advance(count, delta_time)
+
+
+def _pressure_axiom(axiom: UniversalAxiom, delta: float, count: int) -> None:
+    foundation = axiom.foundation
+    pressure = max(0.01, foundation.pressure + delta)
+    if count > 1:
+        if delta >= 0:
+            pressure = repeated_add(pressure, delta, count - 1)
+        elif delta < 0:
+            # Decreasing sums stay below the clamp once they cross it
+            pressure = max(0.01, repeated_add(pressure, delta, count - 1))
+        else:
+            for _ in range(count - 1):
+                pressure = max(0.01, pressure + delta)
+    foundation.pressure = pressure
+
+
+def _subjectivity_axiom(axiom: UniversalAxiom, delta: float, count: int) -> None:
+    cognitive = axiom.cognitive
+    subjectivity = max(0.0, min(1.0, cognitive.subjectivity + delta))
+    if count > 1:
+        if delta >= 0:
+            subjectivity = min(1.0, repeated_add(subjectivity, delta, count - 1))
+        elif delta < 0:
+            subjectivity = max(0.0, repeated_add(subjectivity, delta, count - 1))
+        else:
+            for _ in range(count - 1):
+                subjectivity = max(0.0, min(1.0, subjectivity + delta))
+    cognitive.subjectivity = subjectivity
+
+
+def _purpose_axiom(axiom: UniversalAxiom, multiplier: float, count: int) -> None:
+    cognitive = axiom.cognitive
+    purpose = cognitive.purpose
+    for _ in range(count):
+        purpose = max(0.01, purpose * multiplier)
+    cognitive.purpose = purpose
+
+
+AXIOM_RUNS = {
+    "evolve": _evolve_axiom,
+    "apply_pressure": _pressure_axiom,
+    "adjust_subjectivity": _subjectivity_axiom,
+    "strengthen_purpose": _purpose_axiom,
+}
+
+
+def _ensemble_run(population: AxiomEnsemble, op: str, value: float, count: int) -> None:
+    if op == "evolve":
+        population.evolve_by(count, value)
+        return
+    mutator = getattr(population, op)
+    for _ in range(count):
+        mutator(value)
+
+
+class OperationPlan:
+    """A schedule compiled into fused steps."""
+
+    def __init__(self, schedule: Any):
+        """
+        Compile a schedule.
+
+        Args:
+            schedule: List of op dicts and repeat blocks, or its JSON text
+        """
+        self.steps, self.operations, self.evaluations = _compile(_parse(schedule))
+
+    def run(self, target: Union[UniversalAxiom, AxiomEnsemble]) -> PlanResult:
+        """
+        Execute the plan in place on an axiom or an ensemble.
+
+        Args:
+            target: UniversalAxiom, or AxiomEnsemble for a vectorized run
+
+        Returns:
+            PlanResult: ``array('d')`` of observed values for an axiom; for an
+            ensemble, one row per observation (a 2-D NumPy array, or a list of
+            ``array('d')`` rows)
+        """
+        observations: Any
+        if isinstance(target, AxiomEnsemble):
+            rows: List[Any] = []
+            self._execute_ensemble(self.steps, target, rows)
+            observations = rows
+            if np is not None:
+                observations = np.array(rows).reshape(len(rows), target.size)
+        elif isinstance(target, UniversalAxiom):
+            observations = array("d")
+            self._execute_axiom(self.steps, target, observations)
+        else:
+            raise TypeError(f"Cannot run a plan on {type(target).__name__}")
+        return PlanResult(observations, self.operations, self.evaluations)
+
+    def _execute_axiom(self, steps: Tuple[Any, ...], axiom: UniversalAxiom, out: array) -> None:
+        for step in steps:
+            if isinstance(step, Fused):
+                for op, value, count in step.runs:
+                    AXIOM_RUNS[op](axiom, value, count)
+            elif isinstance(step, Observe):
+                out.append(axiom.compute_intelligence())
+            else:
+                for _ in range(step.count):
+                    self._execute_axiom(step.body, axiom, out)
+
+    def _execute_ensemble(
+        self, steps: Tuple[Any, ...], population: AxiomEnsemble, out: List[Any]
+    ) -> None:
+        for step in steps:
+            if isinstance(step, Fused):
+                for op, value, count in step.runs:
+                    _ensemble_run(population, op, value, count)
+            elif isinstance(step, Observe):
+                out.append(population.compute_intelligence())
+            else:
+                for _ in range(step.count):
+                    self._execute_ensemble(step.body, population, out)
+
+
+def compile_plan(schedule: Any) -> OperationPlan:
+    """Compile a schedule (list of ops or JSON text) into an OperationPlan"""
+    return OperationPlan(schedule)
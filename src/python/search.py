@@ -0,0 +1,235 @@
+"""
+Branch-and-bound threshold and top-k search over parameter grids.
+
+Within a box of the grid (a contiguous range of sorted values per variable)
+each layer is monotone in each of its inputs, and rounded multiplication is
+monotone in each operand. The exact minimum and maximum intelligence of a
+box therefore come from the layer values at its corners, so whole boxes can
+be accepted or pruned without visiting their points:
+
+- threshold queries accept boxes whose minimum exceeds the threshold and
+  prune boxes whose maximum does not
+- top-k queries expand boxes best-first by their maximum and stop after k
+  single points
+
+A box bound evaluates each layer at several values (the foundation and
+cognitive corners, and every n in range), so it is counted as that many
+full evaluations. Their total is compared with the grid size a brute-force
+scan would evaluate; the number of bounds is reported separately.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .batch import clamp_step
+from .sweep import AXES, ParameterSweep
+from .universal_axiom import dynamic_table
+
+Box = Tuple[Tuple[int, int], ...]
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """Outcome of a threshold or top-k search with its evaluation counts."""
+
+    grid_size: int
+    evaluations: int
+    bounds: int
+    threshold: Optional[float] = None
+    matches: int = 0
+    boxes: Optional[List[Tuple[Tuple[float, ...], ...]]] = None
+    top: Optional[List[Tuple[float, Dict[str, float]]]] = None
+
+    @property
+    def savings(self) -> float:
+        """Grid size divided by the full evaluations the bounds are worth."""
+        return self.grid_size / self.evaluations if self.evaluations else float("inf")
+
+    def points(self) -> Iterator[Dict[str, float]]:
+        """Every matching point of a threshold search."""
+        for box in self.boxes or ():
+            for values in itertools.product(*box):
+                yield dict(zip(AXES, values))
+
+
+def _product_bounds(dynamic, cognitive, foundation) -> Tuple[float, float]:
+    """Exact (min, max) of dynamic * cognitive * foundation over value ranges."""
+    values = list(dynamic) + list(cognitive) + list(foundation)
+    if any(value != value for value in values):
+        return math.nan, math.nan
+
+    corners = [
+        d * c for d in (min(dynamic), max(dynamic)) for c in (min(cognitive), max(cognitive))
+    ]
+    candidates = [
+        p * f for p in (min(corners), max(corners)) for f in (min(foundation), max(foundation))
+    ]
+    if any(value != value for value in candidates):
+        return math.nan, math.nan
+    return min(candidates), max(candidates)
+
+
+class MonotoneSearch(ParameterSweep):
+    """Threshold and top-k queries that prune whole boxes of the grid."""
+
+    def __init__(
+        self,
+        impulses: Any = 1.0,
+        elements: Any = 1.0,
+        pressure: Any = 1.0,
+        subjectivity: Any = 0.0,
+        purpose: Any = 1.0,
+        time: Any = 1.0,
+        n: Any = 1,
+        base_exponential: float = 3.0,
+    ):
+        """
+        Initialize the search grid.
+
+        Each argument is a scalar (fixed value) or a sequence of values. The
+        values of each variable are sorted so that every box is a contiguous
+        value range.
+        """
+        super().__init__(
+            impulses, elements, pressure, subjectivity, purpose, time, n, base_exponential
+        )
+        self.axes = tuple(tuple(sorted(axis)) for axis in self.axes)
+        product = dynamic_table(base_exponential).product
+        self._dynamic = [product[clamp_step(k)] for k in self.axes[6]]
+
+    def _root(self) -> Box:
+        return tuple((0, length - 1) for length in self.shape)
+
+    def _bound(self, box: Box) -> Tuple[float, float]:
+        """Exact intelligence range of a box, from its layer corners."""
+        A, B, C, X, Y, Z, _ = ((axis[low], axis[high]) for axis, (low, high) in zip(self.axes, box))
+        low, high = box[6]
+        return _product_bounds(
+            self._dynamic[low : high + 1],
+            [(1 - x) * y * z for x in X for y in Y for z in Z],
+            [a * b * c for a in A for b in B for c in C],
+        )
+
+    @staticmethod
+    def _cost(box: Box) -> int:
+        """
+        Full evaluations a bound is worth.
+
+        A full evaluation computes one value of each layer. A bound computes
+        the foundation and cognitive products at their corners and reads
+        the dynamic value of every n in range, so it counts as the largest
+        of those three counts.
+        """
+        ends = [1 + (high > low) for low, high in box[:6]]
+        low, high = box[6]
+        return max(ends[0] * ends[1] * ends[2], ends[3] * ends[4] * ends[5], high - low + 1)
+
+    def _split(self, box: Box) -> Tuple[Box, Box]:
+        """Halve a box along the variable with the widest relative spread."""
+        axis = max(
+            (i for i, (low, high) in enumerate(box) if high > low),
+            key=lambda i: self._spread(i, *box[i]),
+        )
+        low, high = box[axis]
+        middle = (low + high) // 2
+        return (
+            box[:axis] + ((low, middle),) + box[axis + 1 :],
+            box[:axis] + ((middle + 1, high),) + box[axis + 1 :],
+        )
+
+    def _spread(self, axis: int, low: int, high: int) -> float:
+        """Log ratio of a variable's factor values at the ends of a range."""
+        if axis == 6:
+            first, last = self._dynamic[low], self._dynamic[high]
+        elif axis == 3:
+            first, last = 1 - self.axes[3][low], 1 - self.axes[3][high]
+        else:
+            first, last = self.axes[axis][low], self.axes[axis][high]
+        if first * last <= 0 or not math.isfinite(first * last):
+            return math.inf
+        return abs(math.log(last / first))
+
+    def _values(self, box: Box) -> Tuple[Tuple[float, ...], ...]:
+        return tuple(axis[low : high + 1] for axis, (low, high) in zip(self.axes, box))
+
+    @staticmethod
+    def _size(box: Box) -> int:
+        return math.prod(high - low + 1 for low, high in box)
+
+    def threshold(self, threshold: float) -> SearchResult:
+        """
+        Find every grid point whose intelligence exceeds a threshold.
+
+        Args:
+            threshold: Points with intelligence > threshold match
+
+        Returns:
+            SearchResult: accepted boxes, the match count and evaluations used
+        """
+        evaluations = bounds = 0
+        accepted: List[Box] = []
+        stack = [self._root()]
+        while stack:
+            box = stack.pop()
+            low, high = self._bound(box)
+            evaluations += self._cost(box)
+            bounds += 1
+            if low > threshold:
+                accepted.append(box)
+            elif high > threshold or (high != high and self._size(box) > 1):
+                stack.extend(reversed(self._split(box)))
+
+        return SearchResult(
+            grid_size=self.size,
+            evaluations=evaluations,
+            bounds=bounds,
+            threshold=threshold,
+            matches=sum(self._size(box) for box in accepted),
+            boxes=[self._values(box) for box in accepted],
+        )
+
+    def top_k(self, k: int = 10) -> SearchResult:
+        """
+        Find the k grid points with the highest intelligence (NaN ignored).
+
+        Args:
+            k: Number of points to return
+
+        Returns:
+            SearchResult: (value, point) pairs in descending order and the
+            evaluations used
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+
+        evaluations = bounds = 0
+        order = itertools.count()
+        heap: List[Tuple[float, int, float, Box]] = []
+
+        def push(box: Box) -> None:
+            nonlocal evaluations, bounds
+            high = self._bound(box)[1]
+            evaluations += self._cost(box)
+            bounds += 1
+            if high == high:
+                heapq.heappush(heap, (-high, next(order), high, box))
+            elif self._size(box) > 1:
+                # Unknown (NaN) bounds are expanded first
+                heapq.heappush(heap, (-math.inf, next(order), high, box))
+
+        push(self._root())
+        top: List[Tuple[float, Dict[str, float]]] = []
+        while heap and len(top) < k:
+            _, _, high, box = heapq.heappop(heap)
+            if self._size(box) == 1:
+                top.append((high, dict(zip(AXES, (values[0] for values in self._values(box))))))
+            else:
+                for child in self._split(box):
+                    push(child)
+
+        return SearchResult(grid_size=self.size, evaluations=evaluations, bounds=bounds, top=top)
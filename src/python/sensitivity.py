@@ -0,0 +1,217 @@
+"""
+Global sensitivity analysis (Sobol indices) for The Universal Axiom.
+
+Uses the Saltelli sampling scheme: two independent sample matrices A and B,
+plus one matrix AB_i per varying input, equal to A except for column i, which
+is taken from B. Every matrix is evaluated with ``compute_intelligence_batch``.
+The indices use the estimators of Saltelli et al. (2010) for first-order
+effects and Jansen (1999) for total effects:
+
+- S_i  = mean(f(B) · (f(AB_i) - f(A))) / Var(Y)
+- ST_i = mean((f(A) - f(AB_i))²) / (2 · Var(Y))
+
+Chunks are evaluated on a process pool with per-chunk RNG streams. Each
+chunk is reduced to sums that are merged in chunk order, so the indices do
+not depend on the worker count. n is a discrete input: give it a fixed int
+or a ``Discrete`` distribution.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from dataclasses import dataclass
+from numbers import Real
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .batch import compute_intelligence_batch, np
+from .montecarlo import _chunk_rng, _constant
+from .sweep import AXES, _run_chunks
+
+
+@dataclass(frozen=True)
+class SobolResult:
+    """First-order and total Sobol indices per input."""
+
+    samples: int
+    evaluations: int
+    workers: int
+    wall_time: float
+    mean: float
+    variance: float
+    first_order: Dict[str, float]
+    total: Dict[str, float]
+
+    def ranking(self) -> List[str]:
+        """Inputs ordered by total index, most influential first."""
+        return sorted(self.total, key=lambda name: self.total[name], reverse=True)
+
+
+def _draw(distributions: Tuple[Any, ...], rng: Any, size: int) -> List[Any]:
+    return [
+        _constant(value, size) if isinstance(value, Real) else value.sample(rng, size)
+        for value in distributions
+    ]
+
+
+def _evaluate(columns: List[Any], base_exponential: float) -> Any:
+    impulses, elements, pressures, subjectivities, purposes, times, steps = columns
+    result = compute_intelligence_batch(
+        impulses,
+        elements,
+        pressures,
+        subjectivities,
+        purposes,
+        times,
+        steps,
+        base_exponential=base_exponential,
+    )
+    return result.intelligence
+
+
+def _saltelli_chunk(
+    distributions: Tuple[Any, ...],
+    varying: Tuple[int, ...],
+    base_exponential: float,
+    seed: int,
+    chunk: int,
+    size: int,
+) -> Tuple[int, float, float, List[float], List[float]]:
+    """Evaluate one chunk; returns (count, mean, M2, first sums, total sums)."""
+    rng = _chunk_rng(seed, chunk)
+    first = _draw(distributions, rng, size)
+    second = _draw(distributions, rng, size)
+    f_a = _evaluate(first, base_exponential)
+    f_b = _evaluate(second, base_exponential)
+
+    first_sums = []
+    total_sums = []
+    for axis in varying:
+        mixed = list(first)
+        mixed[axis] = second[axis]
+        f_ab = _evaluate(mixed, base_exponential)
+        if np is not None:
+            difference = f_ab - f_a
+            first_sums.append(float(np.dot(f_b, difference)))
+            total_sums.append(float(np.dot(difference, difference)))
+        else:
+            differences = [ab - a for ab, a in zip(f_ab, f_a)]
+            first_sums.append(math.fsum(b * d for b, d in zip(f_b, differences)))
+            total_sums.append(math.fsum(d * d for d in differences))
+
+    if np is not None:
+        outputs = np.concatenate([f_a, f_b])
+        mean = float(outputs.mean())
+        m2 = float(((outputs - mean) ** 2).sum())
+    else:
+        outputs = list(f_a) + list(f_b)
+        mean = math.fsum(outputs) / len(outputs)
+        m2 = math.fsum((value - mean) ** 2 for value in outputs)
+    return len(outputs), mean, m2, first_sums, total_sums
+
+
+class SobolAnalysis:
+    """Saltelli estimator of first-order and total Sobol indices."""
+
+    def __init__(
+        self,
+        impulses: Any = 1.0,
+        elements: Any = 1.0,
+        pressure: Any = 1.0,
+        subjectivity: Any = 0.0,
+        purpose: Any = 1.0,
+        time: Any = 1.0,
+        n: Any = 1,
+        base_exponential: float = 3.0,
+    ):
+        """
+        Initialize the analysis from input distributions.
+
+        Each input is a fixed number or a distribution with a
+        ``sample(rng, size)`` method (see ``montecarlo``). Fixed inputs are
+        not sampled and get zero indices.
+        """
+        self.distributions = (impulses, elements, pressure, subjectivity, purpose, time, n)
+        for name, value in zip(AXES, self.distributions):
+            if not isinstance(value, Real) and not hasattr(value, "sample"):
+                raise ValueError(f"{name} must be a number or a distribution")
+        self.varying = tuple(
+            axis for axis, value in enumerate(self.distributions) if not isinstance(value, Real)
+        )
+        self.base_exponential = base_exponential
+
+    def run(
+        self,
+        samples: int,
+        seed: int = 0,
+        workers: Optional[int] = 1,
+        chunk_size: int = 16384,
+    ) -> SobolResult:
+        """
+        Estimate the indices from ``samples`` base rows.
+
+        The model is evaluated ``samples * (k + 2)`` times for k varying
+        inputs.
+
+        Args:
+            samples: Rows in each of the A and B matrices
+            seed: Seed of the per-chunk RNG streams
+            workers: Worker processes (None = CPU count, 1 = in-process)
+            chunk_size: Rows per chunk
+
+        Returns:
+            SobolResult: Indices keyed by input name
+        """
+        if samples < 2 or chunk_size < 1:
+            raise ValueError("samples must be at least 2 and chunk_size positive")
+        workers = workers or os.cpu_count() or 1
+
+        starts = range(0, samples, chunk_size)
+        tasks = (
+            (
+                self.distributions,
+                self.varying,
+                self.base_exponential,
+                seed,
+                chunk,
+                min(chunk_size, samples - start),
+            )
+            for chunk, start in enumerate(starts)
+        )
+
+        # Chunk results are merged in index order so they do not depend on workers
+        count, mean, m2 = 0, 0.0, 0.0
+        first_sums = [0.0] * len(self.varying)
+        total_sums = [0.0] * len(self.varying)
+        started = perf_counter()
+        for _, partial in _run_chunks(_saltelli_chunk, tasks, workers):
+            size, chunk_mean, chunk_m2, firsts, totals = partial
+            merged = count + size
+            delta = chunk_mean - mean
+            mean += delta * size / merged
+            m2 += chunk_m2 + delta * delta * count * size / merged
+            count = merged
+            for slot in range(len(firsts)):
+                first_sums[slot] += firsts[slot]
+                total_sums[slot] += totals[slot]
+        wall_time = perf_counter() - started
+
+        variance = m2 / (count - 1)
+        first_order = dict.fromkeys(AXES, 0.0)
+        total = dict.fromkeys(AXES, 0.0)
+        if variance > 0:
+            for slot, axis in enumerate(self.varying):
+                first_order[AXES[axis]] = first_sums[slot] / samples / variance
+                total[AXES[axis]] = total_sums[slot] / (2 * samples) / variance
+
+        return SobolResult(
+            samples=samples,
+            evaluations=samples * (len(self.varying) + 2),
+            workers=workers,
+            wall_time=wall_time,
+            mean=mean,
+            variance=variance,
+            first_order=first_order,
+            total=total,
+        )
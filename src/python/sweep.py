@@ -0,0 +1,332 @@
+"""
+Parallel parameter sweeps over the seven axiom variables.
+
+A sweep is the Cartesian grid of per-variable value ranges for
+(A, B, C, X, Y, Z, n). The flat grid index space is split into chunks that
+are evaluated with ``compute_intelligence_batch`` on a process pool, and each
+chunk is reduced in the worker (full values, top-k or histogram) so the parent
+only merges small partial results as they stream back.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+from array import array
+from bisect import bisect_right
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from enum import Enum
+from numbers import Real
+from time import perf_counter, process_time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .batch import compute_intelligence_batch, np
+
+AXES = ("impulses", "elements", "pressure", "subjectivity", "purpose", "time", "n")
+
+
+class SweepReduction(Enum):
+    """How evaluated chunks are reduced before returning to the parent."""
+
+    FULL = "full"
+    TOP_K = "top_k"
+    HISTOGRAM = "histogram"
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """Reduced sweep output with timing and parallel efficiency."""
+
+    reduction: SweepReduction
+    points: int
+    chunks: int
+    workers: int
+    wall_time: float
+    busy_time: float
+    values: Any = None
+    top: Optional[List[Tuple[float, Dict[str, float]]]] = None
+    counts: Optional[List[int]] = None
+    edges: Optional[List[float]] = None
+
+    @property
+    def parallel_efficiency(self) -> float:
+        """Worker CPU time divided by wall time times worker count (0-1)."""
+        if self.wall_time <= 0:
+            return 1.0
+        return self.busy_time / (self.wall_time * self.workers)
+
+    @property
+    def points_per_second(self) -> float:
+        """Sweep throughput."""
+        return self.points / self.wall_time if self.wall_time > 0 else float("inf")
+
+
+def _chunk_indices(shape: Tuple[int, ...], start: int, stop: int) -> List[Any]:
+    """Per-axis grid coordinates for flat indices [start, stop) in C order."""
+    if np is not None:
+        return list(np.unravel_index(np.arange(start, stop), shape))
+
+    coordinates: List[List[int]] = [[] for _ in shape]
+    for flat in range(start, stop):
+        for axis in range(len(shape) - 1, -1, -1):
+            flat, coordinate = divmod(flat, shape[axis])
+            coordinates[axis].append(coordinate)
+    return coordinates
+
+
+def _evaluate_chunk(
+    axes: Tuple[Tuple[float, ...], ...],
+    start: int,
+    stop: int,
+    reduction: SweepReduction,
+    k: int,
+    edges: Tuple[float, ...],
+    base_exponential: float,
+) -> Tuple[Any, float]:
+    """Evaluate and reduce one chunk of the grid; returns (payload, CPU seconds)."""
+    started = process_time()
+    shape = tuple(len(axis) for axis in axes)
+    coordinates = _chunk_indices(shape, start, stop)
+
+    if np is not None:
+        columns = [np.asarray(axis)[index] for axis, index in zip(axes, coordinates)]
+    else:
+        columns = [[axis[i] for i in index] for axis, index in zip(axes, coordinates)]
+    impulses, elements, pressure, subjectivity, purpose, time, n = columns
+    values = compute_intelligence_batch(
+        impulses,
+        elements,
+        pressure,
+        subjectivity,
+        purpose,
+        time,
+        n,
+        base_exponential=base_exponential,
+    ).intelligence
+
+    if reduction is SweepReduction.FULL:
+        payload: Any = values
+    elif reduction is SweepReduction.TOP_K:
+        payload = _top_k(values, start, k)
+    else:
+        payload = _histogram(values, edges)
+
+    return payload, process_time() - started
+
+
+def _top_k(values: Any, start: int, k: int) -> List[Tuple[float, int]]:
+    """The k largest (value, flat index) pairs of a chunk, ignoring NaN."""
+    if np is not None:
+        offsets = np.flatnonzero(values == values)
+        if len(offsets) > k:
+            offsets = offsets[np.argpartition(values[offsets], len(offsets) - k)[-k:]]
+        ranked = ((float(values[offset]), start + int(offset)) for offset in offsets)
+    else:
+        ranked = ((value, start + offset) for offset, value in enumerate(values) if value == value)
+    return heapq.nlargest(k, ranked)
+
+
+def _histogram(values: Any, edges: Sequence[float]) -> List[int]:
+    """Count values per bin; the last bin includes its right edge, NaN is dropped."""
+    counts: List[int]
+    if np is not None:
+        counts = np.histogram(values, bins=np.asarray(edges))[0].tolist()
+        return counts
+
+    counts = [0] * (len(edges) - 1)
+    last = edges[-1]
+    for value in values:
+        if value == last:
+            counts[-1] += 1
+            continue
+        slot = bisect_right(edges, value) - 1
+        if 0 <= slot < len(counts):
+            counts[slot] += 1
+    return counts
+
+
+def _stream(
+    executor: Executor, function: Callable, tasks: Iterable[Tuple], max_in_flight: int
+) -> Iterator[Tuple[Tuple, Any]]:
+    """
+    Yield (task, result) pairs in task order.
+
+    At most ``max_in_flight`` chunks are queued or held back at a time.
+    Chunks that finish early wait for the earlier ones.
+    """
+    pending: Dict[Future, Tuple[int, Tuple]] = {}
+    finished: Dict[int, Tuple[Tuple, Any]] = {}
+    next_chunk = 0
+
+    def settle(limit: int) -> Iterator[Tuple[Tuple, Any]]:
+        nonlocal next_chunk
+        while len(pending) + len(finished) > limit:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk, task = pending.pop(future)
+                finished[chunk] = (task, future.result())
+            while next_chunk in finished:
+                yield finished.pop(next_chunk)
+                next_chunk += 1
+
+    for chunk, task in enumerate(tasks):
+        pending[executor.submit(function, *task)] = (chunk, task)
+        yield from settle(max_in_flight - 1)
+    yield from settle(0)
+
+
+def _run_chunks(
+    function: Callable, tasks: Iterable[Tuple], workers: int
+) -> Iterator[Tuple[Tuple, Any]]:
+    """
+    Yield (task, function(*task)) pairs in task order.
+
+    With more than one worker the chunks run on a process pool. Results come
+    back in the same order either way, so reductions folded over them do not
+    depend on the worker count.
+    """
+    if workers == 1:
+        for task in tasks:
+            yield task, function(*task)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _stream(executor, function, tasks, workers * 2)
+
+
+class ParameterSweep:
+    """Cartesian grid over the seven axiom variables."""
+
+    def __init__(
+        self,
+        impulses: Any = 1.0,
+        elements: Any = 1.0,
+        pressure: Any = 1.0,
+        subjectivity: Any = 0.0,
+        purpose: Any = 1.0,
+        time: Any = 1.0,
+        n: Any = 1,
+        base_exponential: float = 3.0,
+    ):
+        """
+        Initialize the grid from per-variable values.
+
+        Each argument is a scalar (fixed value) or a sequence of values
+        (e.g. ``range(1, 101)`` for n).
+        """
+        ranges = (impulses, elements, pressure, subjectivity, purpose, time, n)
+        self.axes: Tuple[Tuple[Any, ...], ...] = tuple(
+            (value,) if isinstance(value, Real) else tuple(value) for value in ranges
+        )
+        if any(len(axis) == 0 for axis in self.axes):
+            raise ValueError("Every sweep variable needs at least one value")
+        self.base_exponential = base_exponential
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Number of values per variable, in AXES order."""
+        return tuple(len(axis) for axis in self.axes)
+
+    @property
+    def size(self) -> int:
+        """Total number of grid points."""
+        size = 1
+        for length in self.shape:
+            size *= length
+        return size
+
+    def point(self, index: int) -> Dict[str, float]:
+        """Variable values at a flat grid index."""
+        if not 0 <= index < self.size:
+            raise IndexError("sweep index out of range")
+        coordinates = []
+        for length in reversed(self.shape):
+            index, coordinate = divmod(index, length)
+            coordinates.append(coordinate)
+        coordinates.reverse()
+        return {name: axis[i] for name, axis, i in zip(AXES, self.axes, coordinates)}
+
+    def run(
+        self,
+        reduction: Any = SweepReduction.FULL,
+        k: int = 10,
+        bins: Optional[Sequence[float]] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 65536,
+    ) -> SweepResult:
+        """
+        Evaluate the grid in chunks and reduce the results.
+
+        Args:
+            reduction: "full", "top_k" or "histogram"
+            k: Number of best points kept by top_k
+            bins: Histogram bin edges (required for histogram)
+            workers: Worker processes (None = CPU count, 1 = in-process)
+            chunk_size: Grid points per chunk
+
+        Returns:
+            SweepResult: Reduced values with timing statistics
+        """
+        reduction = SweepReduction(reduction)
+        edges = tuple(bins) if bins is not None else ()
+        if reduction is SweepReduction.HISTOGRAM and len(edges) < 2:
+            raise ValueError("histogram sweeps need at least two bin edges")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        workers = workers or os.cpu_count() or 1
+
+        total = self.size
+        starts = range(0, total, chunk_size)
+        tasks = (
+            (
+                self.axes,
+                start,
+                min(start + chunk_size, total),
+                reduction,
+                k,
+                edges,
+                self.base_exponential,
+            )
+            for start in starts
+        )
+
+        if reduction is SweepReduction.FULL:
+            merged: Any = np.empty(total) if np is not None else array("d", bytes(8 * total))
+        elif reduction is SweepReduction.TOP_K:
+            merged = []
+        else:
+            merged = [0] * (len(edges) - 1)
+
+        busy_time = 0.0
+        started = perf_counter()
+        for task, (payload, elapsed) in _run_chunks(_evaluate_chunk, tasks, workers):
+            busy_time += elapsed
+            merged = self._merge(reduction, merged, task[1], payload, k)
+        wall_time = perf_counter() - started
+
+        result = dict(
+            reduction=reduction,
+            points=total,
+            chunks=len(starts),
+            workers=workers,
+            wall_time=wall_time,
+            busy_time=busy_time,
+        )
+        if reduction is SweepReduction.FULL:
+            return SweepResult(values=merged, **result)
+        if reduction is SweepReduction.TOP_K:
+            top = [(value, self.point(index)) for value, index in sorted(merged, reverse=True)]
+            return SweepResult(top=top, **result)
+        return SweepResult(counts=merged, edges=list(edges), **result)
+
+    @staticmethod
+    def _merge(reduction: SweepReduction, merged: Any, start: int, payload: Any, k: int) -> Any:
+        """Fold one reduced chunk into the running result."""
+        if reduction is SweepReduction.FULL:
+            merged[start : start + len(payload)] = payload
+            return merged
+        if reduction is SweepReduction.TOP_K:
+            return heapq.nlargest(k, merged + payload)
+        for slot, count in enumerate(payload):
+            merged[slot] += count
+        return merged
@@ -8,8 +8,13 @@ Dynamic Layer: Exponential Growth (E_n), Fibonacci Sequence (F_n)
 Cognitive Layer: Subjectivity Scale (X), Why Axis (Y), TimeSphere (Z)
 """
 
-from typing import Dict, List
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache, total_ordering
+from operator import itemgetter
+import math
 import sys
 
 # Maximum allowed value for n to prevent overflow
@@ -21,11 +26,227 @@ MAX_N = 100
 # Maximum safe value to prevent overflow
 MAX_SAFE_VALUE = sys.float_info.max / 2
 
+# Largest n for which log(1 + F_n) is taken from the exact Fibonacci number.
+# Beyond it Binet's formula is exact to double precision.
+FIB_EXACT_LIMIT = 1400
+
+# Runs up to this length are summed step by step in repeated_add()
+REPEATED_ADD_LOOP_LIMIT = 8
+
+LOG_PHI = math.log((1 + math.sqrt(5)) / 2)
+LOG_SQRT5 = 0.5 * math.log(5)
+
+
+@total_ordering
+@dataclass(frozen=True)
+class LogValue:
+    """
+    Signed value stored as (sign, log|value|) so it never overflows.
+
+    Instances order like the real numbers they represent.
+    """
+
+    sign: int  # -1, 0 or +1
+    log_abs: float  # log|value| (-inf for zero)
+
+    @classmethod
+    def from_float(cls, value: float) -> "LogValue":
+        """Convert a linear value to log form"""
+        if value == 0:
+            return cls(0, -math.inf)
+        return cls(1 if value > 0 else -1, math.log(abs(value)))
+
+    def __mul__(self, other: "LogValue") -> "LogValue":
+        sign = self.sign * other.sign
+        if sign == 0:
+            return LogValue(0, -math.inf)
+        return LogValue(sign, self.log_abs + other.log_abs)
+
+    def __lt__(self, other: "LogValue") -> bool:
+        return self.sort_key() < other.sort_key()
+
+    def sort_key(self) -> Tuple[int, float]:
+        """Key that sorts log values in the order of their linear values"""
+        if self.sign == 0:
+            return (0, 0.0)
+        return (self.sign, self.sign * self.log_abs)
+
+    def to_float(self) -> float:
+        """Convert back to a linear float (may overflow to +/-inf)"""
+        if self.sign == 0:
+            return 0.0
+        try:
+            return self.sign * math.exp(self.log_abs)
+        except OverflowError:
+            return self.sign * math.inf
+
+
+def repeated_add(x: float, delta: float, count: int) -> float:
+    """
+    Return the float reached by adding delta to x count times.
+
+    Matches ``for _ in range(count): x += delta`` bit for bit, rounding
+    included, but jumps over each run of identically rounded additions, so
+    the cost grows with the number of binades crossed rather than with count.
+    """
+    if count <= REPEATED_ADD_LOOP_LIMIT:
+        # Short runs are cheaper to add directly than to analyze
+        for _ in range(count):
+            x += delta
+        return x
+    if x < 0 or (x == 0 and delta < 0):
+        return -repeated_add(-x, -delta, count)
+
+    while count > 0:
+        if not (math.isfinite(x) and math.isfinite(delta)):
+            return x + delta
+        if x < 2.0 * sys.float_info.min:
+            # Zero and subnormal values: single rounded steps
+            x = x + delta
+            count -= 1
+            if x < 0:
+                return -repeated_add(-x, -delta, count)
+            continue
+
+        mantissa, exponent = math.frexp(x)
+        if abs(delta) >= x or (mantissa == 0.5 and delta < 0):
+            # The sum leaves the binade, or below a power of two it rounds to
+            # the finer grid of the lower binade: take the rounded step
+            # explicitly (a step that does not move x never will)
+            step = x + delta
+            count -= 1
+            if step == x:
+                return x
+            x = step
+            if x < 0:
+                return -repeated_add(-x, -delta, count)
+            continue
+
+        ulp = math.ulp(x)
+        quotient = delta / ulp
+        position = int(x / ulp)
+        units = math.floor(quotient)
+        if quotient - units == 0.5:
+            # Ties round to even: from an odd position take one step, then
+            # every sum adds the even one of units and units + 1
+            if position % 2:
+                x = x + delta
+                count -= 1
+                continue
+            units += units % 2
+        else:
+            units = round(quotient)
+        if units == 0:
+            return x
+
+        # Inside the binade [2^(e-1), 2^e) every sum rounds to x + units · ulp
+        # while the result stays at least one ulp clear of the binade edges
+        low = int(math.ldexp(1.0, exponent - 1) / ulp) + 1
+        high = int(math.ldexp(1.0, exponent) / ulp) - 1
+        if units > 0:
+            jumps = (high - position) // units
+        else:
+            jumps = (position - low) // -units
+        jumps = max(0, min(jumps, count))
+        x = (position + jumps * units) * ulp
+        count -= jumps
+
+        if count > 0:
+            # Crossing a binade edge: take the rounded step explicitly
+            x = x + delta
+            count -= 1
+            if x < 0:
+                return -repeated_add(-x, -delta, count)
+    return x
+
+
+def fibonacci_fast_doubling(n: int) -> int:
+    """
+    F_n of the dynamic layer (F_1 = 1, F_2 = 2, F_3 = 3, ...) in O(log n) steps.
+
+    Uses the fast-doubling identities on the standard sequence, where the
+    dynamic layer's F_n is the standard Fib(n + 1).
+    """
+    if n <= 1:
+        return 1
+
+    a, b = 0, 1  # Fib(0), Fib(1)
+    for bit in bin(n + 1)[2:]:
+        c = a * (2 * b - a)  # Fib(2k)
+        d = a * a + b * b  # Fib(2k + 1)
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
+
+
+def log_fibonacci_term(n: int) -> float:
+    """log(1 + F_n) without overflow for arbitrarily large n"""
+    if n <= FIB_EXACT_LIMIT:
+        return math.log(1 + fibonacci_fast_doubling(n))
+    # Binet: Fib(n + 1) = phi^(n + 1) / sqrt(5), with a negligible remainder
+    return (n + 1) * LOG_PHI - LOG_SQRT5
+
+
+def log_exponential_term(n: int, base_exponential: float = 3.0) -> LogValue:
+    """E_n = 2 · base^n - 1 in log form without overflow"""
+    if base_exponential == 0:
+        return LogValue(-1, 0.0)
+
+    # t = log|2 · base^n|
+    t = math.log(2) + n * math.log(abs(base_exponential))
+    if base_exponential < 0 and n % 2 == 1:
+        # E_n = -(e^t + 1)
+        return LogValue(-1, t + math.log1p(math.exp(-t)) if t > 0 else math.log1p(math.exp(t)))
+    if t == 0:
+        return LogValue(0, -math.inf)
+    if t > 0:
+        # E_n = e^t - 1 > 0
+        return LogValue(1, t + math.log1p(-math.exp(-t)))
+    # E_n = e^t - 1 < 0
+    return LogValue(-1, math.log(-math.expm1(t)))
+
+
+# Plain attribute assignment, bypassing _FieldLayer.__setattr__
+_set_attribute = object.__setattr__
+
+
+class _CachedLayer:
+    """Base for layers that cache their product until their state changes"""
+
+    __slots__ = ("_product",)
+
+    _product: Optional[float]  # None until computed and after every change
+
+    def compute(self) -> float:
+        raise NotImplementedError
+
+    def product(self) -> float:
+        """Layer product, recomputed only after the layer has changed"""
+        product = self._product
+        if product is None:
+            product = self.compute()
+            _set_attribute(self, "_product", product)
+        return product
+
+
+class _FieldLayer(_CachedLayer):
+    """Cached layer with plain fields: every attribute write clears the product"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        _set_attribute(self, name, value)
+        _set_attribute(self, "_product", None)
+
 
 @dataclass
-class FoundationLayer:
+class FoundationLayer(_FieldLayer):
     """Foundation Layer: A · B · C"""
 
+    __slots__ = ("impulses", "elements", "pressure")
+
     impulses: float  # A - Fundamental drives
     elements: float  # B - Core components
     pressure: float  # C - Constraints and forces
@@ -35,9 +256,76 @@ class FoundationLayer:
         return self.impulses * self.elements * self.pressure
 
 
-class DynamicLayer:
+class DynamicTable(NamedTuple):
+    """Precomputed E_n, F_n and E_n · (1 + F_n) values indexed by n in [0, MAX_N]"""
+
+    exponential: Tuple[float, ...]
+    fibonacci: Tuple[int, ...]
+    product: Tuple[float, ...]
+
+
+@lru_cache(maxsize=8, typed=True)
+def dynamic_table(base_exponential: float = 3.0) -> DynamicTable:
+    """
+    Build (or fetch) the shared dynamic layer table for a base.
+
+    Tables are immutable and shared by every DynamicLayer with the same
+    base_exponential; int and float bases get separate tables, as their
+    powers round differently. E_n, F_n and the product each saturate at
+    MAX_SAFE_VALUE (NaN included).
+
+    Since the table covers every n up front, a float base whose power
+    overflows saturates E_n at MAX_SAFE_VALUE, as an int base always has,
+    instead of raising OverflowError when that n is evaluated.
+
+    Args:
+        base_exponential: Base for exponential growth
+
+    Returns:
+        DynamicTable: Values for every n in [0, MAX_N]
+    """
+    exponential = []
+    fibonacci = []
+    product = []
+
+    a, b = 1, 1
+    fib_saturated = False
+    for n in range(MAX_N + 1):
+        try:
+            E_n = (2 * (base_exponential**n)) - 1
+        except OverflowError:
+            E_n = MAX_SAFE_VALUE
+        if E_n > MAX_SAFE_VALUE or E_n != E_n:  # NaN check
+            E_n = MAX_SAFE_VALUE
+
+        if n <= 1:
+            F_n = 1
+        else:
+            if not fib_saturated:
+                next_val = a + b
+                if next_val > MAX_SAFE_VALUE:
+                    fib_saturated = True
+                else:
+                    a, b = b, next_val
+            F_n = int(MAX_SAFE_VALUE) if fib_saturated else b
+
+        value = E_n * (1 + F_n)
+        if value > MAX_SAFE_VALUE or value != value:  # NaN check
+            value = MAX_SAFE_VALUE
+
+        exponential.append(E_n)
+        fibonacci.append(F_n)
+        product.append(value)
+
+    return DynamicTable(tuple(exponential), tuple(fibonacci), tuple(product))
+
+
+class DynamicLayer(_CachedLayer):
     """Dynamic Layer: E_n · (1 + F_n)"""
 
+    # State changes only through the setters below, which clear the product
+    __slots__ = ("_n", "_steps", "_base_exponential", "_table")
+
     def __init__(self, n: int = 1, base_exponential: float = 3.0):
         """
         Initialize DynamicLayer with validated n.
@@ -46,7 +334,7 @@ class DynamicLayer:
             n: Current iteration/step (will be clamped to [1, MAX_N])
             base_exponential: Base for exponential growth
         """
-        self._n = max(1, min(MAX_N, int(n)))
+        self.n = n
         self.base_exponential = base_exponential
 
     @property
@@ -57,45 +345,58 @@ class DynamicLayer:
     @n.setter
     def n(self, value: int) -> None:
         """Set iteration step with validation"""
-        self._n = max(1, min(MAX_N, int(value)))
+        self._steps = max(1, int(value))
+        self._n = min(MAX_N, self._steps)
+        self._product = None
+
+    @property
+    def steps(self) -> int:
+        """Get unclamped iteration step (used by the log-space mode)"""
+        return self._steps
+
+    @property
+    def base_exponential(self) -> float:
+        """Get base for exponential growth"""
+        return self._base_exponential
+
+    @base_exponential.setter
+    def base_exponential(self, value: float) -> None:
+        """Set base for exponential growth and bind its shared table"""
+        self._base_exponential = value
+        self._table = dynamic_table(value)
+        self._product = None
 
     def exponential_growth(self) -> float:
         """E_n - Exponential growth component with overflow protection"""
-        result = (2 * (self.base_exponential ** self._n)) - 1
-        # Return MAX_SAFE_VALUE if overflow would occur
-        if result > MAX_SAFE_VALUE or result != result:  # NaN check
-            return MAX_SAFE_VALUE
-        return result
+        return self._table.exponential[self._n]
 
     def fibonacci(self) -> int:
         """F_n - Fibonacci sequence for natural regulation with overflow protection"""
-        if self._n <= 1:
-            return 1
-
-        a, b = 1, 1
-        for _ in range(2, self._n + 1):
-            next_val = a + b
-            # Check for overflow
-            if next_val > MAX_SAFE_VALUE:
-                return int(MAX_SAFE_VALUE)
-            a, b = b, next_val
-        return b
+        return self._table.fibonacci[self._n]
 
     def compute(self) -> float:
         """Compute dynamic layer: E_n · (1 + F_n) with overflow protection"""
-        E_n = self.exponential_growth()
-        F_n = self.fibonacci()
-        result = E_n * (1 + F_n)
-        # Return MAX_SAFE_VALUE if overflow would occur
-        if result > MAX_SAFE_VALUE or result != result:  # NaN check
-            return MAX_SAFE_VALUE
-        return result
+        return self._table.product[self._n]
+
+    def compute_log(self) -> LogValue:
+        """
+        Compute log(E_n · (1 + F_n)) and its sign at the unclamped step.
+
+        No MAX_N or MAX_SAFE_VALUE ceiling applies; cost is O(log n).
+
+        Returns:
+            LogValue: Sign and log magnitude of the dynamic layer
+        """
+        E_n = log_exponential_term(self._steps, self.base_exponential)
+        return E_n * LogValue(1, log_fibonacci_term(self._steps))
 
 
 @dataclass
-class CognitiveLayer:
+class CognitiveLayer(_FieldLayer):
     """Cognitive Layer: X · Y · Z"""
 
+    __slots__ = ("subjectivity", "purpose", "time")
+
     subjectivity: (
         float  # X - Objectivity measure (0 = fully objective, 1 = fully subjective)
     )
@@ -109,13 +410,77 @@ class CognitiveLayer:
         return objectivity * self.purpose * self.time
 
 
+class AxiomState(NamedTuple):
+    """
+    Flat, immutable snapshot of a UniversalAxiom.
+
+    Every quantity is computed once when the snapshot is taken. Field names
+    follow the get_state() keys (layer products are prefixed with the layer
+    name), and the nested get_state() dictionary is only built on demand by
+    to_dict(). As a tuple it can be stored or written in bulk directly.
+    """
+
+    n: int
+    A_impulses: float
+    B_elements: float
+    C_pressure: float
+    foundation_product: float
+    E_n: float
+    F_n: int
+    dynamic_product: float
+    X_subjectivity: float
+    X_objectivity: float
+    Y_purpose: float
+    Z_time: float
+    cognitive_product: float
+    intelligence: float
+
+    def to_dict(self) -> Dict:
+        """
+        Materialize the nested dictionary returned by get_state()
+
+        Returns:
+            Dict: Complete state dictionary
+        """
+        return {
+            "n": self.n,
+            "foundation": {
+                "A_impulses": self.A_impulses,
+                "B_elements": self.B_elements,
+                "C_pressure": self.C_pressure,
+                "product": self.foundation_product,
+            },
+            "dynamic": {
+                "E_n": self.E_n,
+                "F_n": self.F_n,
+                "product": self.dynamic_product,
+            },
+            "cognitive": {
+                "X_subjectivity": self.X_subjectivity,
+                "X_objectivity": self.X_objectivity,
+                "Y_purpose": self.Y_purpose,
+                "Z_time": self.Z_time,
+                "product": self.cognitive_product,
+            },
+            "intelligence": self.intelligence,
+        }
+
+
 class UniversalAxiom:
     """
     The Universal Axiom - Complete Intelligence Model
 
     Intelligence_n = E_n · (1 + F_n) · X · Y · Z · (A · B · C)
+
+    Layer products are cached between evaluations by the layers themselves.
+    Any write to a layer attribute clears that layer's cached product, so only
+    the layers changed since the last call are recomputed, whether the edit
+    comes from a mutator, ``axiom.foundation.pressure = 2.0`` or a layer
+    reference held across calls.
     """
 
+    __slots__ = ("_foundation", "_dynamic", "_cognitive")
+
     def __init__(
         self,
         impulses: float = 1.0,
@@ -138,29 +503,108 @@ class UniversalAxiom:
             time: Z - Temporal factor (default: 1.0)
             n: Current iteration step (default: 1)
         """
-        self.foundation = FoundationLayer(impulses, elements, pressure)
-        self.dynamic = DynamicLayer(n=n)
-        self.cognitive = CognitiveLayer(subjectivity, purpose, time)
-        self.n = max(1, min(MAX_N, int(n)))
+        self._foundation = FoundationLayer(impulses, elements, pressure)
+        self._dynamic = DynamicLayer(n=n)
+        self._cognitive = CognitiveLayer(subjectivity, purpose, time)
+
+    @property
+    def foundation(self) -> FoundationLayer:
+        """Foundation layer (A · B · C)"""
+        return self._foundation
+
+    @foundation.setter
+    def foundation(self, layer: FoundationLayer) -> None:
+        self._foundation = layer
+
+    @property
+    def dynamic(self) -> DynamicLayer:
+        """Dynamic layer (E_n · (1 + F_n))"""
+        return self._dynamic
+
+    @dynamic.setter
+    def dynamic(self, layer: DynamicLayer) -> None:
+        self._dynamic = layer
+
+    @property
+    def cognitive(self) -> CognitiveLayer:
+        """Cognitive layer (X · Y · Z)"""
+        return self._cognitive
+
+    @cognitive.setter
+    def cognitive(self, layer: CognitiveLayer) -> None:
+        self._cognitive = layer
+
+    @property
+    def n(self) -> int:
+        """Get current iteration step (stored on the dynamic layer)"""
+        return self._dynamic.n
+
+    @n.setter
+    def n(self, value: int) -> None:
+        """Set iteration step with validation"""
+        self._dynamic.n = value
 
     def compute_intelligence(self) -> float:
         """
         Compute Intelligence_n = E_n · (1 + F_n) · X · Y · Z · (A · B · C)
 
+        Layer products are cached; only layers changed since the last call
+        are recomputed before the final multiply.
+
         Returns:
             float: The computed intelligence value
         """
-        foundation_value = self.foundation.compute()
-        dynamic_value = self.dynamic.compute()
-        cognitive_value = self.cognitive.compute()
+        foundation = self._foundation
+        foundation_value = foundation._product
+        if foundation_value is None:
+            foundation_value = foundation.compute()
+            _set_attribute(foundation, "_product", foundation_value)
+
+        dynamic = self._dynamic
+        dynamic_value = dynamic._product
+        if dynamic_value is None:
+            dynamic_value = dynamic.compute()
+            _set_attribute(dynamic, "_product", dynamic_value)
+
+        cognitive = self._cognitive
+        cognitive_value = cognitive._product
+        if cognitive_value is None:
+            cognitive_value = cognitive.compute()
+            _set_attribute(cognitive, "_product", cognitive_value)
 
         intelligence = dynamic_value * cognitive_value * foundation_value
         return intelligence
 
+    def compute_log_intelligence(self) -> LogValue:
+        """
+        Compute log|Intelligence_n| and its sign without overflow.
+
+        The dynamic layer is evaluated at the unclamped step count, so agents
+        evolved past MAX_N remain distinguishable. Results compare and sort in
+        the same order as the intelligence values they represent.
+
+        Returns:
+            LogValue: Sign and log magnitude of intelligence
+        """
+        foundation = self._foundation
+        cognitive = self._cognitive
+        log_value = self._dynamic.compute_log()
+        for factor in (
+            1 - cognitive.subjectivity,
+            cognitive.purpose,
+            cognitive.time,
+            foundation.impulses,
+            foundation.elements,
+            foundation.pressure,
+        ):
+            log_value = log_value * LogValue.from_float(factor)
+        return log_value
+
     def evolve(self, delta_time: float = 1.0) -> float:
         """
         Evolve the system forward in time
-        Note: n is clamped to MAX_N to prevent overflow
+        Note: n is clamped to MAX_N to prevent overflow; the unclamped step
+        count is kept on the dynamic layer for compute_log_intelligence()
 
         Args:
             delta_time: Time step increment
@@ -168,12 +612,44 @@ class UniversalAxiom:
         Returns:
             float: New intelligence value after evolution
         """
-        self.n = min(self.n + 1, MAX_N)
-        self.dynamic.n = self.n
-        self.cognitive.time += delta_time
+        self._dynamic.n = self._dynamic.steps + 1
+        self._cognitive.time += delta_time
+
+        return self.compute_intelligence()
+
+    def evolve_by(self, steps: int, delta_time: float = 1.0) -> float:
+        """
+        Evolve the system forward by several steps at once
+
+        Equivalent to calling evolve(delta_time) steps times, including n
+        saturating at MAX_N and the rounding of the accumulated time, but
+        without evaluating the intermediate states.
+
+        Args:
+            steps: Number of evolution steps (>= 0)
+            delta_time: Time step increment per step
+
+        Returns:
+            float: New intelligence value after evolution
+        """
+        self.advance(steps, delta_time)
 
         return self.compute_intelligence()
 
+    def advance(self, steps: int, delta_time: float = 1.0) -> None:
+        """
+        Move n and time forward like evolve_by, without evaluating intelligence
+
+        Args:
+            steps: Number of evolution steps (>= 0)
+            delta_time: Time step increment per step
+        """
+        if steps < 0:
+            raise ValueError("steps must be non-negative")
+        if steps:
+            self._dynamic.n = self._dynamic.steps + steps
+            self._cognitive.time = repeated_add(self._cognitive.time, delta_time, steps)
+
     def apply_pressure(self, pressure_delta: float) -> float:
         """
         Apply pressure change (e.g., from contradictions or constraints)
@@ -184,9 +660,9 @@ class UniversalAxiom:
         Returns:
             float: New intelligence value after pressure application
         """
-        self.foundation.pressure += pressure_delta
+        foundation = self._foundation
         # Ensure pressure stays positive
-        self.foundation.pressure = max(0.01, self.foundation.pressure)
+        foundation.pressure = max(0.01, foundation.pressure + pressure_delta)
 
         return self.compute_intelligence()
 
@@ -200,9 +676,9 @@ class UniversalAxiom:
         Returns:
             float: New intelligence value after adjustment
         """
-        self.cognitive.subjectivity += subjectivity_delta
+        cognitive = self._cognitive
         # Clamp between 0 and 1
-        self.cognitive.subjectivity = max(0.0, min(1.0, self.cognitive.subjectivity))
+        cognitive.subjectivity = max(0.0, min(1.0, cognitive.subjectivity + subjectivity_delta))
 
         return self.compute_intelligence()
 
@@ -216,11 +692,39 @@ class UniversalAxiom:
         Returns:
             float: New intelligence value after purpose adjustment
         """
-        self.cognitive.purpose *= purpose_multiplier
-        self.cognitive.purpose = max(0.01, self.cognitive.purpose)
+        cognitive = self._cognitive
+        cognitive.purpose = max(0.01, cognitive.purpose * purpose_multiplier)
 
         return self.compute_intelligence()
 
+    def snapshot(self) -> AxiomState:
+        """
+        Take a single-pass snapshot of all variables and layer products
+
+        Returns:
+            AxiomState: Flat state that converts to the get_state() shape
+        """
+        intelligence = self.compute_intelligence()
+        foundation = self._foundation
+        dynamic = self._dynamic
+        cognitive = self._cognitive
+        return AxiomState(
+            dynamic.n,
+            foundation.impulses,
+            foundation.elements,
+            foundation.pressure,
+            foundation.product(),
+            dynamic.exponential_growth(),
+            dynamic.fibonacci(),
+            dynamic.product(),
+            cognitive.subjectivity,
+            1 - cognitive.subjectivity,
+            cognitive.purpose,
+            cognitive.time,
+            cognitive.product(),
+            intelligence,
+        )
+
     def get_state(self) -> Dict:
         """
         Get current state of all variables
@@ -228,101 +732,381 @@ class UniversalAxiom:
         Returns:
             Dict: Complete state dictionary
         """
-        return {
-            "n": self.n,
-            "foundation": {
-                "A_impulses": self.foundation.impulses,
-                "B_elements": self.foundation.elements,
-                "C_pressure": self.foundation.pressure,
-                "product": self.foundation.compute(),
-            },
-            "dynamic": {
-                "E_n": self.dynamic.exponential_growth(),
-                "F_n": self.dynamic.fibonacci(),
-                "product": self.dynamic.compute(),
-            },
-            "cognitive": {
-                "X_subjectivity": self.cognitive.subjectivity,
-                "X_objectivity": 1 - self.cognitive.subjectivity,
-                "Y_purpose": self.cognitive.purpose,
-                "Z_time": self.cognitive.time,
-                "product": self.cognitive.compute(),
-            },
-            "intelligence": self.compute_intelligence(),
-        }
+        return self.snapshot().to_dict()
+
+    def save(self, target) -> None:
+        """Write a binary checkpoint (see ``checkpoint``) to a path or binary file"""
+        from .checkpoint import save
+
+        save(self, target)
+
+    @classmethod
+    def load(cls, source) -> "UniversalAxiom":
+        """Restore an axiom from a binary checkpoint path or file"""
+        from .checkpoint import load
+
+        return load(source, cls)
 
     def __repr__(self) -> str:
-        state = self.get_state()
-        return f"UniversalAxiom(n={self.n}, Intelligence={state['intelligence']:.4f})"
+        return f"UniversalAxiom(n={self.n}, Intelligence={self.compute_intelligence():.4f})"
+
+
+# Columns stored by ColumnarHistory (name, array typecode). F_n and
+# X_objectivity are derived from n and X_subjectivity when states are read.
+HISTORY_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("n", "q"),
+    ("A_impulses", "d"),
+    ("B_elements", "d"),
+    ("C_pressure", "d"),
+    ("foundation_product", "d"),
+    ("E_n", "d"),
+    ("dynamic_product", "d"),
+    ("X_subjectivity", "d"),
+    ("Y_purpose", "d"),
+    ("Z_time", "d"),
+    ("cognitive_product", "d"),
+    ("intelligence", "d"),
+)
+
+_stored_values = itemgetter(*(AxiomState._fields.index(name) for name, _ in HISTORY_COLUMNS))
+
+
+def _restore_state(values) -> AxiomState:
+    """Rebuild an AxiomState from stored values in HISTORY_COLUMNS order"""
+    n, A, B, C, foundation, E_n, dynamic, X, Y, Z, cognitive, intelligence = values
+    return AxiomState(
+        n,
+        A,
+        B,
+        C,
+        foundation,
+        E_n,
+        dynamic_table().fibonacci[n],
+        dynamic,
+        X,
+        1 - X,
+        Y,
+        Z,
+        cognitive,
+        intelligence,
+    )
+
+
+def _dict_values(state: Dict) -> Tuple:
+    """Stored values of a get_state() dictionary in HISTORY_COLUMNS order"""
+    foundation = state["foundation"]
+    dynamic = state["dynamic"]
+    cognitive = state["cognitive"]
+    return (
+        state["n"],
+        foundation["A_impulses"],
+        foundation["B_elements"],
+        foundation["C_pressure"],
+        foundation["product"],
+        dynamic["E_n"],
+        dynamic["product"],
+        cognitive["X_subjectivity"],
+        cognitive["Y_purpose"],
+        cognitive["Z_time"],
+        cognitive["product"],
+        state["intelligence"],
+    )
+
+
+class ColumnarHistory(Sequence):
+    """
+    Columnar store of AxiomState snapshots backed by typed arrays.
+
+    Appends are O(1). With a capacity the store is a ring buffer that evicts
+    the oldest state first; without one it grows without bound. Indexing
+    returns the legacy get_state() dictionaries. AxiomSimulator uses it when
+    given a capacity or passed one as its history; by default its history
+    stays a plain list of dictionaries.
+    """
+
+    def __init__(self, capacity: Optional[int] = None):
+        """
+        Initialize an empty history.
+
+        Args:
+            capacity: Maximum number of states kept (None = unbounded)
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all recorded states"""
+        size = self.capacity or 0
+        self._columns = tuple(
+            array(typecode, bytes(array(typecode).itemsize * size))
+            for _, typecode in HISTORY_COLUMNS
+        )
+        self._head = 0  # next write position when bounded
+        self._size = 0
+
+    def append(self, state: AxiomState) -> None:
+        """Record a snapshot, evicting the oldest one when full"""
+        values = _stored_values(state)
+        if self.capacity is None:
+            for column, value in zip(self._columns, values):
+                column.append(value)
+            self._size += 1
+            return
+
+        head = self._head
+        for column, value in zip(self._columns, values):
+            column[head] = value
+        self._head = (head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _position(self, index: int) -> int:
+        """Map a chronological index to its physical array position"""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("history index out of range")
+        if self.capacity is None:
+            return index
+        return (self._head - self._size + index) % self.capacity
+
+    def state(self, index: int) -> AxiomState:
+        """Return the snapshot at a chronological index (oldest = 0)"""
+        position = self._position(index)
+        return _restore_state(column[position] for column in self._columns)
+
+    @classmethod
+    def from_arrays(
+        cls, arrays: Dict[str, array], capacity: Optional[int] = None
+    ) -> "ColumnarHistory":
+        """
+        Rebuild a history from chronological columns (as from to_arrays()).
+
+        With a capacity, only the newest ``capacity`` states are kept.
+        """
+        history = cls(capacity)
+        columns = tuple(arrays[name] for name, _ in HISTORY_COLUMNS)
+        size = len(columns[0])
+        if any(len(column) != size for column in columns):
+            raise ValueError("history columns must have equal length")
+
+        if capacity is None:
+            history._columns = tuple(
+                array(typecode, column) for (_, typecode), column in zip(HISTORY_COLUMNS, columns)
+            )
+            history._size = size
+            return history
+
+        kept = min(size, capacity)
+        for target, column in zip(history._columns, columns):
+            target[:kept] = column[size - kept :]
+        history._head = kept % capacity
+        history._size = kept
+        return history
+
+    @classmethod
+    def from_dicts(
+        cls, states: Iterable[Dict], capacity: Optional[int] = None
+    ) -> "ColumnarHistory":
+        """Build a history from get_state() dictionaries, such as a list history"""
+        try:
+            rows = [_dict_values(state) for state in states]
+        except (KeyError, TypeError) as error:
+            raise ValueError("history entries must be get_state() dictionaries") from error
+        columns = zip(*rows) if rows else ((),) * len(HISTORY_COLUMNS)
+        arrays = {
+            name: array(typecode, column)
+            for (name, typecode), column in zip(HISTORY_COLUMNS, columns)
+        }
+        return cls.from_arrays(arrays, capacity)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.state(i).to_dict() for i in range(*index.indices(self._size))]
+        return self.state(index).to_dict()
+
+    def __iter__(self) -> Iterator[Dict]:
+        for index in range(self._size):
+            yield self.state(index).to_dict()
+
+    def states(self) -> Iterator[AxiomState]:
+        """Iterate over snapshots oldest-first"""
+        for index in range(self._size):
+            yield self.state(index)
+
+    def to_arrays(self) -> Dict[str, array]:
+        """
+        Export the stored columns in chronological order.
+
+        Returns:
+            Dict[str, array]: Column name to a typed array copy
+        """
+        arrays = {}
+        for (name, _), column in zip(HISTORY_COLUMNS, self._columns):
+            if self.capacity is None:
+                arrays[name] = column[:]
+            elif self._size < self.capacity:
+                arrays[name] = column[: self._size]
+            else:
+                arrays[name] = column[self._head :] + column[: self._head]
+        return arrays
+
+    def to_dicts(self) -> List[Dict]:
+        """Export the legacy list of get_state() dictionaries"""
+        return list(self)
 
 
 class AxiomSimulator:
     """Simulator for running Universal Axiom scenarios"""
 
-    def __init__(self, axiom: UniversalAxiom):
+    def __init__(self, axiom: UniversalAxiom, capacity: Optional[int] = None, history=None):
+        """
+        Initialize the simulator.
+
+        By default history is a list of get_state() dictionaries. A capacity
+        or a history backend opts into columnar storage.
+
+        Args:
+            axiom: Axiom to simulate
+            capacity: Keep at most this many states in a ColumnarHistory ring
+                buffer (None = a plain list)
+            history: Optional history backend with the ColumnarHistory
+                interface, such as ColumnarHistory() or a MappedHistory
+                (overrides capacity)
+        """
         self.axiom = axiom
-        self.history: List[Dict] = []
+        self.history: Any
+        if history is not None:
+            self.history = history
+        elif capacity is not None:
+            self.history = ColumnarHistory(capacity)
+        else:
+            self.history = []
 
     def record_state(self):
         """Record current state to history"""
-        self.history.append(self.axiom.get_state())
-
-    def simulate_evolution(
-        self, steps: int = 10, delta_time: float = 1.0
-    ) -> List[Dict]:
+        if isinstance(self.history, list):
+            self.history.append(self.axiom.get_state())
+        else:
+            self.history.append(self.axiom.snapshot())
+
+    def _record(self, states: Iterable[AxiomState]) -> List[Dict]:
+        """Replace the history with a run's states and return them as dictionaries"""
+        if isinstance(self.history, list):
+            # Each run gets a new list, so earlier results are left untouched
+            history = [state.to_dict() for state in states]
+            self.history = history
+            return history
+        self.history.clear()
+        for state in states:
+            self.history.append(state)
+        dicts: List[Dict] = self.history.to_dicts()
+        return dicts
+
+    def stream_evolution(self, steps: int = 10, delta_time: float = 1.0) -> Iterator[AxiomState]:
         """
-        Simulate evolution over multiple time steps
+        Yield the state before and after each evolution step
+
+        Nothing is recorded to history, so memory stays constant regardless of
+        the step count, and the consumer can stop early at any point.
 
         Args:
             steps: Number of evolution steps
             delta_time: Time increment per step
 
-        Returns:
-            List[Dict]: History of states
+        Yields:
+            AxiomState: Snapshot of the initial state, then one per step
         """
-        self.history = []
-        self.record_state()
+        axiom = self.axiom
+        yield axiom.snapshot()
 
         for _ in range(steps):
-            self.axiom.evolve(delta_time)
-            self.record_state()
-
-        return self.history
+            axiom.evolve(delta_time)
+            yield axiom.snapshot()
 
-    def simulate_contradiction_resolution(
+    def stream_contradiction_resolution(
         self, initial_pressure: float = 2.0, resolution_steps: int = 5
-    ) -> List[Dict]:
+    ) -> Iterator[AxiomState]:
         """
-        Simulate how the system handles contradiction
+        Yield states while the system handles a contradiction
+
+        Follows the same schedule as simulate_contradiction_resolution()
+        without recording history.
 
         Args:
             initial_pressure: Initial pressure spike from contradiction
             resolution_steps: Steps to resolve the contradiction
 
-        Returns:
-            List[Dict]: History showing pressure resolution
+        Yields:
+            AxiomState: Initial state, post-spike state, then one per step
         """
-        self.history = []
-        self.record_state()
+        axiom = self.axiom
+        yield axiom.snapshot()
 
         # Apply initial pressure spike
-        self.axiom.apply_pressure(initial_pressure)
-        self.record_state()
+        axiom.apply_pressure(initial_pressure)
+        yield axiom.snapshot()
 
         # Gradually resolve through objectivity adjustment and pressure release
         for i in range(resolution_steps):
             # Reduce subjectivity (increase objectivity)
-            self.axiom.adjust_subjectivity(-0.1)
+            axiom.adjust_subjectivity(-0.1)
 
             # Release pressure as understanding increases
             pressure_release = -initial_pressure / resolution_steps
-            self.axiom.apply_pressure(pressure_release)
+            axiom.apply_pressure(pressure_release)
 
             # Evolve forward
-            self.axiom.evolve()
-            self.record_state()
+            axiom.evolve()
+            yield axiom.snapshot()
 
-        return self.history
+    def simulate_evolution(self, steps: int = 10, delta_time: float = 1.0) -> List[Dict]:
+        """
+        Simulate evolution over multiple time steps
+
+        Args:
+            steps: Number of evolution steps
+            delta_time: Time increment per step
+
+        Returns:
+            List[Dict]: History of states
+        """
+        return self._record(self.stream_evolution(steps, delta_time))
+
+    def simulate_contradiction_resolution(
+        self, initial_pressure: float = 2.0, resolution_steps: int = 5
+    ) -> List[Dict]:
+        """
+        Simulate how the system handles contradiction
+
+        Args:
+            initial_pressure: Initial pressure spike from contradiction
+            resolution_steps: Steps to resolve the contradiction
+
+        Returns:
+            List[Dict]: History showing pressure resolution
+        """
+        return self._record(
+            self.stream_contradiction_resolution(initial_pressure, resolution_steps)
+        )
+
+    def save(self, target) -> None:
+        """Write the axiom and history as a binary checkpoint to a path or binary file"""
+        from .checkpoint import save
+
+        save(self, target)
+
+    @classmethod
+    def load(cls, source) -> "AxiomSimulator":
+        """Restore a simulator from a binary checkpoint path or file"""
+        from .checkpoint import load
+
+        return load(source, cls)
 
     def get_coherence_metric(self) -> float:
         """
@@ -331,20 +1115,34 @@ class AxiomSimulator:
         Returns:
             float: Coherence score (higher is more coherent)
         """
-        state = self.axiom.get_state()
+        axiom = self.axiom
+        return compute_coherence(
+            axiom._foundation.pressure, axiom._cognitive.subjectivity, axiom._cognitive.purpose
+        )
+
+
+def compute_coherence(pressure: float, subjectivity: float, purpose: float) -> float:
+    """
+    Coherence metric of AxiomSimulator from raw layer fields
+
+    Coherence is high when:
+    - Objectivity is high (low subjectivity)
+    - Purpose is strong
+    - Pressure is moderate (not too high or low)
 
-        # Coherence is high when:
-        # - Objectivity is high (low subjectivity)
-        # - Purpose is strong
-        # - Pressure is moderate (not too high or low)
-        # - Components are balanced
+    Args:
+        pressure: C (pressure)
+        subjectivity: X (subjectivity)
+        purpose: Y (purpose)
 
-        objectivity_score = state["cognitive"]["X_objectivity"]
-        purpose_score = min(state["cognitive"]["Y_purpose"] / 2.0, 1.0)
-        pressure_score = 1.0 / (1.0 + abs(state["foundation"]["C_pressure"] - 1.0))
+    Returns:
+        float: Coherence score (higher is more coherent)
+    """
+    objectivity_score = 1 - subjectivity
+    purpose_score = min(purpose / 2.0, 1.0)
+    pressure_score = 1.0 / (1.0 + abs(pressure - 1.0))
 
-        coherence = (objectivity_score + purpose_score + pressure_score) / 3.0
-        return coherence
+    return (objectivity_score + purpose_score + pressure_score) / 3.0
 
 
 def fibonacci_sequence(n: int) -> List[int]:
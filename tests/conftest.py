@@ -2,12 +2,37 @@
 
 from __future__ import annotations
 
+import importlib
+import pkgutil
 import sys
 from pathlib import Path
 
+import pytest
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SRC_PATH = PROJECT_ROOT / "src"
 
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    """Run a test against NumPy (when installed) and the pure-Python fallback.
+
+    The fallback sets ``np`` to None in every package module that imported it
+    from ``python.batch``.
+    """
+    import python
+    from python import batch
+
+    if request.param == "numpy":
+        if batch.np is None:
+            pytest.skip("NumPy not installed")
+    elif batch.np is not None:
+        numpy = batch.np
+        for info in pkgutil.iter_modules(python.__path__):
+            module = importlib.import_module(f"python.{info.name}")
+            if vars(module).get("np") is numpy:
+                monkeypatch.setattr(module, "np", None)
+    return request.param
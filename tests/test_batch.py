@@ -0,0 +1,175 @@
+"""
+Tests for vectorized batch evaluation of The Universal Axiom.
+"""
+
+import csv
+import math
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from python.batch import (
+    GRADIENT_VARIABLES,
+    compute_coherence_batch,
+    compute_gradient_batch,
+    compute_intelligence_batch,
+)
+from python.universal_axiom import MAX_N, AxiomSimulator, UniversalAxiom
+
+
+def load_golden_columns():
+    golden_path = Path(__file__).with_name("golden_cases.csv")
+    with golden_path.open(newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    names = ["impulses", "elements", "pressure", "subjectivity", "purpose", "time"]
+    columns = {name: [float(row[name]) for row in rows] for name in names}
+    columns["n"] = [int(row["n"]) for row in rows]
+    return columns
+
+
+class TestComputeIntelligenceBatch:
+    def test_matches_scalar_on_golden_cases(self, backend):
+        columns = load_golden_columns()
+        result = compute_intelligence_batch(**columns)
+
+        for index, value in enumerate(result.intelligence):
+            row = {name: column[index] for name, column in columns.items()}
+            assert value == UniversalAxiom(**row).compute_intelligence()
+
+    def test_n_clamped_like_scalar(self, backend):
+        steps = [-5, 0, 1, 2.7, 50, MAX_N, MAX_N + 50]
+        result = compute_intelligence_batch(2.0, 1.5, 1.2, 0.3, 1.1, 2.0, steps)
+
+        expected = [
+            UniversalAxiom(2.0, 1.5, 1.2, 0.3, 1.1, 2.0, n=step).compute_intelligence()
+            for step in steps
+        ]
+        assert list(result.intelligence) == expected
+        assert len(result) == len(steps)
+
+    @pytest.mark.parametrize(
+        "step, error",
+        [(math.nan, ValueError), (math.inf, OverflowError), (-math.inf, OverflowError)],
+    )
+    def test_non_finite_n_rejected_like_scalar(self, backend, step, error):
+        with pytest.raises(error):
+            UniversalAxiom(n=step)
+        with pytest.raises(error):
+            compute_intelligence_batch(1.0, 1.0, 1.0, 0.0, 1.0, 1.0, [1.0, step, 3.0])
+        with pytest.raises(error):
+            compute_gradient_batch(1.0, 1.0, 1.0, 0.0, 1.0, 1.0, [step])
+
+    def test_reports_saturated_rows(self, backend):
+        result = compute_intelligence_batch(
+            1.0, 1.0, 1.0, 0.0, 1.0, 1.0, [1, 40, MAX_N], base_exponential=1e10
+        )
+
+        assert [bool(flag) for flag in result.saturated] == [False, True, True]
+        assert result.saturated_rows() == [1, 2]
+
+    def test_mismatched_columns_rejected(self, backend):
+        with pytest.raises(ValueError):
+            compute_intelligence_batch([1.0, 2.0], [1.0], 1.0, 0.0, 1.0, 1.0, 1)
+
+
+class TestComputeGradientBatch:
+    def test_value_matches_intelligence_batch(self, backend):
+        columns = load_golden_columns()
+        gradient = compute_gradient_batch(**columns)
+        plain = compute_intelligence_batch(**columns)
+
+        assert list(gradient.intelligence) == list(plain.intelligence)
+        assert list(gradient.saturated) == list(plain.saturated)
+
+    def test_partials_match_finite_differences(self, backend):
+        point = dict(
+            impulses=1.3, elements=0.8, pressure=1.7, subjectivity=0.35, purpose=1.1, time=2.0, n=4
+        )
+        result = compute_gradient_batch(**point)
+        step = 1e-6
+
+        for name in GRADIENT_VARIABLES:
+            up = UniversalAxiom(**{**point, name: point[name] + step}).compute_intelligence()
+            down = UniversalAxiom(**{**point, name: point[name] - step}).compute_intelligence()
+            expected = (up - down) / (2 * step)
+            assert result.partials[name][0] == pytest.approx(expected, rel=1e-6)
+
+        assert result.partials["subjectivity"][0] < 0
+
+    def test_zero_inputs_keep_exact_partials(self, backend):
+        result = compute_gradient_batch([0.0, 2.0], 3.0, 0.5, [0.2, 1.0], 1.0, 1.0, 1)
+        dynamic = 10.0  # E_1 * (1 + F_1) at base 3
+
+        assert result.partials["impulses"][0] == dynamic * 0.8 * (3.0 * 0.5)
+        assert result.partials["elements"][0] == 0.0
+        assert result.partials["subjectivity"][1] == -(dynamic * 3.0)
+        assert result.partials["purpose"][1] == 0.0
+
+    def test_jacobian_rows_and_saturation(self, backend):
+        result = compute_gradient_batch(
+            1.0, 1.0, 1.0, 0.0, 1.0, 1.0, [1, 40], base_exponential=1e10
+        )
+        jacobian = [list(row) for row in result.jacobian()]
+
+        assert len(jacobian) == 2 and len(jacobian[0]) == len(GRADIENT_VARIABLES)
+        assert jacobian[1][0] == result.intelligence[1]
+        assert result.saturated_rows() == [1]
+
+
+def state_coherence(axiom):
+    """Coherence as previously computed from the get_state() dictionary."""
+    state = axiom.get_state()
+    objectivity_score = state["cognitive"]["X_objectivity"]
+    purpose_score = min(state["cognitive"]["Y_purpose"] / 2.0, 1.0)
+    pressure_score = 1.0 / (1.0 + abs(state["foundation"]["C_pressure"] - 1.0))
+    return (objectivity_score + purpose_score + pressure_score) / 3.0
+
+
+class TestComputeCoherenceBatch:
+    def test_matches_state_coherence_on_golden_cases(self, backend):
+        columns = load_golden_columns()
+        coherence = compute_coherence_batch(
+            columns["pressure"], columns["subjectivity"], columns["purpose"]
+        )
+
+        for index, (c, x, y) in enumerate(
+            zip(columns["pressure"], columns["subjectivity"], columns["purpose"])
+        ):
+            axiom = UniversalAxiom(pressure=c, subjectivity=x, purpose=y)
+            expected = state_coherence(axiom)
+            assert coherence[index] == expected
+            assert AxiomSimulator(axiom).get_coherence_metric() == expected
+
+    def test_edge_values_and_broadcast(self, backend):
+        pressure = [0.01, 1.0, 1e308, 3.0]
+        purpose = [0.0, 2.0, 4.0, 1.9999999999999998]
+        coherence = compute_coherence_batch(pressure, 0.3, purpose)
+
+        expected = [
+            state_coherence(UniversalAxiom(pressure=c, subjectivity=0.3, purpose=y))
+            for c, y in zip(pressure, purpose)
+        ]
+        assert list(coherence) == expected
+
+    def test_mismatched_columns_rejected(self, backend):
+        with pytest.raises(ValueError):
+            compute_coherence_batch([1.0, 2.0], [0.1, 0.2, 0.3], 1.0)
+
+
+class TestPackageExports:
+    def test_import_does_not_load_numpy(self):
+        source = Path(__file__).resolve().parent.parent / "src"
+        script = (
+            "import sys, python; "
+            "assert 'numpy' not in sys.modules; "
+            "assert python.compute_intelligence_batch is "
+            "sys.modules['python.batch'].compute_intelligence_batch"
+        )
+        subprocess.run([sys.executable, "-c", script], cwd=source, check=True)
+
+    def test_unknown_attribute_raises(self):
+        import python
+
+        with pytest.raises(AttributeError):
+            python.compute_nothing
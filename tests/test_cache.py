@@ -0,0 +1,95 @@
+"""
+Tests for the memoizing evaluation cache.
+"""
+
+import threading
+
+import pytest
+from python.cache import EvaluationCache
+from python.universal_axiom import AxiomSimulator, UniversalAxiom
+
+
+class TestEvaluationCache:
+    def test_results_match_uncached_evaluation(self):
+        cache = EvaluationCache()
+        point = (1.2, 0.9, 1.5, 0.3, 1.1, 2.0)
+        axiom = UniversalAxiom(*point, n=7)
+
+        assert cache.compute_intelligence(*point, n=7) == axiom.compute_intelligence()
+        assert cache.get_coherence_metric(*point, n=7) == (
+            AxiomSimulator(axiom).get_coherence_metric()
+        )
+        assert cache.compute_intelligence(*point, n=7) == axiom.compute_intelligence()
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+        assert stats.hit_rate == pytest.approx(1 / 3)
+
+    def test_lru_eviction(self):
+        cache = EvaluationCache(maxsize=2)
+        cache.compute_intelligence(impulses=1.0)
+        cache.compute_intelligence(impulses=2.0)
+        cache.compute_intelligence(impulses=1.0)  # refreshes 1.0
+        cache.compute_intelligence(impulses=3.0)  # evicts 2.0
+
+        cache.compute_intelligence(impulses=1.0)
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 3, 1, 2)
+
+        cache.compute_intelligence(impulses=2.0)
+        assert cache.stats().misses == 4
+
+    def test_quantization_shares_entries(self):
+        cache = EvaluationCache(quantum=0.01)
+        first = cache.compute_intelligence(impulses=1.2301, purpose=0.9999)
+        second = cache.compute_intelligence(impulses=1.2298, purpose=1.0002)
+
+        assert first == second == UniversalAxiom(impulses=1.23, purpose=1.0).compute_intelligence()
+        assert cache.stats().hits == 1
+
+    def test_n_is_clamped_and_coherence_ignores_unused_inputs(self):
+        cache = EvaluationCache()
+        cache.compute_intelligence(n=500)
+        cache.compute_intelligence(n=100)
+        cache.get_coherence_metric(impulses=1.0, n=3)
+        cache.get_coherence_metric(impulses=5.0, n=9)
+
+        assert cache.stats().hits == 2
+
+    def test_concurrent_access_keeps_counters_consistent(self):
+        cache = EvaluationCache(maxsize=8)
+
+        def worker():
+            for i in range(200):
+                cache.compute_intelligence(impulses=float(i % 16))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        assert stats.hits + stats.misses == 1600
+        assert stats.size == len(cache) <= 8
+        assert stats.evictions == stats.misses - stats.size
+
+    def test_lost_race_counts_as_hit(self):
+        cache = EvaluationCache()
+        lookups = []
+
+        def evaluate():
+            # Another thread inserts the key while this one is computing it
+            if not lookups:
+                lookups.append(cache._lookup("key", lambda: 2.0))
+            return 1.0
+
+        assert cache._lookup("key", evaluate) == 2.0
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size, stats.evictions) == (1, 1, 1, 0)
+
+    def test_invalid_configuration_rejected(self):
+        with pytest.raises(ValueError):
+            EvaluationCache(maxsize=0)
+        with pytest.raises(ValueError):
+            EvaluationCache(quantum=0.0)
@@ -0,0 +1,127 @@
+"""
+Tests for binary checkpoints of UniversalAxiom and AxiomSimulator.
+"""
+
+import io
+import struct
+
+import pytest
+from python import checkpoint
+from python.history_store import MappedHistory
+from python.universal_axiom import AxiomSimulator, ColumnarHistory, UniversalAxiom
+
+
+def bits(value):
+    return struct.pack("<d", value)
+
+
+def assert_same_axiom(restored, original):
+    for layer in ("foundation", "cognitive"):
+        for name in type(getattr(original, layer)).__slots__:
+            assert bits(getattr(getattr(restored, layer), name)) == bits(
+                getattr(getattr(original, layer), name)
+            )
+    assert restored.dynamic.steps == original.dynamic.steps
+    assert restored.dynamic.base_exponential == original.dynamic.base_exponential
+    assert bits(restored.compute_intelligence()) == bits(original.compute_intelligence())
+
+
+class TestCheckpoint:
+    def test_axiom_round_trip_is_bit_exact(self, tmp_path):
+        axiom = UniversalAxiom(0.1 + 0.2, -0.0, 5e-324, 1 / 3, 1.1, 2.5, n=250)
+        axiom.dynamic.base_exponential = 2.5
+        path = tmp_path / "axiom.uaxc"
+
+        axiom.save(path)
+        restored = UniversalAxiom.load(path)
+
+        assert_same_axiom(restored, axiom)
+        assert restored.n == 100 and restored.dynamic.steps == 250
+
+    def test_int_base_round_trip_keeps_its_type(self):
+        axiom = UniversalAxiom(impulses=1.5, n=40)
+        axiom.dynamic.base_exponential = 3
+        restored = checkpoint.loads(checkpoint.dumps(axiom))
+
+        assert type(restored.dynamic.base_exponential) is int
+        assert_same_axiom(restored, axiom)
+
+    def test_unsupported_base_rejected(self):
+        axiom = UniversalAxiom()
+        axiom.dynamic.base_exponential = 2**70
+        with pytest.raises(ValueError):
+            checkpoint.dumps(axiom)
+        axiom.dynamic.base_exponential = True
+        with pytest.raises(TypeError):
+            checkpoint.dumps(axiom)
+
+    def test_simulator_round_trip_keeps_history(self):
+        simulator = AxiomSimulator(
+            UniversalAxiom(impulses=1.3, subjectivity=0.2), history=ColumnarHistory()
+        )
+        simulator.simulate_evolution(steps=25, delta_time=0.1)
+        buffer = io.BytesIO()
+
+        simulator.save(buffer)
+        buffer.seek(0)
+        restored = AxiomSimulator.load(buffer)
+
+        assert_same_axiom(restored.axiom, simulator.axiom)
+        assert restored.history.capacity is None
+        assert restored.history.to_dicts() == simulator.history.to_dicts()
+        assert {name: col.tobytes() for name, col in restored.history.to_arrays().items()} == {
+            name: col.tobytes() for name, col in simulator.history.to_arrays().items()
+        }
+
+    def test_list_history_round_trip(self):
+        simulator = AxiomSimulator(UniversalAxiom(subjectivity=0.3))
+        simulator.simulate_contradiction_resolution(2.0, 5)
+        restored = checkpoint.loads(checkpoint.dumps(simulator))
+
+        assert isinstance(restored.history, list)
+        assert restored.history == simulator.history
+
+    def test_wrapped_ring_buffer_round_trip(self):
+        simulator = AxiomSimulator(UniversalAxiom(), capacity=8)
+        simulator.simulate_evolution(steps=20)
+        restored = checkpoint.loads(checkpoint.dumps(simulator))
+
+        assert restored.history.capacity == 8
+        assert restored.history.to_dicts() == simulator.history.to_dicts()
+        restored.record_state()
+        simulator.record_state()
+        assert restored.history.to_dicts() == simulator.history.to_dicts()
+
+    def test_checkpoint_is_compact(self):
+        simulator = AxiomSimulator(UniversalAxiom())
+        simulator.simulate_evolution(steps=99)
+        data = checkpoint.dumps(simulator)
+
+        header = checkpoint.HEADER.size + checkpoint.AXIOM_RECORD.size + checkpoint.BASE_SIZE
+        assert len(data) == header + checkpoint.HISTORY_HEADER.size + 100 * 12 * 8
+
+    def test_invalid_checkpoints_rejected(self):
+        data = checkpoint.dumps(AxiomSimulator(UniversalAxiom()))
+        with pytest.raises(ValueError):
+            checkpoint.loads(b"XXXX" + data[4:])
+        with pytest.raises(ValueError):
+            checkpoint.loads(data[:20])
+        with pytest.raises(ValueError):
+            checkpoint.loads(data, UniversalAxiom)
+        with pytest.raises(TypeError):
+            checkpoint.dumps(object())
+
+    def test_restores_plain_simulator_with_columnar_history(self, tmp_path):
+        class TracingSimulator(AxiomSimulator):
+            pass
+
+        simulator = TracingSimulator(UniversalAxiom(), history=MappedHistory(tmp_path / "h.uaxh"))
+        simulator.simulate_evolution(steps=5)
+        restored = checkpoint.loads(checkpoint.dumps(simulator))
+
+        assert type(restored) is AxiomSimulator
+        assert isinstance(restored.history, ColumnarHistory)
+        assert restored.history.to_dicts() == simulator.history.to_dicts()
+        with pytest.raises(ValueError):
+            checkpoint.loads(checkpoint.dumps(simulator), TracingSimulator)
+        simulator.history.close()
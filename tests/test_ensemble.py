@@ -0,0 +1,137 @@
+"""
+Tests for the lockstep axiom ensemble.
+"""
+
+import random
+
+import pytest
+from python.ensemble import AxiomEnsemble
+from python.universal_axiom import AxiomSimulator, UniversalAxiom
+
+
+def make_agents(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        UniversalAxiom(
+            impulses=rng.uniform(-2.0, 2.0),
+            elements=rng.uniform(0.1, 2.0),
+            pressure=rng.uniform(0.01, 3.0),
+            subjectivity=rng.uniform(0.0, 1.0),
+            purpose=rng.uniform(0.01, 2.0),
+            time=rng.uniform(0.0, 5.0),
+            n=rng.randint(1, 120),
+        )
+        for _ in range(count)
+    ]
+
+
+class TestAxiomEnsemble:
+    def test_lockstep_matches_individual_axioms(self, backend):
+        agents = make_agents(40)
+        population = AxiomEnsemble.from_axioms(agents)
+        rng = random.Random(11)
+
+        for _ in range(25):
+            mask = [rng.random() < 0.5 for _ in agents]
+            pressure_delta = rng.uniform(-1.5, 1.5)
+            subjectivity_delta = [rng.uniform(-0.4, 0.4) for _ in agents]
+            purpose_multiplier = rng.uniform(0.0, 1.5)
+
+            population.apply_pressure(pressure_delta, mask=mask)
+            population.adjust_subjectivity(subjectivity_delta)
+            population.strengthen_purpose(purpose_multiplier, mask=mask)
+            population.evolve(0.25, mask=[not selected for selected in mask])
+
+            for agent, selected, delta in zip(agents, mask, subjectivity_delta):
+                agent.adjust_subjectivity(delta)
+                if selected:
+                    agent.apply_pressure(pressure_delta)
+                    agent.strengthen_purpose(purpose_multiplier)
+                else:
+                    agent.evolve(0.25)
+
+        expected = [agent.compute_intelligence() for agent in agents]
+        assert list(population.compute_intelligence()) == expected
+        for index, agent in enumerate(agents):
+            assert population.axiom(index).get_state() == agent.get_state()
+
+    def test_clamping_rules(self, backend):
+        population = AxiomEnsemble(pressure=[0.5, 2.0], subjectivity=[0.2, 0.9], size=2)
+
+        population.apply_pressure(-1.0)
+        population.adjust_subjectivity([-1.0, 1.0])
+        population.strengthen_purpose(0.0)
+
+        assert list(population.pressure) == [0.01, 1.0]
+        assert list(population.subjectivity) == [0.0, 1.0]
+        assert list(population.purpose) == [0.01, 0.01]
+
+    def test_round_trip_through_axioms(self, backend):
+        agents = make_agents(5)
+        population = AxiomEnsemble.from_axioms(agents)
+
+        for original, restored in zip(agents, population.to_axioms()):
+            assert restored.get_state() == original.get_state()
+            assert restored.dynamic.steps == original.dynamic.steps
+
+    def test_round_trip_keeps_base_exponential(self, backend):
+        agents = make_agents(3)
+        for agent in agents:
+            agent.dynamic.base_exponential = 2.5
+        population = AxiomEnsemble.from_axioms(agents)
+
+        assert population.base_exponential == 2.5
+        for original, restored in zip(agents, population.to_axioms()):
+            assert restored.dynamic.base_exponential == 2.5
+            assert restored.compute_intelligence() == original.compute_intelligence()
+
+    def test_mixed_bases_rejected(self, backend):
+        agents = make_agents(2)
+        agents[1].dynamic.base_exponential = 2.0
+        with pytest.raises(ValueError):
+            AxiomEnsemble.from_axioms(agents)
+
+    def test_size_must_match_columns(self, backend):
+        with pytest.raises(ValueError):
+            AxiomEnsemble(impulses=[1.0, 2.0], size=3)
+
+    def test_contradiction_resolution_matches_simulator(self, backend):
+        agents = make_agents(12)
+        spikes = [0.5 + 0.25 * index for index in range(12)]
+        steps = [index % 5 for index in range(12)]
+        population = AxiomEnsemble.from_axioms(agents)
+
+        result = population.simulate_contradiction_resolution(spikes, steps)
+
+        assert len(result.intelligence) == 6
+        for index, agent in enumerate(agents):
+            simulator = AxiomSimulator(agent)
+            history = simulator.simulate_contradiction_resolution(spikes[index], steps[index])
+            expected = [state["intelligence"] for state in history]
+            expected += [expected[-1]] * (6 - len(expected))
+            assert [row[index] for row in result.intelligence] == expected
+            assert result.final_coherence[index] == simulator.get_coherence_metric()
+            assert population.axiom(index).get_state() == agent.get_state()
+
+    def test_tile_crosses_agents_with_parameters(self, backend):
+        population = AxiomEnsemble.from_axioms(make_agents(3)).tile(2)
+        result = population.simulate_contradiction_resolution([1.0] * 3 + [3.0] * 3, 4)
+
+        assert len(population) == 6
+        assert list(population.impulses[:3]) == list(population.impulses[3:])
+        assert list(result.intelligence[0][:3]) == list(result.intelligence[0][3:])
+        assert list(result.intelligence[1][:3]) != list(result.intelligence[1][3:])
+
+    def test_evolve_by_matches_repeated_evolve(self, backend):
+        agents = make_agents(8)
+        population = AxiomEnsemble.from_axioms(agents)
+        mask = [index % 2 == 0 for index in range(8)]
+
+        population.evolve_by(7, 0.1, mask=mask)
+
+        for agent, selected in zip(agents, mask):
+            if selected:
+                for _ in range(7):
+                    agent.evolve(0.1)
+        for index, agent in enumerate(agents):
+            assert population.axiom(index).get_state() == agent.get_state()
@@ -0,0 +1,113 @@
+"""
+Tests for the event-driven simulator.
+"""
+
+import math
+import random
+
+import pytest
+from python.events import EventKind, EventSimulator
+from python.universal_axiom import UniversalAxiom
+
+KINDS = list(EventKind)
+VALUES = {
+    EventKind.PRESSURE: lambda rng: rng.uniform(-1.5, 1.5),
+    EventKind.SUBJECTIVITY: lambda rng: rng.uniform(-0.3, 0.3),
+    EventKind.PURPOSE: lambda rng: rng.uniform(0.5, 1.5),
+}
+
+
+def make_events(count, agents, horizon, seed=3):
+    rng = random.Random(seed)
+    events = []
+    for _ in range(count):
+        kind = rng.choice(KINDS)
+        time = rng.choice([rng.uniform(0, horizon), float(rng.randrange(horizon))])
+        events.append((time, rng.randrange(agents), kind, VALUES[kind](rng)))
+    return events
+
+
+def poll(agents, events, delta_time, horizon):
+    """Reference: evolve every agent every tick, then fire that tick's events."""
+    order = sorted(range(len(events)), key=lambda i: (events[i][0], i))
+    position = 0
+    for tick in range(int(horizon // delta_time) + 1):
+        if tick:
+            for agent in agents:
+                agent.evolve(delta_time)
+        while position < len(order) and int(events[order[position]][0] // delta_time) == tick:
+            _, index, kind, value = events[order[position]]
+            getattr(agents[index], kind.value)(value)
+            position += 1
+
+
+class TestEventSimulator:
+    @pytest.mark.parametrize("delta_time", [1.0, 0.25])
+    def test_matches_polling_every_tick(self, delta_time):
+        events = make_events(400, 15, 30)
+        expected = [UniversalAxiom(impulses=1.1, n=3) for _ in range(15)]
+        poll(expected, events, delta_time, 30)
+
+        simulator = EventSimulator(
+            [UniversalAxiom(impulses=1.1, n=3) for _ in range(15)], delta_time
+        )
+        simulator.schedule_many(events)
+        result = simulator.run(until=30)
+
+        assert result.events == 400 and len(simulator) == 0
+        for index, agent in enumerate(expected):
+            assert simulator.state(index) == agent.snapshot()
+
+    def test_fast_forward_from_negative_power_of_two_time(self):
+        events = [(5e-15, 0, EventKind.PURPOSE, 1.5), (9e-15, 0, EventKind.PRESSURE, 0.5)]
+        expected = [UniversalAxiom(time=-1.0)]
+        poll(expected, events, 1e-16, 1e-14)
+
+        simulator = EventSimulator([UniversalAxiom(time=-1.0)], 1e-16)
+        simulator.schedule_many(events)
+        simulator.run(until=1e-14)
+
+        assert simulator.state(0) == expected[0].snapshot()
+        assert simulator.state(0).Z_time > -1.0
+
+    def test_idle_agents_are_not_touched(self):
+        simulator = EventSimulator([UniversalAxiom() for _ in range(1000)])
+        simulator.schedule(50.5, 7, EventKind.PRESSURE, 0.5)
+        simulator.run()
+
+        assert simulator.agents[7].dynamic.steps == 51
+        assert simulator.agents[8].dynamic.steps == 1
+        assert simulator.state(8).n == 51
+
+    def test_ties_fire_in_scheduling_order_and_trace(self):
+        simulator = EventSimulator([UniversalAxiom(pressure=1.0)])
+        simulator.schedule(2.0, 0, "apply_pressure", -5.0)
+        simulator.schedule(2.0, 0, EventKind.PRESSURE, 1.0)
+        result = simulator.run(record=True)
+
+        assert simulator.agents[0].foundation.pressure == 1.01
+        assert list(result.times) == [2.0, 2.0]
+        assert list(result.agents) == [0, 0]
+        assert result.intelligence[-1] == simulator.agents[0].compute_intelligence()
+        assert result.events_per_second > 0
+
+    def test_run_until_and_scheduling_rules(self):
+        simulator = EventSimulator([UniversalAxiom()])
+        simulator.schedule_many(
+            [(1.0, 0, EventKind.PURPOSE, 2.0), (5.0, 0, EventKind.PURPOSE, 2.0)]
+        )
+
+        assert simulator.run(until=3.0).events == 1
+        assert simulator.now == 3.0 and len(simulator) == 1
+        with pytest.raises(ValueError):
+            simulator.schedule(2.0, 0, EventKind.PURPOSE, 1.0)
+        with pytest.raises(IndexError):
+            simulator.schedule(4.0, 1, EventKind.PURPOSE, 1.0)
+        with pytest.raises(ValueError):
+            simulator.schedule(4.0, 0, "evolve", 1.0)
+        with pytest.raises(ValueError):
+            EventSimulator([], delta_time=0.0)
+
+        simulator.sync()
+        assert simulator.agents[0].dynamic.steps == 4
+        assert math.isclose(simulator.agents[0].cognitive.purpose, 2.0)
@@ -0,0 +1,89 @@
+"""
+Tests for columnar NPZ and Arrow export.
+"""
+
+import pytest
+from python import export
+from python.batch import compute_gradient_batch, compute_intelligence_batch
+from python.history_store import MappedHistory
+from python.universal_axiom import AxiomSimulator, AxiomState, ColumnarHistory, UniversalAxiom
+
+np = pytest.importorskip("numpy")
+
+
+def make_simulator(history=None):
+    if history is None:
+        history = ColumnarHistory()
+    simulator = AxiomSimulator(UniversalAxiom(impulses=1.4, subjectivity=0.3), history=history)
+    simulator.simulate_evolution(steps=120, delta_time=0.1)
+    return simulator
+
+
+def load(path, monkeypatch):
+    monkeypatch.setattr(export, "np", np)
+    return export.load_npz(path)
+
+
+class TestExport:
+    def test_history_npz_round_trip(self, tmp_path, backend, monkeypatch):
+        simulator = make_simulator()
+        path = tmp_path / "history.npz"
+        export.to_npz(simulator, path)
+        columns = load(path, monkeypatch)
+
+        assert list(columns) == list(AxiomState._fields)
+        states = list(simulator.history.states())
+        for name in AxiomState._fields:
+            assert columns[name].tolist() == [float(getattr(s, name)) for s in states]
+        assert columns["n"].dtype == np.int64
+        assert not columns["intelligence"].flags.owndata
+        assert not columns["intelligence"].flags.writeable
+
+        with np.load(path) as standard:
+            assert np.array_equal(standard["C_pressure"], columns["C_pressure"])
+
+    def test_list_history_export(self, backend):
+        expected = export.history_columns(make_simulator())
+        columns = export.history_columns(make_simulator([]))
+
+        assert list(columns) == list(expected)
+        for name, column in columns.items():
+            assert list(column) == list(expected[name])
+
+    def test_mapped_history_export(self, tmp_path, monkeypatch):
+        with MappedHistory(tmp_path / "run.uaxh", "w") as history:
+            simulator = AxiomSimulator(UniversalAxiom(), history=history)
+            simulator.simulate_evolution(steps=10)
+            export.to_npz(history, tmp_path / "mapped.npz")
+            expected = export.history_columns(make_simulator().history)
+        columns = load(tmp_path / "mapped.npz", monkeypatch)
+        assert columns["n"].tolist() == list(range(1, 12))
+        assert set(columns) == set(expected)
+
+    def test_batch_and_gradient_npz(self, tmp_path, backend, monkeypatch):
+        result = compute_intelligence_batch([1.0, 2.0, 3.0], 1.0, 0.5, 0.1, 1.0, 1.0, [1, 50, 100])
+        export.to_npz(result, tmp_path / "batch.npz")
+        columns = load(tmp_path / "batch.npz", monkeypatch)
+        assert columns["intelligence"].tolist() == list(result.intelligence)
+        assert columns["saturated"].dtype == np.bool_
+        assert columns["saturated"].tolist() == [bool(flag) for flag in result.saturated]
+
+        gradient = compute_gradient_batch([1.0, 2.0], 1.0, 1.0, 0.1, 1.0, 1.0, 3)
+        export.to_npz(gradient, tmp_path / "gradient.npz")
+        columns = load(tmp_path / "gradient.npz", monkeypatch)
+        assert columns["d_subjectivity"].tolist() == list(gradient.partials["subjectivity"])
+
+    def test_arrow_round_trip(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        simulator = make_simulator()
+        export.to_arrow(simulator, tmp_path / "history.arrow")
+        table = export.load_arrow(tmp_path / "history.arrow")
+        assert table.column_names == list(AxiomState._fields)
+        assert table.column("intelligence").to_pylist() == [
+            s.intelligence for s in simulator.history.states()
+        ]
+
+    def test_arrow_requires_pyarrow(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(export, "pa", None)
+        with pytest.raises(ImportError):
+            export.to_arrow(make_simulator(), tmp_path / "history.arrow")
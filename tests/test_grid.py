@@ -0,0 +1,113 @@
+"""
+Tests for separable (outer-product) grid evaluation.
+"""
+
+import math
+
+import pytest
+from python import batch
+from python.grid import SeparableGrid
+from python.sweep import ParameterSweep
+
+AXES = dict(
+    impulses=[-1.0, 0.5, 2.0],
+    elements=[1.0, 1.5],
+    pressure=[0.5, 1.2],
+    subjectivity=[0.0, 0.3, 0.9, 1.4],
+    purpose=1.1,
+    time=[1.0, 2.0],
+    n=range(1, 6),
+)
+
+
+def reference():
+    return list(ParameterSweep(**AXES).run("full", workers=1).values)
+
+
+class TestSeparableGrid:
+    def test_full_grid_matches_sweep(self, backend):
+        values = SeparableGrid(**AXES).to_array()
+        assert [float(value) for value in _flatten(values)] == reference()
+
+    def test_slice_matches_sweep(self, backend):
+        full = SeparableGrid(**AXES)
+        values = reference()
+        part = full[1, :, 0, 1:3, 0, :, 2]
+
+        expected = [
+            values[_flat_index(full, (1, b, 0, x, 0, z, 2))]
+            for b in range(2)
+            for x in (1, 2)
+            for z in range(2)
+        ]
+        assert _flatten(part) == expected
+        if backend == "numpy":
+            assert part.shape == (2, 2, 2)
+        assert full[1, 0, 0, 2, 0, 1, 4] == values[_flat_index(full, (1, 0, 0, 2, 0, 1, 4))]
+
+    def test_extremes_match_materialized_grid(self, backend):
+        full = SeparableGrid(**AXES)
+        values = reference()
+
+        assert full.max() == max(values)
+        assert full.min() == min(values)
+        assert full.argmax() == values.index(max(values))
+        assert full.argmin() == values.index(min(values))
+        assert full.point(full.argmax())["impulses"] in AXES["impulses"]
+        assert full.mean() == pytest.approx(math.fsum(values) / len(values))
+
+    def test_extremes_with_ties_return_first_index(self, backend):
+        tied = SeparableGrid(impulses=[1.0, 2.0, 2.0], subjectivity=[0.5, 0.5], n=[3, 3])
+        values = list(_flatten(tied.to_array()))
+        assert tied.argmax() == values.index(max(values)) == 4
+        assert tied.argmin() == 0
+
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_non_finite_values_fall_back_to_scan(self, backend):
+        inf = float("inf")
+        nan_grid = SeparableGrid(impulses=[1.0, inf], pressure=[0.0, 1.0], n=[1, 2])
+        values = list(_flatten(nan_grid.to_array()))
+        assert math.isnan(nan_grid.max())
+        assert nan_grid.argmax() == next(i for i, v in enumerate(values) if v != v)
+
+        overflow = SeparableGrid(impulses=[1e300, -1e300], n=[1, 200])
+        values = list(_flatten(overflow.to_array()))
+        assert overflow.max() == max(values) == inf
+        assert overflow.argmin() == values.index(-inf)
+
+    def test_huge_grid_reductions_stay_small(self):
+        if batch.np is None:
+            pytest.skip("NumPy not installed")
+        values = [0.1 * i for i in range(1, 101)]
+        subjectivity = [0.01 * i for i in range(100)]
+        huge = SeparableGrid(values, values, values, subjectivity, values, values, range(1, 101))
+
+        assert huge.size == 100**7
+        assert huge.max() == huge[99, 99, 99, 0, 99, 99, 99]
+        assert huge.argmax() == huge.size - 1 - 99 * 100**3
+        assert huge[::50, 0, 0, 0, 0, 0].shape == (2, 100)
+
+    def test_select_is_lazy_subgrid(self, backend):
+        full = SeparableGrid(**AXES)
+        sub = full.select((slice(0, 2), 1))
+        assert sub.shape == (2, 1, 2, 4, 1, 2, 5)
+        assert sub.max() == max(_flatten(full[0:2, 1:2]))
+
+    def test_from_sweep_and_invalid_index(self):
+        source = ParameterSweep(**AXES)
+        assert SeparableGrid.from_sweep(source).shape == source.shape
+        with pytest.raises(IndexError):
+            SeparableGrid(**AXES)[(0,) * 8]
+        with pytest.raises(TypeError):
+            SeparableGrid(**AXES)[0.5]
+
+
+def _flatten(values):
+    return values.reshape(-1).tolist() if hasattr(values, "reshape") else list(values)
+
+
+def _flat_index(full, coordinates):
+    index = 0
+    for length, coordinate in zip(full.shape, coordinates):
+        index = index * length + coordinate
+    return index
@@ -0,0 +1,94 @@
+"""
+Tests for the memory-mapped history store.
+"""
+
+import gc
+
+import pytest
+from python import history_store
+from python.history_store import MappedHistory
+from python.universal_axiom import AxiomSimulator, ColumnarHistory, UniversalAxiom
+
+
+def simulate(history, steps):
+    simulator = AxiomSimulator(UniversalAxiom(impulses=1.2, subjectivity=0.1), history=history)
+    simulator.simulate_evolution(steps=steps, delta_time=0.1)
+    return simulator
+
+
+class TestMappedHistory:
+    def test_matches_in_memory_history(self, tmp_path, backend):
+        expected = simulate(ColumnarHistory(), 300).history
+        with MappedHistory(tmp_path / "run.uaxh", "w", chunk_records=1) as history:
+            simulator = simulate(history, 300)
+
+            assert simulator.history is history
+            assert history.chunk_records == history_store.CHUNK_ALIGNMENT
+            assert len(history) == 301
+            assert history.to_dicts() == expected.to_dicts()
+            assert history[-1] == expected[-1]
+            assert history[10:20] == expected[10:20]
+            assert {name: col.tolist() for name, col in history.to_arrays().items()} == {
+                name: col.tolist() for name, col in expected.to_arrays().items()
+            }
+
+    def test_column_views_are_zero_copy(self, tmp_path, backend):
+        history = MappedHistory(tmp_path / "run.uaxh", "w", chunk_records=128)
+        simulate(history, 299)
+        expected = [state.intelligence for state in history.states()]
+
+        view = history.column("intelligence", 5, 100)
+        assert list(view) == expected[5:100]
+        record = history_store.RECORD.size
+        history._chunks[0][6 * record - 8 : 6 * record] = bytes(8)
+        assert view[0] == 0.0
+        assert list(history.column("intelligence", 100, 260)) == expected[100:260]
+        assert list(history.column("n")) == [state.n for state in history.states()]
+        size = 1 if backend == "numpy" else history_store.RECORD.size
+        counts = [len(segment) // size for segment in history.segments(100, 300)]
+        assert counts == [28, 128, 44]
+        del view
+        gc.collect()
+        history.close()
+
+    def test_reader_sees_appends_while_writing(self, tmp_path):
+        path = tmp_path / "run.uaxh"
+        writer = MappedHistory(path, "w", chunk_records=128)
+        simulator = AxiomSimulator(UniversalAxiom(), history=writer)
+        simulator.record_state()
+
+        with MappedHistory(path, "r") as reader:
+            assert len(reader) == 1
+            for _ in range(200):
+                simulator.axiom.evolve()
+                simulator.record_state()
+            assert len(reader) == 201
+            assert reader[-1] == writer[-1]
+            with pytest.raises(ValueError):
+                reader.append(simulator.axiom.snapshot())
+        writer.close()
+
+    def test_append_mode_resumes(self, tmp_path):
+        path = tmp_path / "run.uaxh"
+        with MappedHistory(path, "w") as history:
+            simulate(history, 3)
+        with MappedHistory(path, "a") as history:
+            history.append(UniversalAxiom().snapshot())
+            assert len(history) == 5
+            assert history[4]["n"] == 1
+
+    def test_clear_and_invalid_files(self, tmp_path):
+        path = tmp_path / "run.uaxh"
+        with MappedHistory(path, "w") as history:
+            simulate(history, 3)
+            history.clear()
+            assert len(history) == 0
+            with pytest.raises(IndexError):
+                history[0]
+
+        other = tmp_path / "other.bin"
+        other.write_bytes(b"x" * history_store.HEADER_SIZE)
+        with pytest.raises(ValueError):
+            MappedHistory(other, "r")
+        with pytest.raises(ValueError):
+            MappedHistory(path, "x")
@@ -0,0 +1,64 @@
+"""
+Tests for the batch inverse solver.
+"""
+
+import pytest
+from python.inverse import solve_for_batch
+from python.universal_axiom import MAX_N, UniversalAxiom
+
+BASE = dict(impulses=1.2, elements=0.9, pressure=1.5, subjectivity=0.25, purpose=1.3, time=2.0, n=5)
+
+
+class TestSolveForBatch:
+    @pytest.mark.parametrize(
+        "variable", ["impulses", "elements", "pressure", "subjectivity", "purpose", "time"]
+    )
+    def test_closed_form_round_trip(self, backend, variable):
+        reference = UniversalAxiom(**BASE).compute_intelligence()
+        targets = [reference * 0.9, reference, reference * 1.05]
+        result = solve_for_batch(variable, targets, **BASE)
+
+        assert result.infeasible_rows() == []
+        for value, target in zip(result.values, targets):
+            solved = UniversalAxiom(**{**BASE, variable: value}).compute_intelligence()
+            assert solved == pytest.approx(target, rel=1e-12)
+
+    def test_out_of_bounds_and_degenerate_rows_are_infeasible(self, backend):
+        reference = UniversalAxiom(**BASE).compute_intelligence()
+        targets = [reference, 0.0, -reference, 10 * reference]
+        subjectivity = solve_for_batch("subjectivity", targets, **BASE)
+        assert subjectivity.infeasible_rows() == [2, 3]
+        assert subjectivity.values[1] == 1.0
+
+        pressure = solve_for_batch("pressure", [reference, 0.0, -1.0], **BASE)
+        assert pressure.infeasible_rows() == [1, 2]
+
+        degenerate = solve_for_batch("impulses", 1.0, **{**BASE, "elements": [0.0, 1.0]})
+        assert degenerate.infeasible_rows() == [0]
+        assert degenerate.values[0] != degenerate.values[0]
+
+    def test_smallest_step_reaching_target(self, backend):
+        intelligences = [
+            UniversalAxiom(**{**BASE, "n": step}).compute_intelligence() for step in range(1, 11)
+        ]
+        targets = [intelligences[0], intelligences[3] * 0.999, intelligences[3], 1e-9]
+        result = solve_for_batch("n", targets, **BASE)
+
+        assert list(result.values) == [1, 4, 4, 1]
+        assert result.infeasible_rows() == []
+
+    def test_step_search_with_negative_scale_and_unreachable_target(self, backend):
+        negative = {**BASE, "impulses": -1.2}
+        at_six = UniversalAxiom(**{**negative, "n": 6}).compute_intelligence()
+        floor = UniversalAxiom(**{**negative, "n": MAX_N}).compute_intelligence()
+        result = solve_for_batch("n", [at_six, 1.0, floor * 2], **negative)
+
+        assert list(result.values) == [6, 1, 0]
+        assert result.infeasible_rows() == [2]
+
+        ceiling = UniversalAxiom(**{**BASE, "n": MAX_N}).compute_intelligence()
+        assert solve_for_batch("n", ceiling * 2, **BASE).infeasible_rows() == [0]
+
+    def test_unknown_variable_rejected(self):
+        with pytest.raises(ValueError):
+            solve_for_batch("intelligence", 1.0)
@@ -0,0 +1,86 @@
+"""
+Tests for Monte Carlo uncertainty propagation.
+"""
+
+import math
+
+import pytest
+from python import montecarlo
+from python.montecarlo import MonteCarloStudy, Normal, SampleSummary, Triangular, Uniform
+from python.universal_axiom import AxiomSimulator, UniversalAxiom
+
+
+def make_study():
+    return MonteCarloStudy(
+        impulses=Normal(1.0, 0.1),
+        pressure=Uniform(0.5, 1.5),
+        subjectivity=Triangular(0.0, 0.2, 0.5),
+        purpose=1.2,
+        n=5,
+    )
+
+
+class TestMonteCarloStudy:
+    def test_fixed_inputs_match_scalar_outputs(self, backend):
+        study = MonteCarloStudy(impulses=1.5, pressure=1.3, subjectivity=0.2, purpose=1.1, n=4)
+        result = study.run(1000, chunk_size=300)
+
+        axiom = UniversalAxiom(impulses=1.5, pressure=1.3, subjectivity=0.2, purpose=1.1, n=4)
+        expected = axiom.compute_intelligence()
+        coherence = AxiomSimulator(axiom).get_coherence_metric()
+
+        assert result.samples == result.intelligence.count == 1000
+        assert result.chunks == 4
+        assert result.intelligence.mean == pytest.approx(expected)
+        assert result.intelligence.minimum == result.intelligence.maximum == expected
+        assert result.intelligence.variance == pytest.approx(0.0, abs=1e-18)
+        assert result.coherence.quantile(0.5) == pytest.approx(coherence)
+
+    def test_summaries_match_the_drawn_samples(self, backend):
+        study = make_study()
+        result = study.run(300, seed=7, chunk_size=100)
+
+        values = []
+        for chunk in range(3):
+            rng = montecarlo._chunk_rng(7, chunk)
+            columns = [
+                [value] * 100 if isinstance(value, float) else list(value.sample(rng, 100))
+                for value in study.distributions
+            ]
+            values += [UniversalAxiom(*row, n=5).compute_intelligence() for row in zip(*columns)]
+
+        mean = math.fsum(values) / len(values)
+        variance = math.fsum((v - mean) ** 2 for v in values) / (len(values) - 1)
+        ordered = sorted(values)
+        assert result.intelligence.mean == pytest.approx(mean, rel=1e-12)
+        assert result.intelligence.variance == pytest.approx(variance, rel=1e-9)
+        assert result.intelligence.minimum == ordered[0]
+        assert result.intelligence.maximum == ordered[-1]
+        assert result.intelligence.quantile(0.5) == pytest.approx((ordered[149] + ordered[150]) / 2)
+
+    def test_quantiles_of_large_runs_are_accurate(self, backend):
+        samples = 200_000 if backend == "numpy" else 20_000
+        study = MonteCarloStudy(impulses=Uniform(0.0, 1.0))
+        result = study.run(samples, seed=3, chunk_size=5000, resolution=256)
+        scale = UniversalAxiom(impulses=1.0).compute_intelligence()
+
+        for q in (0.05, 0.5, 0.95):
+            assert result.intelligence.quantile(q) == pytest.approx(q * scale, abs=0.02 * scale)
+        assert result.intelligence.std == pytest.approx(scale / math.sqrt(12), rel=0.02)
+
+    def test_results_do_not_depend_on_worker_count(self):
+        study = make_study()
+        serial = study.run(20_000, seed=11, chunk_size=3000, workers=1)
+        parallel = study.run(20_000, seed=11, chunk_size=3000, workers=2)
+
+        assert parallel.intelligence == serial.intelligence
+        assert parallel.coherence == serial.coherence
+        assert study.run(20_000, seed=12, chunk_size=3000).intelligence != serial.intelligence
+
+    def test_invalid_inputs_rejected(self):
+        with pytest.raises(ValueError):
+            MonteCarloStudy(impulses="wide")
+        with pytest.raises(ValueError):
+            make_study().run(0)
+        with pytest.raises(ValueError):
+            SampleSummary.from_values([1.0, 2.0], 4).quantile(1.5)
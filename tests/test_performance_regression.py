@@ -7,6 +7,7 @@ Baseline performance metrics are stored and compared against current runs.
 
 import json
 import time
+import tracemalloc
 from pathlib import Path
 from typing import Dict, List
 
@@ -30,6 +31,9 @@ PERFORMANCE_THRESHOLDS = {
     "benchmark_runner_10_scenarios": 1000.0,  # 10 scenarios < 1s
 }
 
+# Memory budget per live UniversalAxiom (axiom plus its three layers), in bytes
+AXIOM_INSTANCE_BUDGET_BYTES = 320
+
 
 class SimpleAdapter:
     """Simple adapter for performance testing"""
@@ -200,6 +204,42 @@ class TestPerformanceRegression:
             history_size < max_size_bytes
         ), f"History consumed {history_size / 1024:.2f}KB (max: {max_size_kb}KB)"
 
+    def test_axiom_instance_memory_budget(self):
+        """Test that live axioms stay within the per-instance memory budget"""
+        count = 2000
+        # Allocate inputs up front so only the axioms themselves are traced
+        values = [float(i) + 0.5 for i in range(count * 6)]
+
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            axioms = [
+                UniversalAxiom(
+                    impulses=values[i],
+                    elements=values[i + 1],
+                    pressure=values[i + 2],
+                    subjectivity=0.1,
+                    purpose=values[i + 4],
+                    time=values[i + 5],
+                    n=5,
+                )
+                for i in range(0, count * 6, 6)
+            ]
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        per_instance = (after - before) / len(axioms)
+        assert (
+            per_instance < AXIOM_INSTANCE_BUDGET_BYTES
+        ), f"UniversalAxiom used {per_instance:.0f} bytes (budget: {AXIOM_INSTANCE_BUDGET_BYTES})"
+
+    def test_layers_have_no_instance_dict(self):
+        """Test that layer and axiom objects are slotted"""
+        axiom = UniversalAxiom()
+        for obj in (axiom, axiom.foundation, axiom.dynamic, axiom.cognitive):
+            assert not hasattr(obj, "__dict__"), type(obj).__name__
+
 
 class TestPerformanceMetrics:
     """Record and compare performance metrics over time"""
@@ -0,0 +1,151 @@
+"""
+Tests for compiled operation plans.
+"""
+
+import json
+import random
+
+import pytest
+from python.ensemble import AxiomEnsemble
+from python.plan import Fused, OperationPlan, Repeat, compile_plan
+from python.universal_axiom import UniversalAxiom
+
+VALUES = {
+    "evolve": lambda rng: rng.choice([1.0, 0.1, 0.25]),
+    "apply_pressure": lambda rng: rng.choice([-0.7, -0.05, 0.0, 0.3, 2.5]),
+    "adjust_subjectivity": lambda rng: rng.choice([-0.1, -0.35, 0.07, 0.2]),
+    "strengthen_purpose": lambda rng: rng.choice([0.5, 0.9, 1.1, 1.3]),
+}
+
+
+def random_schedule(rng, depth=0):
+    nodes = []
+    for _ in range(rng.randint(1, 6)):
+        if depth < 2 and rng.random() < 0.25:
+            nodes.append({"repeat": rng.randint(0, 4), "ops": random_schedule(rng, depth + 1)})
+            continue
+        op = rng.choice(list(VALUES))
+        node = {"op": op, "value": VALUES[op](rng), "repeat": rng.randint(0, 12)}
+        if rng.random() < 0.2:
+            node["observe"] = True
+        nodes.append(node)
+    return nodes
+
+
+def interpret(schedule, axiom, out):
+    """Reference: call every mutator one by one."""
+    for node in schedule:
+        for _ in range(node.get("repeat", 1)):
+            if "ops" in node:
+                interpret(node["ops"], axiom, out)
+                continue
+            value = getattr(axiom, node["op"])(node.get("value", 1.0))
+            if node.get("observe"):
+                out.append(value)
+
+
+def make_axiom(rng):
+    return UniversalAxiom(
+        impulses=rng.uniform(0.5, 2.0),
+        pressure=rng.uniform(0.01, 1.0),
+        subjectivity=rng.uniform(0.0, 1.0),
+        purpose=rng.uniform(0.01, 2.0),
+        n=rng.randint(1, 90),
+    )
+
+
+class TestOperationPlan:
+    def test_matches_interpreted_mutators(self):
+        rng = random.Random(5)
+        for _ in range(200):
+            schedule = random_schedule(rng)
+            seed = rng.random()
+            expected_axiom = make_axiom(random.Random(seed))
+            expected = []
+            interpret(schedule, expected_axiom, expected)
+
+            axiom = make_axiom(random.Random(seed))
+            result = compile_plan(json.dumps(schedule)).run(axiom)
+
+            assert list(result.observations) == expected
+            assert result.evaluations == len(expected)
+            assert axiom.snapshot() == expected_axiom.snapshot()
+            assert axiom.dynamic.steps == expected_axiom.dynamic.steps
+
+    def test_runs_leaving_a_power_of_two(self):
+        schedule = [
+            {"op": "apply_pressure", "value": -1.5e-16, "repeat": 50},
+            {"op": "adjust_subjectivity", "value": -3.3e-17, "repeat": 50},
+            {"op": "evolve", "value": -1.5e-16, "repeat": 50},
+            {"op": "strengthen_purpose", "value": 1.0, "observe": True},
+        ]
+        expected_axiom = UniversalAxiom(pressure=2.0, subjectivity=0.5, time=2.0)
+        expected = []
+        interpret(schedule, expected_axiom, expected)
+
+        axiom = UniversalAxiom(pressure=2.0, subjectivity=0.5, time=2.0)
+        result = compile_plan(schedule).run(axiom)
+
+        assert list(result.observations) == expected
+        assert axiom.snapshot() == expected_axiom.snapshot()
+        assert axiom.cognitive.time == 1.999999999999989
+
+    def test_fuses_interleaved_ops_into_one_step(self):
+        compiled = OperationPlan(
+            [
+                {"op": "apply_pressure", "value": 2.0},
+                {
+                    "repeat": 1000,
+                    "ops": [
+                        {"op": "adjust_subjectivity", "value": -0.1},
+                        {"op": "apply_pressure", "value": -0.002},
+                        {"op": "evolve"},
+                    ],
+                },
+                {"op": "evolve", "value": 1.0, "repeat": 5, "observe": True},
+            ]
+        )
+
+        fused, observed = compiled.steps
+        assert fused == Fused(
+            (
+                ("apply_pressure", 2.0, 1),
+                ("apply_pressure", -0.002, 1000),
+                ("adjust_subjectivity", -0.1, 1000),
+                ("evolve", 1.0, 1000),
+            )
+        )
+        assert isinstance(observed, Repeat) and observed.count == 5
+        assert compiled.operations == 3006 and compiled.evaluations == 5
+
+    def test_runs_vectorized_over_an_ensemble(self, backend):
+        rng = random.Random(9)
+        for _ in range(20):
+            schedule = random_schedule(rng)
+            agents = [make_axiom(rng) for _ in range(6)]
+            population = AxiomEnsemble.from_axioms(agents)
+
+            result = compile_plan(schedule).run(population)
+
+            columns = []
+            for agent in agents:
+                observed = []
+                interpret(schedule, agent, observed)
+                columns.append(observed)
+            assert len(result.observations) == result.evaluations
+            for row, values in enumerate(result.observations):
+                assert list(values) == [column[row] for column in columns]
+            for index, agent in enumerate(agents):
+                assert population.axiom(index).get_state() == agent.get_state()
+
+    def test_invalid_schedules_rejected(self):
+        with pytest.raises(ValueError):
+            compile_plan([{"op": "explode", "value": 1.0}])
+        with pytest.raises(ValueError):
+            compile_plan([{"op": "apply_pressure"}])
+        with pytest.raises(ValueError):
+            compile_plan([{"op": "evolve", "repeat": -1}])
+        with pytest.raises(ValueError):
+            compile_plan(42)
+        with pytest.raises(TypeError):
+            compile_plan([{"op": "evolve"}]).run(object())
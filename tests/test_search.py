@@ -0,0 +1,99 @@
+"""
+Tests for branch-and-bound threshold and top-k search.
+"""
+
+import itertools
+import math
+
+import pytest
+from python.search import MonotoneSearch
+from python.sweep import AXES
+from python.universal_axiom import UniversalAxiom
+
+
+def make_search():
+    return MonotoneSearch(
+        impulses=[2.0, -1.0, 0.5, 1.5],
+        elements=[1.0, 1.5, 0.7],
+        pressure=[0.5, 1.2],
+        subjectivity=[0.9, 0.0, 0.3],
+        purpose=[1.1, 0.4],
+        time=[1.0, 2.0],
+        n=range(1, 9),
+    )
+
+
+def brute_force(search):
+    return [
+        (UniversalAxiom(*point).compute_intelligence(), dict(zip(AXES, point)))
+        for point in itertools.product(*search.axes)
+    ]
+
+
+class TestMonotoneSearch:
+    def test_threshold_matches_brute_force(self):
+        search = make_search()
+        points = brute_force(search)
+        threshold = sorted(value for value, _ in points)[len(points) * 3 // 4]
+
+        result = search.threshold(threshold)
+        expected = sorted(tuple(p.values()) for v, p in points if v > threshold)
+
+        assert result.matches == len(expected)
+        assert sorted(tuple(p.values()) for p in result.points()) == expected
+        assert result.evaluations < search.size
+        assert result.savings > 1
+
+    def test_top_k_matches_brute_force(self):
+        search = make_search()
+        expected = sorted((value for value, _ in brute_force(search)), reverse=True)[:7]
+
+        result = search.top_k(7)
+
+        assert [value for value, _ in result.top] == expected
+        for value, point in result.top:
+            assert UniversalAxiom(**point).compute_intelligence() == value
+        assert result.evaluations < search.size
+
+    def test_large_grid_needs_few_evaluations(self):
+        values = [0.1 * i for i in range(1, 41)]
+        search = MonotoneSearch(values, values, values, 0.0, values, values, range(1, 41))
+
+        result = search.top_k(3)
+
+        assert search.size == 40**6
+        best = UniversalAxiom(4.0, 4.0, 4.0, 0.0, 4.0, 4.0, 40).compute_intelligence()
+        assert result.top[0][0] == best
+        assert result.bounds < result.evaluations < 1000
+
+    def test_threshold_prunes_most_of_a_large_grid(self):
+        values = [0.1 * i for i in range(1, 11)]
+        search = MonotoneSearch(values, values, values, 0.0, values, values, range(1, 11))
+
+        result = search.threshold(1e6)
+
+        assert result.matches == sum(1 for _ in result.points())
+        assert result.savings > 20
+
+    def test_bounds_count_as_full_evaluations_of_each_layer(self):
+        single = MonotoneSearch(impulses=2.0, n=3).threshold(0.0)
+        assert single.bounds == single.evaluations == 1
+
+        # The root bound reads 4 dynamic values and 2 x 2 foundation corners
+        search = MonotoneSearch(impulses=[1.0, 2.0], pressure=[1.0, 2.0], n=range(1, 5))
+        result = search.threshold(-1.0)
+        assert result.bounds == 1
+        assert result.evaluations == 4
+        assert result.savings == search.size / 4
+
+    def test_nan_points_are_never_reported(self):
+        search = MonotoneSearch(impulses=[1.0, math.inf], pressure=[0.0, 1.0], n=[1, 2])
+        points = [(v, p) for v, p in brute_force(search) if v == v]
+
+        top = search.top_k(len(points) + 5).top
+        assert sorted(v for v, _ in top) == sorted(v for v, _ in points)
+        assert search.threshold(0.0).matches == sum(1 for v, _ in points if v > 0.0)
+
+    def test_invalid_k_rejected(self):
+        with pytest.raises(ValueError):
+            make_search().top_k(0)
@@ -0,0 +1,44 @@
+"""
+Tests for the Sobol sensitivity engine.
+"""
+
+import pytest
+from python.montecarlo import Discrete, Uniform
+from python.sensitivity import SobolAnalysis
+
+
+class TestSobolAnalysis:
+    def test_product_of_two_uniforms_matches_analytic_indices(self, backend):
+        # Y ∝ A·B with A, B ~ U(1, 3): S_i = 12/25 and ST_i = 13/25
+        samples = 100_000 if backend == "numpy" else 20_000
+        analysis = SobolAnalysis(impulses=Uniform(1.0, 3.0), elements=Uniform(1.0, 3.0))
+        result = analysis.run(samples, seed=5, chunk_size=5000)
+
+        for name in ("impulses", "elements"):
+            assert result.first_order[name] == pytest.approx(0.48, abs=0.03)
+            assert result.total[name] == pytest.approx(0.52, abs=0.03)
+        assert result.first_order["pressure"] == result.total["n"] == 0.0
+        assert result.evaluations == samples * 4
+
+    def test_discrete_n_is_a_sensitivity_input(self, backend):
+        analysis = SobolAnalysis(n=Discrete(tuple(range(1, 11))), purpose=Uniform(0.9, 1.1))
+        result = analysis.run(5000, seed=1, chunk_size=1000)
+
+        assert result.ranking()[0] == "n"
+        assert result.total["n"] > 0.9
+        assert result.total["purpose"] < 0.05
+
+    def test_results_do_not_depend_on_worker_count(self):
+        analysis = SobolAnalysis(impulses=Uniform(0.5, 1.5), time=Uniform(1.0, 2.0), n=3)
+        serial = analysis.run(20_000, seed=2, chunk_size=3000)
+        parallel = analysis.run(20_000, seed=2, chunk_size=3000, workers=2)
+
+        assert parallel.first_order == serial.first_order
+        assert parallel.total == serial.total
+        assert parallel.variance == serial.variance
+
+    def test_invalid_inputs_rejected(self):
+        with pytest.raises(ValueError):
+            SobolAnalysis(impulses=[1.0, 2.0])
+        with pytest.raises(ValueError):
+            SobolAnalysis(impulses=Uniform(0.0, 1.0)).run(1)
@@ -0,0 +1,81 @@
+"""
+Tests for the process-pool parameter sweep engine.
+"""
+
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from python.sweep import ParameterSweep, SweepReduction, _stream
+from python.universal_axiom import UniversalAxiom
+
+
+def make_sweep():
+    return ParameterSweep(
+        impulses=[-1.0, 0.5, 2.0],
+        elements=[1.0, 1.5],
+        pressure=[0.5, 1.2],
+        subjectivity=[0.0, 0.3, 0.9],
+        purpose=1.1,
+        time=[1.0, 2.0],
+        n=range(1, 6),
+    )
+
+
+def brute_force(grid):
+    points = itertools.product(*grid.axes)
+    return [UniversalAxiom(*point).compute_intelligence() for point in points]
+
+
+class TestParameterSweep:
+    def test_full_matches_scalar_grid(self, backend):
+        grid = make_sweep()
+        result = grid.run("full", workers=1, chunk_size=37)
+
+        assert result.points == grid.size == 360
+        assert result.chunks == 10
+        assert list(result.values) == brute_force(grid)
+
+    def test_top_k_matches_brute_force(self, backend):
+        grid = make_sweep()
+        result = grid.run(SweepReduction.TOP_K, k=5, workers=1, chunk_size=50)
+
+        expected = sorted(brute_force(grid), reverse=True)[:5]
+        assert [value for value, _ in result.top] == expected
+        best_value, best_point = result.top[0]
+        assert UniversalAxiom(**best_point).compute_intelligence() == best_value
+
+    def test_histogram_counts_every_point_in_range(self, backend):
+        grid = make_sweep()
+        values = brute_force(grid)
+        edges = [min(values), 0.0, 100.0, max(values)]
+        result = grid.run("histogram", bins=edges, workers=1, chunk_size=64)
+
+        assert sum(result.counts) == len(values)
+        assert result.counts[0] == sum(1 for value in values if value < 0.0)
+
+    def test_process_pool_matches_in_process(self):
+        grid = make_sweep()
+        serial = grid.run("full", workers=1, chunk_size=40)
+        parallel = grid.run("full", workers=2, chunk_size=40)
+
+        assert list(parallel.values) == list(serial.values)
+        assert parallel.workers == 2
+        assert 0.0 < parallel.parallel_efficiency <= 1.0
+
+    def test_histogram_requires_edges(self):
+        with pytest.raises(ValueError):
+            make_sweep().run("histogram", workers=1)
+
+    def test_stream_yields_chunks_in_task_order(self):
+        def delayed(chunk, delay):
+            time.sleep(delay)
+            return chunk
+
+        tasks = [(chunk, 0.05 if chunk % 3 == 0 else 0.0) for chunk in range(10)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(_stream(executor, delayed, tasks, 3))
+
+        assert [task for task, _ in results] == tasks
+        assert [result for _, result in results] == list(range(10))
@@ -5,17 +5,26 @@ Based on PROMPT.md principles and The Epiphany Engine specifications
 """
 
 import csv
+import json
 import math
 from pathlib import Path
 
 import pytest
 from python.universal_axiom import (
+    MAX_N,
+    MAX_SAFE_VALUE,
     FoundationLayer,
     DynamicLayer,
     CognitiveLayer,
     UniversalAxiom,
     AxiomSimulator,
+    AxiomState,
+    ColumnarHistory,
+    LogValue,
+    dynamic_table,
+    fibonacci_fast_doubling,
     fibonacci_sequence,
+    repeated_add,
 )
 from python.math_solutions import ErdosProblem, MathSolutions, ProofStep
 
@@ -76,6 +85,51 @@ class TestDynamicLayer:
         expected = E_n * (1 + F_n)
         assert abs(dynamic.compute() - expected) < 1e-6
 
+    def test_table_shared_across_instances(self):
+        """Test layers with the same base share one precomputed table"""
+        assert DynamicLayer(n=3)._table is DynamicLayer(n=50)._table
+        assert dynamic_table(3.0) is dynamic_table(3.0)
+        assert DynamicLayer(n=3, base_exponential=2.0)._table is dynamic_table(2.0)
+
+    def test_table_matches_direct_formula(self):
+        """Test table entries equal E_n = 2·3^n - 1 and the Fibonacci loop"""
+        table = dynamic_table(3.0)
+        sequence = fibonacci_sequence(MAX_N + 1)
+        for n in range(1, MAX_N + 1):
+            E_n = (2 * (3.0**n)) - 1
+            assert table.exponential[n] == E_n
+            assert table.fibonacci[n] == sequence[n]
+            assert table.product[n] == E_n * (1 + sequence[n])
+
+    def test_base_exponential_rebinds_table(self):
+        """Test changing the base switches to that base's table"""
+        dynamic = DynamicLayer(n=2)
+        dynamic.base_exponential = 2.0
+        assert dynamic.exponential_growth() == 7
+        assert dynamic.compute() == 7 * (1 + 2)
+
+    def test_saturation_clamps_to_max_safe_value(self):
+        """Test saturated E_n and products clamp to MAX_SAFE_VALUE"""
+        dynamic = DynamicLayer(n=MAX_N, base_exponential=1e10)
+        assert dynamic.exponential_growth() == MAX_SAFE_VALUE
+        assert dynamic.compute() == MAX_SAFE_VALUE
+
+    def test_float_overflow_saturates_like_int_base(self):
+        """Test a float base whose power overflows saturates instead of raising"""
+        with pytest.raises(OverflowError):
+            1e10**MAX_N
+        for base in (1e10, 10**10):
+            axiom = UniversalAxiom(n=MAX_N)
+            axiom.dynamic.base_exponential = base
+            assert axiom.dynamic.exponential_growth() == MAX_SAFE_VALUE
+            assert axiom.compute_intelligence() == MAX_SAFE_VALUE
+
+    def test_int_and_float_bases_have_separate_tables(self):
+        """Test int bases keep exact integer powers rather than float ones"""
+        assert dynamic_table(3) is not dynamic_table(3.0)
+        assert dynamic_table(3).exponential[40] == 2 * 3**40 - 1
+        assert dynamic_table(3.0).exponential[40] == 2 * 3.0**40 - 1
+
 
 class TestCognitiveLayer:
     """Test Cognitive Layer (X·Y·Z) - Objectivity, Purpose, Time"""
@@ -360,6 +414,69 @@ class TestAxiomSimulator:
         final_subjectivity = history[-1]["cognitive"]["X_subjectivity"]
         assert final_subjectivity < initial_subjectivity
 
+    def test_stream_evolution_matches_history(self):
+        """Test streamed states equal the recorded simulation history"""
+        streamed = list(AxiomSimulator(UniversalAxiom(n=1)).stream_evolution(steps=5))
+        history = AxiomSimulator(UniversalAxiom(n=1)).simulate_evolution(steps=5)
+
+        assert [state.to_dict() for state in streamed] == history
+
+    def test_stream_contradiction_matches_history(self):
+        """Test streamed contradiction resolution equals the recorded one"""
+        simulator = AxiomSimulator(UniversalAxiom(subjectivity=0.5))
+        streamed = list(simulator.stream_contradiction_resolution(2.0, 5))
+        history = AxiomSimulator(
+            UniversalAxiom(subjectivity=0.5)
+        ).simulate_contradiction_resolution(2.0, 5)
+
+        assert len(streamed) == 7
+        assert [state.to_dict() for state in streamed] == history
+        assert len(simulator.history) == 0
+
+    def test_simulations_return_independent_histories(self):
+        """Test each run returns its own list that later runs do not overwrite"""
+        simulator = AxiomSimulator(UniversalAxiom(n=1))
+        first = simulator.simulate_evolution(steps=3)
+        second = simulator.simulate_contradiction_resolution(2.0, 2)
+
+        assert isinstance(first, list)
+        assert [state["n"] for state in first] == [1, 2, 3, 4]
+        assert len(second) == 4
+        assert second == simulator.history
+        assert [state["n"] for state in first] == [1, 2, 3, 4]
+
+    def test_default_history_is_a_list_of_dicts(self):
+        """Test the default history keeps the legacy list usage working"""
+        simulator = AxiomSimulator(UniversalAxiom(n=1))
+        simulator.simulate_evolution(steps=2)
+        simulator.record_state()
+        simulator.history.append({"note": "external entry"})
+
+        assert isinstance(simulator.history, list)
+        assert [state["n"] for state in simulator.history[:4]] == [1, 2, 3, 3]
+        assert simulator.history[3] == simulator.axiom.get_state()
+        assert json.loads(json.dumps(simulator.history))[-1] == {"note": "external entry"}
+
+    def test_columnar_history_is_opt_in(self):
+        """Test a capacity or a ColumnarHistory selects columnar storage"""
+        assert isinstance(AxiomSimulator(UniversalAxiom(), capacity=5).history, ColumnarHistory)
+        columnar = AxiomSimulator(UniversalAxiom(n=1), history=ColumnarHistory())
+        listed = AxiomSimulator(UniversalAxiom(n=1))
+
+        assert columnar.simulate_evolution(steps=3) == listed.simulate_evolution(steps=3)
+        assert columnar.history.to_dicts() == listed.history
+        assert ColumnarHistory.from_dicts(listed.history).to_dicts() == listed.history
+
+    def test_stream_can_stop_early(self):
+        """Test consumers can stop a long stream without running it to the end"""
+        axiom = UniversalAxiom(n=1)
+        stream = AxiomSimulator(axiom).stream_evolution(steps=10**9)
+        for state in stream:
+            if state.n == 5:
+                break
+
+        assert axiom.n == 5
+
     def test_coherence_metric_high_objectivity(self):
         """Test coherence tracking per PROMPT.md"""
         axiom = UniversalAxiom(subjectivity=0.1, purpose=2.0, pressure=1.0)
@@ -392,6 +509,52 @@ class TestAxiomSimulator:
             assert intelligences[i] > intelligences[i - 1]
 
 
+class TestColumnarHistory:
+    """Columnar ring-buffer history store"""
+
+    def test_records_legacy_state_dicts(self):
+        """Test stored states read back as the original get_state() dicts"""
+        axiom = UniversalAxiom(impulses=1.5, subjectivity=0.25, n=1)
+        history = ColumnarHistory()
+        expected = []
+        for _ in range(8):
+            history.append(axiom.snapshot())
+            expected.append(axiom.get_state())
+            axiom.evolve(0.5)
+
+        assert len(history) == 8
+        assert history.to_dicts() == expected
+        assert history[-1] == expected[-1]
+        assert history[2:4] == expected[2:4]
+
+    def test_capacity_evicts_oldest_first(self):
+        """Test a bounded history keeps only the newest states in order"""
+        simulator = AxiomSimulator(UniversalAxiom(n=1), capacity=4)
+        history = simulator.simulate_evolution(steps=9)
+
+        assert len(history) == 4
+        assert [state["n"] for state in history] == [7, 8, 9, 10]
+        assert history[0]["cognitive"]["Z_time"] == 7.0
+
+    def test_to_arrays_exports_typed_columns(self):
+        """Test column export is chronological and typed"""
+        simulator = AxiomSimulator(UniversalAxiom(n=1), capacity=3)
+        simulator.simulate_evolution(steps=4)
+        arrays = simulator.history.to_arrays()
+
+        assert list(arrays["n"]) == [3, 4, 5]
+        assert arrays["n"].typecode == "q"
+        assert arrays["intelligence"].typecode == "d"
+        assert list(arrays["intelligence"]) == [
+            state.intelligence for state in simulator.history.states()
+        ]
+
+    def test_invalid_capacity_rejected(self):
+        """Test capacity must be positive"""
+        with pytest.raises(ValueError):
+            ColumnarHistory(capacity=0)
+
+
 class TestGoldenCases:
     """Cross-language golden data cases for parity checks."""
 
@@ -417,6 +580,313 @@ class TestGoldenCases:
                 ]
 
 
+class TestEvolveBy:
+    """Closed-form multi-step evolution"""
+
+    @pytest.mark.parametrize(
+        "n, time, delta_time, steps",
+        [
+            (1, 1.0, 1.0, 9),
+            (3, 0.0, 0.1, 250),
+            (95, 1.0, 1.0 / 3.0, 40),
+            (MAX_N, 2.5, -0.7, 17),
+            (1, 1e16, 1.0, 12),
+        ],
+    )
+    def test_matches_sequential_evolve(self, n, time, delta_time, steps):
+        """Test evolve_by(k) equals k evolve() calls, including after saturation"""
+        stepped = UniversalAxiom(impulses=1.2, subjectivity=0.2, time=time, n=n)
+        for _ in range(steps):
+            expected = stepped.evolve(delta_time)
+
+        jumped = UniversalAxiom(impulses=1.2, subjectivity=0.2, time=time, n=n)
+        assert jumped.evolve_by(steps, delta_time) == expected
+        assert jumped.get_state() == stepped.get_state()
+        assert jumped.dynamic.steps == stepped.dynamic.steps
+
+    @pytest.mark.parametrize("time, delta_time", [(1e-300, 1.0), (-1e-300, 1.0), (1e-300, -1e10)])
+    def test_tiny_time_matches_sequential_evolve(self, time, delta_time):
+        """Test steps much larger than a tiny time are taken as rounded sums"""
+        stepped = UniversalAxiom(time=time)
+        for _ in range(20):
+            stepped.evolve(delta_time)
+
+        jumped = UniversalAxiom(time=time)
+        jumped.evolve_by(20, delta_time)
+        assert jumped.cognitive.time == stepped.cognitive.time
+
+    def test_zero_steps_is_noop(self):
+        """Test evolve_by(0) leaves the state unchanged"""
+        axiom = UniversalAxiom(n=4, time=2.0)
+        before = axiom.get_state()
+        assert axiom.evolve_by(0) == before["intelligence"]
+        assert axiom.get_state() == before
+
+    def test_negative_steps_rejected(self):
+        """Test evolution cannot run backwards"""
+        with pytest.raises(ValueError):
+            UniversalAxiom().evolve_by(-1)
+        with pytest.raises(ValueError):
+            UniversalAxiom().advance(-1)
+
+    def test_advance_skips_evaluation(self, monkeypatch):
+        """Test advance moves n and time like evolve_by without computing"""
+        expected = UniversalAxiom(n=3, time=0.5)
+        expected.evolve_by(40, 0.1)
+
+        axiom = UniversalAxiom(n=3, time=0.5)
+        monkeypatch.setattr(UniversalAxiom, "compute_intelligence", None)
+        axiom.advance(40, 0.1)
+        monkeypatch.undo()
+        assert axiom.get_state() == expected.get_state()
+
+    def test_repeated_add_matches_loop(self):
+        """Test accumulated time rounding equals sequential addition"""
+        for start, delta, count in [(0.0, 0.1, 10_000), (2.0**53, 1.0, 9), (-3.0, 0.3, 500)]:
+            expected = start
+            for _ in range(count):
+                expected += delta
+            assert repeated_add(start, delta, count) == expected
+
+    @pytest.mark.parametrize(
+        "start, delta",
+        [
+            (2.0, -1.5e-16),
+            (-1.0, 1e-16),
+            (0.5, -3.3e-17),
+            (0.125, -8.8e-18),
+            (1.0, -(2.0**-54)),
+            (2.0, -3.0),
+        ],
+    )
+    def test_repeated_add_steps_down_from_power_of_two(self, start, delta):
+        """Test runs leaving a power of two toward zero use the finer lower grid"""
+        expected = start
+        for _ in range(50):
+            expected += delta
+        assert repeated_add(start, delta, 50) == expected
+
+    @pytest.mark.parametrize("units", [0.5, 1.5, 2.5, -1.5, -2.5, -0.5])
+    @pytest.mark.parametrize("start", [1.0, 1.0 + 2.0**-52, 1.5 - 2.0**-52])
+    def test_repeated_add_half_ulp_ties(self, start, units):
+        """Test deltas of k + 1/2 ulps round half to even like the loop"""
+        delta = units * math.ulp(start)
+        expected = start
+        for _ in range(1000):
+            expected += delta
+        assert repeated_add(start, delta, 1000) == expected
+
+    def test_repeated_add_half_ulp_ties_jump(self):
+        """Test long runs of tied sums jump instead of stepping"""
+        ulp = 2.0**-52
+        # Ties round to even: 2.5 and 1.5 ulps both add 2 ulps per step, after
+        # a first step of 1 ulp from the odd position
+        assert repeated_add(1.0, 2.5 * ulp, 10**15) == 1.0 + 2 * 10**15 * ulp
+        assert repeated_add(1.0 + ulp, 1.5 * ulp, 10**15) == 1.0 + 2 * 10**15 * ulp
+
+    def test_evolve_by_from_power_of_two_time(self):
+        """Test small negative steps from a power-of-two time move it down"""
+        axiom = UniversalAxiom(time=2.0)
+        axiom.evolve_by(50, -1.5e-16)
+        assert axiom.cognitive.time == 1.999999999999989
+
+        axiom = UniversalAxiom(time=-1.0)
+        axiom.evolve_by(50, 1e-16)
+        assert axiom.cognitive.time == -0.9999999999999944
+
+
+class TestIncrementalRecomputation:
+    """Cached layer products, cleared by layer writes"""
+
+    @pytest.fixture
+    def compute_calls(self, monkeypatch):
+        """Count compute() calls per layer class"""
+        calls = {"foundation": 0, "dynamic": 0, "cognitive": 0}
+        for name, layer in (
+            ("foundation", FoundationLayer),
+            ("dynamic", DynamicLayer),
+            ("cognitive", CognitiveLayer),
+        ):
+
+            def counting(self, _name=name, _compute=layer.compute):
+                calls[_name] += 1
+                return _compute(self)
+
+            monkeypatch.setattr(layer, "compute", counting)
+        return calls
+
+    def test_pressure_change_recomputes_only_foundation(self, compute_calls):
+        """Test apply_pressure only recomputes the foundation product"""
+        axiom = UniversalAxiom(subjectivity=0.2, n=4)
+        axiom.compute_intelligence()
+        compute_calls.update(foundation=0, dynamic=0, cognitive=0)
+
+        for _ in range(5):
+            axiom.apply_pressure(0.1)
+
+        assert compute_calls == {"foundation": 5, "dynamic": 0, "cognitive": 0}
+
+    def test_evolve_recomputes_dynamic_and_cognitive(self, compute_calls):
+        """Test evolve leaves the foundation product cached"""
+        axiom = UniversalAxiom()
+        axiom.compute_intelligence()
+        compute_calls.update(foundation=0, dynamic=0, cognitive=0)
+
+        axiom.evolve()
+
+        assert compute_calls == {"foundation": 0, "dynamic": 1, "cognitive": 1}
+
+    def test_mutator_sequence_matches_fresh_axiom(self):
+        """Test cached results equal a from-scratch evaluation"""
+        axiom = UniversalAxiom(impulses=1.3, elements=0.9, pressure=1.1, subjectivity=0.4)
+        for _ in range(20):
+            axiom.apply_pressure(0.05)
+            axiom.adjust_subjectivity(-0.01)
+            axiom.strengthen_purpose(1.02)
+            axiom.evolve(0.5)
+
+        fresh = UniversalAxiom(
+            impulses=axiom.foundation.impulses,
+            elements=axiom.foundation.elements,
+            pressure=axiom.foundation.pressure,
+            subjectivity=axiom.cognitive.subjectivity,
+            purpose=axiom.cognitive.purpose,
+            time=axiom.cognitive.time,
+            n=axiom.n,
+        )
+        assert axiom.compute_intelligence() == fresh.compute_intelligence()
+
+    def test_direct_layer_edits_invalidate_cache(self):
+        """Test assignments through the public layer attributes are picked up"""
+        axiom = UniversalAxiom()
+        axiom.compute_intelligence()
+
+        axiom.foundation.impulses = 2.0
+        axiom.cognitive.purpose = 3.0
+        axiom.n = 2
+
+        assert axiom.compute_intelligence() == 2.0 * 3.0 * 17 * (1 + 2)
+
+    def test_held_layer_references_invalidate_cache(self):
+        """Test edits through layer references kept across evaluations are picked up"""
+        axiom = UniversalAxiom(pressure=1.0)
+        foundation = axiom.foundation
+        dynamic = axiom.dynamic
+        cognitive = axiom.cognitive
+        assert axiom.compute_intelligence() == 10.0
+
+        foundation.pressure = 5.0
+        assert axiom.compute_intelligence() == 50.0
+
+        dynamic.n = 2
+        assert axiom.compute_intelligence() == 5.0 * 17 * (1 + 2)
+
+        cognitive.subjectivity = 0.5
+        assert axiom.compute_intelligence() == 5.0 * 17 * (1 + 2) * 0.5
+
+    def test_swapped_layer_is_recomputed(self):
+        """Test assigning a new layer object replaces the cached product"""
+        axiom = UniversalAxiom()
+        axiom.compute_intelligence()
+
+        axiom.foundation = FoundationLayer(2.0, 3.0, 4.0)
+
+        assert axiom.compute_intelligence() == 24.0 * 10.0
+
+
+class TestAxiomState:
+    """Single-pass state snapshots"""
+
+    def test_snapshot_matches_layer_values(self):
+        """Test snapshot fields equal the individual layer computations"""
+        axiom = UniversalAxiom(impulses=2.0, elements=1.5, pressure=1.2, subjectivity=0.3, n=7)
+        state = axiom.snapshot()
+
+        assert isinstance(state, AxiomState)
+        assert state.n == 7
+        assert state.foundation_product == axiom.foundation.compute()
+        assert state.E_n == axiom.dynamic.exponential_growth()
+        assert state.F_n == axiom.dynamic.fibonacci()
+        assert state.dynamic_product == axiom.dynamic.compute()
+        assert state.cognitive_product == axiom.cognitive.compute()
+        assert state.intelligence == axiom.compute_intelligence()
+
+    def test_to_dict_matches_get_state_shape(self):
+        """Test the materialized dict has the get_state() layout"""
+        axiom = UniversalAxiom(subjectivity=0.3, purpose=1.5, time=2.0, n=3)
+        state = axiom.snapshot().to_dict()
+
+        assert state == axiom.get_state()
+        assert set(state) == {"n", "foundation", "dynamic", "cognitive", "intelligence"}
+        assert set(state["cognitive"]) == {
+            "X_subjectivity",
+            "X_objectivity",
+            "Y_purpose",
+            "Z_time",
+            "product",
+        }
+        assert state["dynamic"] == {"E_n": 53.0, "F_n": 3, "product": 212.0}
+
+    def test_snapshot_flattens_to_tuple(self):
+        """Test snapshots are plain tuples for bulk storage"""
+        state = UniversalAxiom(n=2).snapshot()
+        flat = tuple(state)
+
+        assert len(flat) == len(AxiomState._fields)
+        assert AxiomState(*flat) == state
+        assert flat[-1] == state.intelligence
+
+
+class TestLogSpaceMode:
+    """Log-domain evaluation without the MAX_N / MAX_SAFE_VALUE ceiling"""
+
+    def test_fast_doubling_matches_dynamic_layer(self):
+        """Test fast-doubling F_n equals the dynamic layer's F_n"""
+        for n in range(1, MAX_N + 1):
+            assert fibonacci_fast_doubling(n) == DynamicLayer(n=n).fibonacci()
+
+    def test_log_matches_linear_on_golden_cases(self):
+        """Test log intelligence and sign agree with the linear formula"""
+        golden_path = Path(__file__).with_name("golden_cases.csv")
+        with golden_path.open(newline="") as handle:
+            for row in csv.DictReader(handle):
+                axiom = UniversalAxiom(
+                    impulses=float(row["impulses"]),
+                    elements=float(row["elements"]),
+                    pressure=float(row["pressure"]),
+                    subjectivity=float(row["subjectivity"]),
+                    purpose=float(row["purpose"]),
+                    time=float(row["time"]),
+                    n=int(row["n"]),
+                )
+                expected = LogValue.from_float(axiom.compute_intelligence())
+                actual = axiom.compute_log_intelligence()
+                assert actual.sign == expected.sign, row["name"]
+                assert math.isclose(actual.log_abs, expected.log_abs, rel_tol=1e-12), row["name"]
+
+    def test_large_n_stays_rankable(self):
+        """Test agents beyond MAX_N keep distinct, ordered log values"""
+        values = [UniversalAxiom(n=n).compute_log_intelligence() for n in (50, 150, 10**6)]
+        assert values == sorted(values)
+        assert len(set(values)) == 3
+        assert math.isfinite(values[-1].log_abs)
+
+    def test_evolve_past_max_n_tracks_steps(self):
+        """Test evolution beyond MAX_N still advances the log value"""
+        axiom = UniversalAxiom(n=MAX_N)
+        before = axiom.compute_log_intelligence()
+        axiom.evolve()
+        assert axiom.n == MAX_N
+        assert axiom.dynamic.steps == MAX_N + 1
+        assert axiom.compute_log_intelligence() > before
+
+    def test_sorting_handles_sign_and_zero(self):
+        """Test negative, zero and positive values sort like floats"""
+        linear = [-1e6, -2.0, 0.0, 3.0, 1e300]
+        shuffled = [LogValue.from_float(value) for value in (3.0, -2.0, 1e300, 0.0, -1e6)]
+        assert [value.to_float() for value in sorted(shuffled)] == pytest.approx(linear)
+
+
 class TestPROMPTCompliance:
     """Test compliance with PROMPT.md specifications"""
 